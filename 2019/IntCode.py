@@ -1,156 +1,1435 @@
-class IntCode():
-    # Updated to a class after reading @datagubbe.se Solution.
-    # Opted for class after problem 7 asked to reuse intcode
-    def __init__(self, mem=None):
-        if not mem:
-            self.read_input()
-        else:
-            self.mem = mem
-
-        self.ptr = 0  # pointer value
-        self.out = 0
-        self.ops = {
-            # opcode: [ func, default param mode]
-            # param modes are matched to self.fetchers
-            1: [self.op_add, [0, 0, 1]],  # day03
-            2: [self.op_mul, [0, 0, 1]],  # day03
-            3: [self.op_input, [1]],
-            4: [self.op_output, [0]],
-            5: [self.op_jump_if_true, [0, 0]],
-            6: [self.op_jump_if_false, [0, 0]],
-            7: [self.op_lt, [0, 0, 1]],
-            8: [self.op_eq, [0, 0, 1]],
-            99: [self.op_halt, []]
+"""
+Iterative IntCode virtual machine.
+
+An instruction value such as `1002` packs the opcode (`02`) and one mode
+digit per parameter (`0`, `1`, `0`, read right to left). Instead of turning
+every instruction into a string to split it, each valid value is decoded
+once, ahead of time, into `DECODE[value] = (opcode, mode1, mode2, mode3)`:
+one dispatch entry per opcode and mode combination. The run loop is a plain
+`while` loop (no recursion, so no recursion limit) that looks the current
+instruction up, resolves its parameters inline and allocates nothing per
+instruction.
+
+Memory is an `array('q')` of signed 64-bit cells that grows (zero filled)
+whenever the program reads or writes past its end. Negative addresses are
+not checked.
+
+Input and output go through deques. An input instruction that finds its
+queue empty pauses the machine (`run()` returns `WAITING`); sending more
+input and calling `run()` again resumes it. Machines are wired together by
+sharing a deque as the outputs of one and the inputs of the next:
+`build_pipeline` does so for a chain (or a feedback loop) of machines, and
+`run_round_robin` or `run_asyncio` drive them until they all halt.
+
+A search over the choices a program offers (a robot or a maze driven by
+input) branches a machine instead of replaying it from the start:
+`fork()` returns an independent machine (one array copy of memory), and
+`snapshot()`/`restore()` save and rewind a single one. Run this module to
+measure forks per second:
+
+    python 2019/IntCode.py --bench-fork 2019/day11/day11.txt
+
+`run(profile)` instruments a run: a `Profile` counts executions per opcode
+and per address, rebuilds the basic blocks actually executed from the
+jumps taken, ranks them by instructions executed, and can write every
+executed address to a compact binary trace (see `read_trace`):
+
+    python 2019/IntCode.py 2019/day11/day11.txt --input 0 --profile
+
+`translate()` switches a machine to ahead-of-time translated code: every
+basic block becomes a Python function `b<address>(mem, vm)` whose operands
+are constants baked in by the translator, and which returns the function
+of the next block (a direct jump), so `run()` is a trampoline calling one
+function per block instead of decoding every instruction. Blocks are
+translated when first reached and the generated code is cached, compiled,
+under `__pycache__/intcode/`, keyed by a hash of the program. A program
+that writes into its own code drops back to the interpreter, see
+`Translation`:
+
+    python 2019/IntCode.py 2019/day11/day11.txt --input 0 --bench-translate
+    python 2019/IntCode.py 2019/day11/day11.txt --input 0 --check-translate
+
+Usage:
+    vm = IntCode(program, inputs=[5])
+    vm.run()
+    print(vm.out)
+
+    machines = build_pipeline(program, [9, 8, 7, 6, 5], feedback=True)
+    machines[0].send(0)
+    run_round_robin(machines)
+    print(machines[-1].out)
+"""
+import argparse
+import asyncio
+import functools
+import hashlib
+import marshal
+import os
+import sys
+import time
+from array import array
+from collections import defaultdict, deque
+from itertools import product
+from typing import (
+    Any,
+    BinaryIO,
+    Callable,
+    DefaultDict,
+    Deque,
+    Dict,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Sequence,
+    Tuple,
+)
+
+__all__ = [
+    'DECODE',
+    'HALTED',
+    'WAITING',
+    'IntCode',
+    'IntCodeError',
+    'IntCodeState',
+    'Profile',
+    'Translation',
+    'benchmark_forks',
+    'benchmark_translation',
+    'check_translation',
+    'build_pipeline',
+    'load_program',
+    'read_trace',
+    'run_asyncio',
+    'run_pipeline',
+    'run_round_robin',
+]
+
+# Parameter modes
+POSITION: int = 0
+IMMEDIATE: int = 1
+RELATIVE: int = 2
+
+# Opcodes
+ADD: int = 1
+MUL: int = 2
+INPUT: int = 3
+OUTPUT: int = 4
+JUMP_IF_TRUE: int = 5
+JUMP_IF_FALSE: int = 6
+LESS_THAN: int = 7
+EQUALS: int = 8
+ADJUST_BASE: int = 9
+HALT: int = 99
+
+# Machine states returned by IntCode.run
+HALTED: str = 'halted'
+WAITING: str = 'waiting'
+
+# Parameter count of each opcode
+ARITY: Dict[int, int] = {
+    ADD: 3, MUL: 3, INPUT: 1, OUTPUT: 1, JUMP_IF_TRUE: 2, JUMP_IF_FALSE: 2,
+    LESS_THAN: 3, EQUALS: 3, ADJUST_BASE: 1, HALT: 0,
+}
+
+OPCODE_NAMES: Dict[int, str] = {
+    ADD: 'add', MUL: 'mul', INPUT: 'in', OUTPUT: 'out', JUMP_IF_TRUE: 'jt',
+    JUMP_IF_FALSE: 'jf', LESS_THAN: 'lt', EQUALS: 'eq', ADJUST_BASE: 'arb',
+    HALT: 'halt',
+}
+
+# Parameters the instruction writes to, immediate mode is invalid there
+WRITES: Dict[int, int] = {ADD: 3, MUL: 3, INPUT: 1, LESS_THAN: 3, EQUALS: 3}
+
+
+def build_decode_table() -> Dict[int, Tuple[int, int, int, int]]:
+    """Decodes every valid instruction value.
+
+    Returns:
+        Dict[int, Tuple[int, int, int, int]]: Instruction value to
+        `(opcode, mode1, mode2, mode3)`, unused modes being 0.
+    """
+    table: Dict[int, Tuple[int, int, int, int]] = {}
+    for opcode, arity in ARITY.items():
+        for modes in product((POSITION, IMMEDIATE, RELATIVE), repeat=arity):
+            if opcode in WRITES and modes[WRITES[opcode] - 1] == IMMEDIATE:
+                continue
+            value: int = opcode + sum(
+                mode * 10 ** (k + 2) for k, mode in enumerate(modes)
+            )
+            padded: Tuple[int, ...] = modes + (POSITION,) * (3 - arity)
+            table[value] = (opcode, padded[0], padded[1], padded[2])
+    return table
+
+
+DECODE: Dict[int, Tuple[int, int, int, int]] = build_decode_table()
+
+
+class IntCodeError(Exception):
+    """Raised on an invalid instruction or a deadlocked pipeline."""
+
+
+class IntCodeState(NamedTuple):
+    """Saved state of a machine, see `IntCode.snapshot`."""
+    mem: array
+    ptr: int
+    base: int
+    inputs: Tuple[int, ...]
+    outputs: Tuple[int, ...]
+    out: int
+    halted: bool
+
+
+class Block(NamedTuple):
+    """A basic block executed during a profiled run.
+
+    Attributes:
+        start (int): Address of its first instruction.
+        end (int): Address of its last instruction.
+        size (int): Number of instructions.
+        runs (int): Times it was entered.
+        executed (int): Instructions executed inside it.
+    """
+    start: int
+    end: int
+    size: int
+    runs: int
+    executed: int
+
+
+TRACE_MAGIC: bytes = b'ICTRACE1'
+TRACE_BUFFER: int = 1 << 16
+
+# Bumped whenever the generated code changes, part of every cache key
+TRANSLATION_VERSION: int = 2
+TRANSLATION_CACHE: str = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), '__pycache__', 'intcode'
+)
+
+
+class Profile:
+    """Execution counts collected by `IntCode.run(profile)`.
+
+    Counting happens per executed instruction, so a profiled run is about
+    twice as slow as a plain one; a plain run only pays one check per
+    instruction for the hook. An instruction is counted once it completed,
+    so an input that pauses the machine is counted when it is resumed.
+
+    Attributes:
+        opcodes (DefaultDict[int, int]): Executions per opcode.
+        addresses (DefaultDict[int, int]): Executions per address.
+        targets (DefaultDict[int, int]): Entries per address reached by a
+            jump (or where a run started).
+        decoded (Dict[int, int]): Last opcode executed at each address.
+        trace (Optional[BinaryIO]): Open binary trace, if any: `TRACE_MAGIC`
+            then one little endian uint32 address per instruction.
+    """
+
+    def __init__(self, trace_path: Optional[str] = None) -> None:
+        self.opcodes: DefaultDict[int, int] = defaultdict(int)
+        self.addresses: DefaultDict[int, int] = defaultdict(int)
+        self.targets: DefaultDict[int, int] = defaultdict(int)
+        self.decoded: Dict[int, int] = {}
+        self.expected: int = -1
+        self.trace: Optional[BinaryIO] = None
+        self.buffer: array = array('I')
+        if trace_path is not None:
+            self.trace = open(trace_path, 'wb')  # noqa: SIM115
+            self.trace.write(TRACE_MAGIC)
+
+    def record(self, ip: int, op: int) -> None:
+        """Counts one executed instruction."""
+        self.opcodes[op] += 1
+        self.addresses[ip] += 1
+        self.decoded[ip] = op
+        if ip != self.expected:
+            self.targets[ip] += 1
+        self.expected = ip + ARITY[op] + 1
+        if self.trace is not None:
+            self.buffer.append(ip)
+            if len(self.buffer) >= TRACE_BUFFER:
+                self.flush()
+
+    def flush(self) -> None:
+        """Writes the buffered trace addresses."""
+        if self.trace is None or not self.buffer:
+            return
+        if sys.byteorder == 'big':
+            self.buffer.byteswap()
+        self.buffer.tofile(self.trace)
+        self.buffer = array('I')
+
+    def close(self) -> None:
+        """Flushes and closes the trace file."""
+        if self.trace is not None:
+            self.flush()
+            self.trace.close()
+            self.trace = None
+
+    def __enter__(self) -> 'Profile':
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def blocks(self) -> List[Block]:
+        """The basic blocks executed, hottest (most instructions) first.
+
+        Blocks start at jump targets and after jump instructions, and end
+        at a jump, a halt or the start of another block.
+        """
+        decoded: Dict[int, int] = self.decoded
+        jumps: Tuple[int, ...] = (JUMP_IF_TRUE, JUMP_IF_FALSE, HALT)
+        leaders: set = set(self.targets) | {
+            ip + ARITY[op] + 1 for ip, op in decoded.items() if op in jumps
+        }
+        found: List[Block] = []
+        for start in sorted(leaders):
+            if start not in decoded:
+                continue
+            ip: int = start
+            size: int = 0
+            executed: int = 0
+            while True:
+                op: int = decoded[ip]
+                size += 1
+                executed += self.addresses[ip]
+                following: int = ip + ARITY[op] + 1
+                if op in jumps or following in leaders or \
+                        following not in decoded:
+                    break
+                ip = following
+            found.append(
+                Block(start, ip, size, self.addresses[start], executed)
+            )
+        return sorted(found, key=lambda block: -block.executed)
+
+    def report(self, top: int = 10) -> str:
+        """Text summary: opcode mix, hottest addresses and blocks."""
+        total: int = sum(self.opcodes.values()) or 1
+        lines: List[str] = [f'{total:,} instructions executed', 'opcodes:']
+        for op, count in sorted(self.opcodes.items(), key=lambda x: -x[1]):
+            lines.append(
+                f'  {OPCODE_NAMES[op]:5s} {count:12,} {100 * count / total:6.2f}%'
+            )
+        lines.append('hottest addresses:')
+        for ip, count in sorted(
+            self.addresses.items(), key=lambda x: -x[1]
+        )[:top]:
+            lines.append(
+                f'  {ip:6d} {OPCODE_NAMES[self.decoded[ip]]:5s}'
+                f' {count:12,} {100 * count / total:6.2f}%'
+            )
+        lines.append('hottest basic blocks:')
+        for block in self.blocks()[:top]:
+            lines.append(
+                f'  {block.start:6d}-{block.end:<6d} {block.size:3d} instr'
+                f' {block.runs:10,} runs {block.executed:12,}'
+                f' {100 * block.executed / total:6.2f}%'
+            )
+        return '\n'.join(lines)
+
+
+def read_trace(path: str) -> array:
+    """Reads the executed addresses of a binary trace."""
+    with open(path, 'rb') as file:
+        if file.read(len(TRACE_MAGIC)) != TRACE_MAGIC:
+            raise ValueError(f'{path} is not an IntCode trace')
+        addresses: array = array('I')
+        addresses.frombytes(file.read())
+    if sys.byteorder == 'big':
+        addresses.byteswap()
+    return addresses
+
+
+def load_program(path: str) -> List[int]:
+    """Reads a comma separated IntCode program."""
+    with open(path, 'r', encoding='utf-8') as file:
+        return [int(value) for value in file.read().strip().split(',')]
+
+
+def _exit_halted(vm: 'IntCode', ip: int) -> None:
+    """Translated code reached a halt instruction."""
+    vm.ptr = ip
+    vm.halted = True
+
+
+def _exit_waiting(vm: 'IntCode', ip: int) -> None:
+    """Translated code needs an input that is not there yet."""
+    vm.ptr = ip
+
+
+def _exit_interpreted(vm: 'IntCode', ip: int) -> None:
+    """Translated code cannot go on: the interpreter takes over at `ip`."""
+    vm.ptr = ip
+    vm.translation = None
+
+
+def _grow(vm: 'IntCode', size: int) -> None:
+    """Grows memory, at least doubling it so growth stays amortised."""
+    vm.grow(max(size, 2 * len(vm.mem)))
+
+
+def _translate_stub(
+    translation: 'Translation',
+    start: int,
+    mem: array,
+    vm: 'IntCode'
+) -> Optional[Callable]:
+    """Stands for a block not translated yet, see `Translation.stubs`."""
+    return translation.function(vm, start)
+
+
+def _load(vm: 'IntCode', address: int) -> int:
+    """Reads an address only known at run time, growing memory for it."""
+    if address >= len(vm.mem):
+        _grow(vm, address + 1)
+    return vm.mem[address]
+
+
+class Translation:
+    """An IntCode program translated into Python, one function per block.
+
+    A block runs straight from its first instruction to a jump or a halt.
+    An input instruction always starts a new block, so a machine paused on
+    it resumes by calling that block again. Parameters are read from the
+    program when translating: `1001,100,-1,100` becomes
+    `mem[100] = mem[100] + -1`. A jump with an immediate target returns
+    the target block's function directly (until that block first runs, a
+    stub that translates it), a block jumping to itself loops inside its
+    function, and a computed jump goes through `JUMP`. Only code that
+    actually runs is translated.
+
+    Memory is grown when a block is entered, from the highest constant
+    address it uses and `base` plus its highest relative offset, so
+    translated code never retries an instruction the way the interpreter
+    does on IndexError.
+
+    Programs often keep data in the parameters of their own instructions.
+    A parameter cell some instruction writes to with a constant address is
+    read from memory at run time instead of being baked in, and blocks
+    translated before such a write was found are translated again. A write
+    to an instruction cell itself, or a relative write to any baked cell
+    (checked at run time against `CODE`), is self-modifying code: that
+    machine carries on in the interpreter.
+
+    Attributes:
+        image (array): The program the code is translated from.
+        digest (str): Hash of the image, naming the cache file.
+        cache_path (Optional[str]): Cache file, None to not cache.
+        sources (Dict[int, str]): Source of each translated block.
+        cells (set): Every translated instruction and parameter cell.
+        opcodes (set): Translated instruction cells.
+        writes (set): Constant addresses written by translated code.
+        code (set): Cells baked into translated code, `cells - writes`,
+            and every instruction cell: a write there is self-modifying
+            code even when its address is also a constant write target.
+        targets (set): Addresses translated code jumps to directly.
+    """
+
+    def __init__(
+        self,
+        program: Iterable[int],
+        cache_dir: Optional[str] = TRANSLATION_CACHE
+    ) -> None:
+        self.image: array = array('q', program)
+        self.digest: str = hashlib.sha256(
+            f'{TRANSLATION_VERSION}:{sys.byteorder}:'.encode()
+            + self.image.tobytes()
+        ).hexdigest()
+        self.cache_path: Optional[str] = None if cache_dir is None else \
+            os.path.join(
+                cache_dir,
+                f'{self.digest[:32]}.{sys.implementation.cache_tag}.pyc'
+            )
+        self.sources: Dict[int, str] = {}
+        self.cells: set = set()
+        self.opcodes: set = set()
+        self.writes: set = set()
+        self.code: set = set()
+        self.targets: set = set()
+        self.dirty: bool = False
+        self.namespace: Dict[str, Any] = {
+            'CODE': self.code,
+            'JUMP': self.function,
+            'HALT': _exit_halted,
+            'WAIT': _exit_waiting,
+            'BAIL': _exit_interpreted,
+            'GROW': _grow,
+            'LOAD': _load,
         }
-        self.fetchers = [
-            self.position_fetch,
-            self.immediate_fetch
-        ]
-        self.i = 5
+        self.load()
 
-    def read_input(self):
+    def load(self) -> bool:
+        """Loads the cached blocks, returns whether there were any."""
+        if self.cache_path is None or not os.path.exists(self.cache_path):
+            return False
+        try:
+            with open(self.cache_path, 'rb') as file:
+                version, digest, sources, writes, targets, compiled = \
+                    marshal.load(file)
+        except (OSError, EOFError, ValueError, TypeError):
+            return False
+        if version != TRANSLATION_VERSION or digest != self.digest:
+            return False
+        exec(compiled, self.namespace)  # pylint: disable=exec-used
+        self.sources.update(sources)
+        self.writes.update(writes)
+        for start in sources:
+            for ip, op, _, _ in self.decode(start)[0]:
+                self.opcodes.add(ip)
+                self.cells.update(range(ip, ip + ARITY[op] + 1))
+        self.code.update((self.cells - self.writes) | self.opcodes)
+        self.targets.update(targets)
+        self.stubs(targets)
+        return True
+
+    def save(self) -> None:
+        """Writes every block translated so far to the cache file."""
+        if self.cache_path is None or not self.dirty:
+            return
+        compiled = compile(
+            '\n'.join(self.sources[start] for start in sorted(self.sources)),
+            f'<intcode {self.digest[:12]}>', 'exec'
+        )
+        payload: bytes = marshal.dumps((
+            TRANSLATION_VERSION, self.digest, self.sources,
+            tuple(sorted(self.writes)), tuple(sorted(self.targets)),
+            compiled
+        ))
+        temporary: str = f'{self.cache_path}.{os.getpid()}.tmp'
+        try:
+            os.makedirs(os.path.dirname(self.cache_path), exist_ok=True)
+            with open(temporary, 'wb') as file:
+                file.write(payload)
+            os.replace(temporary, self.cache_path)
+            self.dirty = False
+        except OSError:
+            # Caching is an optimisation only
+            pass
+
+    def function(self, vm: 'IntCode', start: int) -> Optional[Callable]:
+        """The function of the block at `start`, translated if needed.
+
+        Returns:
+            Optional[Callable]: The block function, or None once `vm` was
+            handed over to the interpreter at `start`.
         """
-        Read input from a text file
-        :return: :insList: list of instructions
+        if not 0 <= start < len(self.image):
+            _exit_interpreted(vm, start)
+            return None
+        block: Optional[Callable] = self.namespace[f'b{start}'] \
+            if start in self.sources else self.translate(start, vm.mem)
+        if block is None:
+            _exit_interpreted(vm, start)
+        return block
+
+    def decode(
+        self,
+        start: int
+    ) -> Tuple[List[Tuple[int, int, Tuple[int, ...], Tuple[int, ...]]],
+               Optional[int], bool]:
+        """Decodes the block at `start` from the program image.
+
+        Returns:
+            Tuple: The instructions as `(address, opcode, modes, params)`,
+            the address execution continues at after the last one (None
+            after a jump or a halt), and whether that continuation must be
+            interpreted (invalid instruction or end of the image).
         """
-        with open('day05_input.txt') as f:
-            self.mem = list(map(int, f.read().rstrip('\n').split(",")))
+        image: array = self.image
+        instructions: List[
+            Tuple[int, int, Tuple[int, ...], Tuple[int, ...]]
+        ] = []
+        ip: int = start
+        while True:
+            if ip >= len(image) or image[ip] not in DECODE:
+                return instructions, ip, True
+            op, m1, m2, m3 = DECODE[image[ip]]
+            arity: int = ARITY[op]
+            if ip + arity >= len(image):
+                return instructions, ip, True
+            if op == INPUT and ip != start:
+                return instructions, ip, False
+            instructions.append((
+                ip, op, (m1, m2, m3)[:arity],
+                tuple(image[ip + 1:ip + arity + 1])
+            ))
+            if op in (JUMP_IF_TRUE, JUMP_IF_FALSE, HALT):
+                return instructions, None, False
+            ip += arity + 1
+
+    @staticmethod
+    def constant_writes(
+        instructions: List[Tuple[int, int, Tuple[int, ...], Tuple[int, ...]]]
+    ) -> set:
+        """Addresses a block writes to in position mode."""
+        return {
+            params[WRITES[op] - 1]
+            for _, op, modes, params in instructions
+            if op in WRITES and modes[WRITES[op] - 1] == POSITION
+        }
+
+    def translate(self, start: int, mem: array) -> Optional[Callable]:
+        """Translates the block at `start`.
+
+        Blocks translated earlier are translated again when the new one
+        writes to their parameters, or they write to its instructions.
 
-    def position_fetch(self, addr):
+        Args:
+            start (int): Address of the block to translate.
+            mem (array): Memory of the machine about to run it.
+
+        Returns:
+            Optional[Callable]: The block function, None if the program
+            already modified code there.
         """
-        fetch param value from address (position mode)
-        :param addr:
-        :return: updates memory
+        blocks: Dict[int, tuple] = {start: self.decode(start)}
+        opcodes: set = set()
+        cells: set = set()
+        writes: set = set()
+        for instructions, _, _ in blocks.values():
+            writes |= self.constant_writes(instructions)
+            for ip, op, _, _ in instructions:
+                opcodes.add(ip)
+                cells.update(range(ip, ip + ARITY[op] + 1))
+        all_writes: set = self.writes | writes
+        all_opcodes: set = self.opcodes | opcodes
+        # The block is decoded from the image: every instruction cell, and
+        # every cell baked in, must still hold what the image says there,
+        # or the program already rewrote this code
+        if any(mem[cell] != self.image[cell]
+               for cell in opcodes | (cells - all_writes)
+               if cell < len(mem)):
+            return None
+
+        for address in self.sources:
+            decoded = self.decode(address)
+            parameters: set = {
+                ip + k
+                for ip, op, _, _ in decoded[0]
+                for k in range(1, ARITY[op] + 1)
+            }
+            if parameters & writes or \
+                    self.constant_writes(decoded[0]) & opcodes:
+                blocks[address] = decoded
+
+        targets: set = set()
+        source: Dict[int, str] = {
+            address: self.block_source(
+                address, *decoded, all_writes, all_opcodes, targets,
+                len(self.image)
+            )
+            for address, decoded in blocks.items()
+        }
+        exec(  # pylint: disable=exec-used
+            compile('\n'.join(source.values()),
+                    f'<intcode {self.digest[:12]}>', 'exec'),
+            self.namespace
+        )
+        self.sources.update(source)
+        self.opcodes.update(opcodes)
+        self.cells.update(cells)
+        self.writes.update(writes)
+        self.code.difference_update(writes - self.opcodes)
+        self.code.update((cells - self.writes) | opcodes)
+        self.targets.update(targets)
+        self.stubs(targets)
+        self.dirty = True
+        return self.namespace[f'b{start}']
+
+    def stubs(self, targets: Iterable[int]) -> None:
+        """Defines a stand-in for every jump target not translated yet.
+
+        A stub translates its block when first called, which replaces it
+        in the namespace: jumps to it then reach the block directly.
         """
-        return self.mem[addr]
+        for target in targets:
+            name: str = f'b{target}'
+            if target not in self.sources and name not in self.namespace:
+                self.namespace[name] = functools.partial(
+                    _translate_stub, self, target
+                )
+
+    @staticmethod
+    def block_source(
+        start: int,
+        instructions: List[Tuple[int, int, Tuple[int, ...], Tuple[int, ...]]],
+        following: Optional[int],
+        interpreted: bool,
+        writes: set,
+        opcodes: set,
+        targets: set,
+        size: int
+    ) -> str:
+        """Python source of one block function.
+
+        Args:
+            start (int): Address of the block.
+            instructions (List): The block, as returned by `decode`.
+            following (Optional[int]): Address after the block, if it does
+                not end with a jump or a halt.
+            interpreted (bool): Whether `following` must be interpreted.
+            writes (set): Cells written with a constant address, read at
+                run time.
+            opcodes (set): Instruction cells, which must not be written.
+            targets (set): Filled with the addresses jumped to directly.
+            size (int): Length of the program image; a constant jump
+                outside of it is left to the interpreter.
 
-    def immediate_fetch(self, val):
+        Returns:
+            str: A `def b<start>(mem, vm):` function.
         """
-        passthrough of immediate param value
-        :param val:
-        :return: integer of fetched value
+        body: List[str] = []
+        constants: List[int] = []
+        offsets: List[int] = []
+
+        def parameter(cell: int, value: int) -> str:
+            return f'mem[{cell}]' if cell in writes else str(value)
+
+        def address(mode: int, cell: int, value: int) -> Tuple[str, bool]:
+            """Expression of an operand's address, and whether it is
+            covered by the memory checks on block entry."""
+            if cell in writes:
+                relative: str = 'base + ' if mode == RELATIVE else ''
+                return f'{relative}mem[{cell}]', False
+            if mode == POSITION:
+                constants.append(value)
+                return str(value), True
+            offsets.append(value)
+            return f'base + {value}', True
+
+        def read(mode: int, cell: int, value: int) -> str:
+            if mode == IMMEDIATE:
+                return parameter(cell, value)
+            where, checked = address(mode, cell, value)
+            return f'mem[{where}]' if checked else f'LOAD(vm, {where})'
+
+        def write(mode: int, cell: int, value: int, result: str,
+                  following: int) -> bool:
+            """Emits a store, returns whether the block ends there."""
+            where, checked = address(mode, cell, value)
+            if checked and mode == POSITION:
+                body.append(f'mem[{where}] = {result}')
+                if value in opcodes:
+                    body.append(f'return BAIL(vm, {following})')
+                    return True
+                return False
+            body.append(f'address = {where}')
+            if not checked:
+                body.append('if address >= len(mem):')
+                body.append('    GROW(vm, address + 1)')
+            body.append(f'mem[address] = {result}')
+            body.append('if address in CODE:')
+            body.append(f'    return BAIL(vm, {following})')
+            return False
+
+        def goto(target: int) -> str:
+            if not 0 <= target < size:
+                return f'BAIL(vm, {target})'
+            targets.add(target)
+            return f'b{target}'
+
+        # Stands for the memory check after a base change, which depends
+        # on offsets only known once the whole block is read
+        refit: str = '<refit>'
+
+        ended: bool = False
+        for ip, op, modes, params in instructions:
+            if op in (ADD, MUL, LESS_THAN, EQUALS):
+                symbol: str = {
+                    ADD: '+', MUL: '*', LESS_THAN: '<', EQUALS: '=='
+                }[op]
+                result: str = (
+                    f'{read(modes[0], ip + 1, params[0])} {symbol}'
+                    f' {read(modes[1], ip + 2, params[1])}'
+                )
+                ended = write(modes[2], ip + 3, params[2], result, ip + 4)
+            elif op == INPUT:
+                body.append('inputs = vm.inputs')
+                body.append('if not inputs:')
+                body.append(f'    return WAIT(vm, {ip})')
+                ended = write(
+                    modes[0], ip + 1, params[0], 'inputs.popleft()', ip + 2
+                )
+            elif op == OUTPUT:
+                body.append(f'value = {read(modes[0], ip + 1, params[0])}')
+                body.append('vm.out = value')
+                body.append('vm.outputs.append(value)')
+            elif op == ADJUST_BASE:
+                body.append(f'base += {read(modes[0], ip + 1, params[0])}')
+                body.append('vm.base = base')
+                body.append(refit)
+            elif op in (JUMP_IF_TRUE, JUMP_IF_FALSE):
+                if modes[1] == IMMEDIATE and ip + 2 not in writes:
+                    jump: str = goto(params[1])
+                else:
+                    jump = f'JUMP(vm, {read(modes[1], ip + 2, params[1])})'
+                if modes[0] == IMMEDIATE and ip + 1 not in writes:
+                    # Constant condition: unconditional jump or no-op
+                    taken: bool = (params[0] != 0) == (op == JUMP_IF_TRUE)
+                    body.append(f'return {jump if taken else goto(ip + 3)}')
+                else:
+                    negation: str = '' if op == JUMP_IF_TRUE else 'not '
+                    condition: str = read(modes[0], ip + 1, params[0])
+                    body.append(f'if {negation}{condition}:')
+                    body.append(f'    return {jump}')
+                    body.append(f'return {goto(ip + 3)}')
+                ended = True
+            else:
+                body.append(f'return HALT(vm, {ip})')
+                ended = True
+            if ended:
+                break
+        if not ended:
+            body.append(
+                f'return BAIL(vm, {following})' if interpreted
+                else f'return {goto(following)}'
+            )
+
+        lines: List[str] = []
+        if any(op == ADJUST_BASE or RELATIVE in modes
+               for _, op, modes, _ in instructions):
+            lines.append('base = vm.base')
+        if constants:
+            lines.append(f'if len(mem) <= {max(constants)}:')
+            lines.append(f'    GROW(vm, {max(constants) + 1})')
+        check: List[str] = []
+        if offsets:
+            check = [
+                f'if base + {max(offsets)} >= len(mem):',
+                f'    GROW(vm, base + {max(offsets) + 1})',
+            ]
+        lines.extend(check)
+        # A block jumping back to itself loops inside its function
+        loop: bool = f'return b{start}' in (line.strip() for line in body)
+        if loop:
+            lines.append('while True:')
+        for line in body:
+            if line.strip() == f'return b{start}':
+                line = line.replace(f'return b{start}', 'continue')
+            for emitted in (check if line == refit else [line]):
+                lines.append(f'    {emitted}' if loop else emitted)
+        return f'def b{start}(mem, vm):\n' + ''.join(
+            f'    {line}\n' for line in lines
+        )
+
+
+# One translation per program and process, shared by all its machines
+TRANSLATIONS: Dict[Tuple[bytes, Optional[str]], Translation] = {}
+
+
+def translation_for(
+    program: Iterable[int],
+    cache_dir: Optional[str] = TRANSLATION_CACHE
+) -> Translation:
+    """The translation of a program, shared with earlier callers."""
+    image: array = array('q', program)
+    key: Tuple[bytes, Optional[str]] = (image.tobytes(), cache_dir)
+    if key not in TRANSLATIONS:
+        TRANSLATIONS[key] = Translation(image, cache_dir)
+    return TRANSLATIONS[key]
+
+
+class IntCode:
+    """An IntCode machine.
+
+    A deque given as `inputs` or `outputs` is used as is rather than
+    copied, which is how machines are connected to each other.
+
+    Attributes:
+        mem (array): Memory cells, grown on demand.
+        ptr (int): Instruction pointer.
+        base (int): Relative base.
+        inputs (Deque[int]): Values waiting to be read by input instructions.
+        outputs (Deque[int]): Values output and not consumed yet.
+        out (int): The last value output, 0 before any output.
+        halted (bool): Whether the program reached its halt instruction.
+        translation (Optional[Translation]): Translated code `run()` uses,
+            see `translate()`.
+    """
+
+    def __init__(
+        self,
+        mem: Optional[Iterable[int]] = None,
+        inputs: Iterable[int] = (),
+        outputs: Optional[Deque[int]] = None
+    ) -> None:
+        if mem is None:
+            mem = load_program('day05_input.txt')
+        self.mem: array = array('q', mem)
+        self.ptr: int = 0
+        self.base: int = 0
+        self.inputs: Deque[int] = (
+            inputs if isinstance(inputs, deque) else deque(inputs)
+        )
+        self.outputs: Deque[int] = outputs if outputs is not None else deque()
+        self.out: int = 0
+        self.halted: bool = False
+        self.translation: Optional[Translation] = None
+
+    def send(self, *values: int) -> None:
+        """Queues input values."""
+        self.inputs.extend(values)
+
+    def fork(self) -> 'IntCode':
+        """Independent copy of the machine, paused where this one is.
+
+        Memory is copied in one go (array slice) and the clone gets its own
+        copies of the pending inputs and outputs, not the shared queues.
         """
-        return int(val)
+        clone: IntCode = IntCode.__new__(IntCode)
+        clone.mem = self.mem[:]
+        clone.ptr = self.ptr
+        clone.base = self.base
+        clone.inputs = deque(self.inputs)
+        clone.outputs = deque(self.outputs)
+        clone.out = self.out
+        clone.halted = self.halted
+        clone.translation = self.translation
+        return clone
+
+    def snapshot(self) -> IntCodeState:
+        """Saves the machine state, to go back to it with `restore`."""
+        return IntCodeState(
+            self.mem[:], self.ptr, self.base, tuple(self.inputs),
+            tuple(self.outputs), self.out, self.halted
+        )
+
+    def restore(self, state: IntCodeState) -> None:
+        """Rewinds the machine to a snapshot, which stays reusable.
 
-    def inc(self, i=1):
+        The input and output deques are refilled in place, so connections
+        to other machines survive.
         """
-        Increases Pointer
-        :param i: Value to increse pointer by
-        :return: None
+        self.mem = state.mem[:]
+        self.ptr = state.ptr
+        self.base = state.base
+        self.inputs.clear()
+        self.inputs.extend(state.inputs)
+        self.outputs.clear()
+        self.outputs.extend(state.outputs)
+        self.out = state.out
+        self.halted = state.halted
+
+    def grow(self, size: int) -> None:
+        """Zero fills memory up to at least `size` cells."""
+        if size > len(self.mem):
+            self.mem.frombytes(bytes(8 * (size - len(self.mem))))
+
+    def translate(
+        self,
+        cache_dir: Optional[str] = TRANSLATION_CACHE
+    ) -> 'IntCode':
+        """Makes `run()` use translated code, from now on.
+
+        The translation is made from the current memory, so call this
+        before running. Machines running the same program share it.
+
+        Args:
+            cache_dir (Optional[str]): Where the compiled blocks are cached,
+                None to translate from scratch every process.
+
+        Returns:
+            IntCode: The machine itself.
         """
-        self.ptr += i
-        return None
+        self.translation = translation_for(self.mem, cache_dir)
+        return self
 
-    def op_add(self, params):
-        val1, val2, res_addr = params
-        self.mem[res_addr] = val1 + val2
-        self.inc()
-        return True
+    def run(self, profile: Optional[Profile] = None) -> str:
+        """Runs the program until it halts or needs an input it lacks.
 
-    def op_mul(self, params):
-        val1, val2, res_addr = params
-        self.mem[res_addr] = val1 * val2
-        self.inc()
-        return True
+        A translated machine runs its translated code, unless profiled or
+        until the program turns out to modify its own code.
 
-    def op_input(self, params):
-        dest_addr = params.pop()
-        i = self.i  # input("IntCode input> ")
-        self.mem[dest_addr] = i
-        self.inc()
-        return True
+        Args:
+            profile (Optional[Profile]): Counts every executed instruction.
 
-    def op_output(self, params):
-        out = params.pop()
-        # print("   " + str(out))
-        self.out = out
-        self.inc()
-        return True
+        Returns:
+            str: `HALTED`, or `WAITING` for input (call `run()` again once
+            some was sent).
 
-    def op_jump_if_true(self, params):
-        comp, addr = params
-        if comp:
-            self.ptr = addr
-        else:
-            self.inc()
-        return True
+        Raises:
+            IntCodeError: On an invalid instruction.
+        """
+        record: Optional[Callable[[int, int], None]] = (
+            profile.record if profile is not None else None
+        )
+        if self.translation is not None and record is None:
+            state: Optional[str] = self._execute_translated()
+            if state is not None:
+                return state
+        while True:
+            try:
+                return self._execute(record)
+            except IndexError:
+                # Every instruction writes last, so a failed access left the
+                # state as it was and the instruction is simply run again
+                self.grow(2 * len(self.mem))
 
-    def op_jump_if_false(self, params):
-        comp, addr = params
-        if not comp:
-            self.ptr = addr
-        else:
-            self.inc()
-        return True
+    def compute(self) -> int:
+        """Runs the program until it halts and returns the last output.
 
-    def op_lt(self, params):
-        v1, v2, addr = params
-        self.mem[addr] = int(v1 < v2)
-        self.inc()
-        return True
+        Raises:
+            IntCodeError: If the program waits for input it was not given.
+        """
+        if self.run() == WAITING:
+            raise IntCodeError(f'input needed at address {self.ptr}')
+        return self.out
 
-    def op_eq(self, params):
-        v1, v2, addr = params
-        self.mem[addr] = int(v1 == v2)
-        self.inc()
-        return True
+    def _execute_translated(self) -> Optional[str]:
+        """Calls block functions until one exits; None if the interpreter
+        has to take over at `self.ptr`."""
+        translation: Translation = self.translation
+        mem: array = self.mem
+        block: Optional[Callable] = translation.function(self, self.ptr)
+        try:
+            while block is not None:
+                block = block(mem, self)
+        finally:
+            translation.save()
+        if self.halted:
+            return HALTED
+        if self.translation is None:
+            return None
+        return WAITING
+
+    def _execute(
+        self,
+        record: Optional[Callable[[int, int], None]] = None
+    ) -> str:
+        """The run loop, until the program halts, waits for input or an
+        access falls outside memory (IndexError)."""
+        mem: array = self.mem
+        decode: Dict[int, Tuple[int, int, int, int]] = DECODE
+        inputs: Deque[int] = self.inputs
+        outputs: Deque[int] = self.outputs
+        ip: int = self.ptr
+        base: int = self.base
+        out: int = self.out
+        # Last instruction started, recorded once the next one starts
+        last: int = -1
+        last_op: int = 0
+        try:
+            while True:
+                try:
+                    op, m1, m2, m3 = decode[mem[ip]]
+                except KeyError:
+                    raise IntCodeError(
+                        f'invalid instruction {mem[ip]} at address {ip}'
+                    ) from None
+                if record:
+                    if last >= 0:
+                        record(last, last_op)
+                    last, last_op = ip, op
+
+                # Addresses of the parameters; an immediate parameter is
+                # read from the instruction itself
+                a1: int = ip + 1 if m1 == IMMEDIATE else \
+                    mem[ip + 1] + (base if m1 == RELATIVE else 0)
+
+                if op == ADD or op == MUL or op == LESS_THAN or op == EQUALS:
+                    a2: int = ip + 2 if m2 == IMMEDIATE else \
+                        mem[ip + 2] + (base if m2 == RELATIVE else 0)
+                    a3: int = mem[ip + 3] + (base if m3 == RELATIVE else 0)
+                    if op == ADD:
+                        mem[a3] = mem[a1] + mem[a2]
+                    elif op == MUL:
+                        mem[a3] = mem[a1] * mem[a2]
+                    elif op == LESS_THAN:
+                        mem[a3] = mem[a1] < mem[a2]
+                    else:
+                        mem[a3] = mem[a1] == mem[a2]
+                    ip += 4
+                elif op == JUMP_IF_TRUE or op == JUMP_IF_FALSE:
+                    a2 = ip + 2 if m2 == IMMEDIATE else \
+                        mem[ip + 2] + (base if m2 == RELATIVE else 0)
+                    if (mem[a1] != 0) == (op == JUMP_IF_TRUE):
+                        ip = mem[a2]
+                    else:
+                        ip += 3
+                elif op == ADJUST_BASE:
+                    base += mem[a1]
+                    ip += 2
+                elif op == INPUT:
+                    if not inputs:
+                        return WAITING
+                    mem[a1] = inputs[0]
+                    inputs.popleft()
+                    ip += 2
+                elif op == OUTPUT:
+                    out = mem[a1]
+                    outputs.append(out)
+                    ip += 2
+                else:
+                    if record:
+                        record(ip, op)
+                    self.halted = True
+                    return HALTED
+        finally:
+            self.ptr = ip
+            self.base = base
+            self.out = out
+
+
+def build_pipeline(
+    program: Sequence[int],
+    settings: Sequence[int],
+    feedback: bool = False,
+    translate: bool = False
+) -> List[IntCode]:
+    """Builds one machine per setting, each feeding the next.
+
+    Machine `k` starts with `settings[k]` as its first input and outputs
+    into the inputs of machine `k + 1`. With `feedback` the last machine
+    outputs into the first one, closing the loop.
+
+    Args:
+        program (Sequence[int]): Program run by every machine.
+        settings (Sequence[int]): First input of each machine.
+        feedback (bool): Connect the last machine back to the first.
+        translate (bool): Run translated code, see `IntCode.translate`.
+
+    Returns:
+        List[IntCode]: The machines, in order.
+    """
+    queues: List[Deque[int]] = [deque([setting]) for setting in settings]
+    queues.append(queues[0] if feedback else deque())
+    machines: List[IntCode] = [
+        IntCode(program, queues[k], queues[k + 1])
+        for k in range(len(settings))
+    ]
+    if translate:
+        for machine in machines:
+            machine.translate()
+    return machines
+
+
+def run_round_robin(machines: Sequence[IntCode]) -> None:
+    """Runs connected machines in turn until they all halt.
+
+    Raises:
+        IntCodeError: If every running machine waits for input no one will
+            send.
+    """
+    running: List[IntCode] = [m for m in machines if not m.halted]
+    while running:
+        for machine in running:
+            machine.run()
+        running = [m for m in running if not m.halted]
+        # Only running machines output, so if none of them has input left
+        # none ever will
+        if running and not any(machine.inputs for machine in running):
+            raise IntCodeError('deadlock: every machine is waiting for input')
+
+
+async def run_asyncio(machines: Sequence[IntCode]) -> None:
+    """Runs connected machines as asyncio tasks until they all halt.
+
+    A machine waiting for input sleeps on an event that is set whenever
+    the machine feeding its input queue outputs something.
+
+    Raises:
+        IntCodeError: If every running machine waits for input no one will
+            send.
+    """
+    fed: Dict[int, asyncio.Event] = {
+        id(machine.inputs): asyncio.Event() for machine in machines
+    }
+    running: List[int] = [sum(1 for m in machines if not m.halted)]
+    # id(machine) -> every machine asleep on its input event
+    asleep: Dict[int, IntCode] = {}
+
+    async def drive(machine: IntCode) -> None:
+        ready: asyncio.Event = fed[id(machine.inputs)]
+        produced: Optional[asyncio.Event] = fed.get(id(machine.outputs))
+        while True:
+            ready.clear()
+            count: int = len(machine.outputs)
+            state: str = machine.run()
+            if produced is not None and len(machine.outputs) != count:
+                produced.set()
+            if state == HALTED:
+                running[0] -= 1
+                return
+            if (
+                len(asleep) + 1 == running[0]
+                and not machine.inputs
+                and not any(other.inputs for other in asleep.values())
+            ):
+                # Every other machine sleeps too and none has input left
+                raise IntCodeError(
+                    'deadlock: every machine is waiting for input'
+                )
+            asleep[id(machine)] = machine
+            await ready.wait()
+            del asleep[id(machine)]
+
+    await asyncio.gather(
+        *(drive(machine) for machine in machines if not machine.halted)
+    )
+
+
+def run_pipeline(
+    program: Sequence[int],
+    settings: Sequence[int],
+    signal: int = 0,
+    feedback: bool = False,
+    use_asyncio: bool = False,
+    translate: bool = False
+) -> int:
+    """Sends `signal` through a pipeline of machines.
+
+    Args:
+        program (Sequence[int]): Program run by every machine.
+        settings (Sequence[int]): First input of each machine.
+        signal (int): Second input of the first machine.
+        feedback (bool): Loop the last machine back into the first.
+        use_asyncio (bool): Drive the machines as asyncio tasks instead of
+            the round-robin scheduler.
+        translate (bool): Run translated code, see `IntCode.translate`.
+
+    Returns:
+        int: The last value output by the last machine.
+    """
+    machines: List[IntCode] = build_pipeline(
+        program, settings, feedback, translate
+    )
+    machines[0].send(signal)
+    if use_asyncio:
+        asyncio.run(run_asyncio(machines))
+    else:
+        run_round_robin(machines)
+    return machines[-1].out
+
+
+def benchmark_forks(
+    program: Sequence[int],
+    seconds: float = 1.0
+) -> Dict[str, float]:
+    """Measures how fast a machine paused at its first input is branched.
+
+    Args:
+        program (Sequence[int]): Program to run up to its first input.
+        seconds (float): Time spent on each measure.
+
+    Returns:
+        Dict[str, float]: Rates per second of `fork`, of `restore` from a
+        snapshot, and of restarting the program and running it back to
+        the same point, plus the memory size in cells.
+    """
+    machine: IntCode = IntCode(program)
+    machine.run()
+
+    def rate(step) -> float:
+        count: int = 0
+        start: float = time.perf_counter()
+        deadline: float = start + seconds
+        while time.perf_counter() < deadline:
+            for _ in range(100):
+                step()
+            count += 100
+        return count / (time.perf_counter() - start)
+
+    state: IntCodeState = machine.snapshot()
+    return {
+        'cells': float(len(machine.mem)),
+        'forks': rate(machine.fork),
+        'restores': rate(lambda: machine.restore(state)),
+        'restarts': rate(lambda: IntCode(program).run()),
+    }
+
+
+# Programs run both interpreted and translated by `check_translation`:
+# the puzzle examples plus the self-modifying cases translation must
+# hand over to the interpreter
+TRANSLATION_CHECKS: Tuple[Tuple[Tuple[int, ...], Tuple[int, ...]], ...] = (
+    # Writes into an instruction already run (day 2)
+    ((1, 9, 10, 3, 2, 3, 11, 0, 99, 30, 40, 50), ()),
+    ((1, 1, 1, 4, 99, 5, 6, 0, 99), ()),
+    # Writes over an instruction not translated yet
+    ((1101, 0, 104, 8, 1105, 1, 8, 99, 1101, 42, 99, 12, 0), ()),
+    # Input written into a jump parameter
+    ((3, 3, 1105, -1, 9, 1101, 0, 0, 12, 4, 12, 99, 1), (5,)),
+    # Day 5 comparisons and jumps
+    ((3, 9, 8, 9, 10, 9, 4, 9, 99, -1, 8), (8,)),
+    ((3, 12, 6, 12, 15, 1, 13, 14, 13, 4, 13, 99, -1, 0, 1, 9), (0,)),
+    # Day 9 relative mode, large numbers and a quine
+    ((109, 1, 204, -1, 1001, 100, 1, 100, 1008, 100, 16, 101, 1006, 101, 0,
+      99), ()),
+    ((1102, 34915192, 34915192, 7, 4, 7, 99, 0), ()),
+    ((104, 1125899906842624, 99), ()),
+    # Relative operand whose parameter cell is written first
+    ((1101, 0, 5, 5, 204, 0, 99), ()),
+    # Jump to a negative address
+    ((1105, 1, -1, 99), ()),
+    # Run time writes into instruction cells that are also constant
+    # write targets
+    ((3, 2, 7, 1, 1, 1), (3,)),
+    ((209, 4, 3, 4, 1201, 5, 2, 3), (3,)),
+)
+
+
+def check_translation(
+    program: Sequence[int],
+    inputs: Sequence[int] = ()
+) -> None:
+    """Runs a program interpreted and translated, and compares them.
+
+    Memory growth is checked first: `grow` must give exactly the cells
+    asked for.
+
+    Raises:
+        IntCodeError: If memory grows wrong, or the state, the outputs or
+            the memory differ.
+    """
+    grown: IntCode = IntCode(program)
+    grown.grow(len(program) + 10)
+    if len(grown.mem) != len(program) + 10 or any(grown.mem[len(program):]):
+        raise IntCodeError(
+            f'grow gave {len(grown.mem)} cells instead of'
+            f' {len(program) + 10}'
+        )
+    interpreted: IntCode = IntCode(program, inputs)
+    translated: IntCode = IntCode(program, inputs).translate(None)
+    expected: Tuple[str, List[int], List[int]] = (
+        interpreted.run(), list(interpreted.outputs),
+        interpreted.mem[:len(program)].tolist()
+    )
+    actual: Tuple[str, List[int], List[int]] = (
+        translated.run(), list(translated.outputs),
+        translated.mem[:len(program)].tolist()
+    )
+    if actual != expected:
+        raise IntCodeError(
+            f'translated run differs: {actual} instead of {expected}'
+        )
+
+
+def benchmark_translation(
+    program: Sequence[int],
+    inputs: Sequence[int] = (),
+    cache_dir: Optional[str] = TRANSLATION_CACHE
+) -> Dict[str, float]:
+    """Times one run of a program interpreted, then translated.
 
+    Args:
+        program (Sequence[int]): Program to run until it halts or waits.
+        inputs (Sequence[int]): Its inputs.
+        cache_dir (Optional[str]): Translation cache directory.
 
-    def op_halt(self, empty_params):
-        return False
+    Returns:
+        Dict[str, float]: Seconds taken by the `interpreted` run, by the
+        first `translated` run (translating, or loading the cache) and by
+        a `warm` translated run, plus the number of `blocks` translated.
 
-    def compute(self):
-        instr = str(self.mem[self.ptr])
-        instr_param_modes = []
+    Raises:
+        IntCodeError: If the two runs output different values.
+    """
+    timings: Dict[str, float] = {}
+    outputs: List[Tuple[int, ...]] = []
+    for name in ('interpreted', 'translated', 'warm'):
+        machine: IntCode = IntCode(program, inputs)
+        start: float = time.perf_counter()
+        if name != 'interpreted':
+            machine.translate(cache_dir)
+        machine.run()
+        timings[name] = time.perf_counter() - start
+        outputs.append(tuple(machine.outputs))
+    if len(set(outputs)) != 1:
+        raise IntCodeError('translated and interpreted outputs differ')
+    translation: Translation = translation_for(program, cache_dir)
+    timings['blocks'] = float(len(translation.sources))
+    return timings
 
-        if len(instr) > 2:
-            op = int(instr[-2:])
-            instr_param_modes = [int(c) for c in instr[:-2]]
-            instr_param_modes.reverse()
-        else:
-            op = int(instr)
 
-        # Fetch operation and param modes
-        op_fun, def_param_modes = self.ops[op]
-        param_modes = def_param_modes[:]  # copy list
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='IntCode VM tools'
+    )
+    parser.add_argument('program', help='IntCode program file')
+    parser.add_argument(
+        '--input', dest='inputs', type=int, nargs='*', default=[],
+        help='Input values of a plain run'
+    )
+    parser.add_argument(
+        '--bench-fork', action='store_true',
+        help='Measure forks per second at the first input'
+    )
+    parser.add_argument(
+        '--seconds', type=float, default=1.0, help='Time per measure'
+    )
+    parser.add_argument(
+        '--profile', action='store_true',
+        help='Count opcodes, addresses and basic blocks of a plain run'
+    )
+    parser.add_argument(
+        '--trace', help='With --profile, write a binary address trace'
+    )
+    parser.add_argument(
+        '--top', type=int, default=10, help='Rows per profile table'
+    )
+    parser.add_argument(
+        '--translate', action='store_true',
+        help='Run translated code instead of the interpreter'
+    )
+    parser.add_argument(
+        '--bench-translate', action='store_true',
+        help='Time a run interpreted and translated'
+    )
+    parser.add_argument(
+        '--check-translate', action='store_true',
+        help='Also compare translated and interpreted runs of the examples'
+    )
+    parser.add_argument(
+        '--no-cache', action='store_true',
+        help='Do not read or write the translation cache'
+    )
+    args: argparse.Namespace = parser.parse_args(argv)
+    program: List[int] = load_program(args.program)
 
-        for i in range(0, len(instr_param_modes)):
-            # replace instruction parameter modes over default ones
-            param_modes[i] = instr_param_modes[i]
+    if args.bench_fork:
+        rates: Dict[str, float] = benchmark_forks(program, args.seconds)
+        print(f"{os.path.basename(args.program)}: {rates['cells']:.0f} cells")
+        for name in ('forks', 'restores', 'restarts'):
+            print(f'{name:9s} {rates[name]:12,.0f}/s')
+        return 0
 
-        params = []
-        for i in range(0, len(def_param_modes)):
-            raw = self.mem[self.ptr + 1]  # add 1 to account for current op
-            pm = param_modes[i]
-            # fetch param with desired method and populate param list
-            params.append(self.fetchers[pm](raw))  # TODO ??
-            self.inc()   # increases the pointer for each param
+    cache_dir: Optional[str] = None if args.no_cache else TRANSLATION_CACHE
+    if args.check_translate:
+        for example, example_inputs in TRANSLATION_CHECKS:
+            check_translation(example, example_inputs)
+        check_translation(program, args.inputs)
+        print(f'{len(TRANSLATION_CHECKS) + 1} programs translate correctly')
+        return 0
 
-        res = op_fun(params)  # op_fun will set pointer as desired
+    if args.bench_translate:
+        timings: Dict[str, float] = benchmark_translation(
+            program, args.inputs, cache_dir
+        )
+        print(f"{os.path.basename(args.program)}:"
+              f" {timings['blocks']:.0f} blocks translated")
+        for name in ('interpreted', 'translated', 'warm'):
+            print(f'{name:12s} {timings[name]:9.4f}s'
+                  f" {timings['interpreted'] / timings[name]:6.2f}x")
+        return 0
 
-        if res:
-            self.compute()
-        else:
-            print("___Intcode Halted ___")
+    machine: IntCode = IntCode(program, inputs=args.inputs)
+    if args.translate:
+        machine.translate(cache_dir)
+    if args.profile:
+        with Profile(args.trace) as profile:
+            state: str = machine.run(profile)
+        print(profile.report(args.top))
+    else:
+        state = machine.run()
+    print(','.join(map(str, machine.outputs)))
+    if state == WAITING:
+        print(f'waiting for input at address {machine.ptr}')
+        return 1
+    return 0
 
 
+if __name__ == "__main__":
+    sys.exit(main())
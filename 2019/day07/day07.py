@@ -1,46 +1,46 @@
-from day05.day05 import IntCode as IntCode
+import sys
+from functools import partial
 from itertools import permutations
-with open('day07_input.txt') as f:
-    memory = list(map(int, f.read().rstrip('\n').split(",")))
-
-class AmpIntCode(IntCode):
-    def __init__(self, mem, inputs):
-        IntCode.__init__(mem)
-        self.inputs = inputs
-
-    def ampTest(self):
-        if self.inputs:
-            val = self.inputs.pop(0)
-            super().compute()
-
-
-
-
-def amplifier_test(memory,inputs):
-    ic = IntCode(memory)
-    print(inputs)
-    val = inputs.pop()
-    print(val)
+from multiprocessing import Pool
+from pathlib import Path
+
+# IntCode.py lives in the parent 2019 directory
+sys.path.append(str(Path(__file__).resolve().parent.parent))
+
+from IntCode import load_program, run_pipeline  # noqa: E402
+
+
+def amplifier_signal(memory, phases, feedback=False):
+    """
+    Thruster signal of one ordering of the amplifier phase settings
+    :param memory: amplifier controller software
+    :param phases: phase setting of each amplifier, in order
+    :param feedback: loop the last amplifier back into the first (part 2)
+    :return: last signal sent to the thrusters
+    """
+    return run_pipeline(memory, phases, signal=0, feedback=feedback)
+
+
+def max_thruster_signal(memory, settings, feedback=False, pool=None):
+    """
+    Highest thruster signal over every ordering of the phase settings
+    :param memory: amplifier controller software
+    :param settings: the phase settings to order
+    :param feedback: run the amplifiers in a feedback loop
+    :param pool: process pool evaluating the orderings in parallel
+    :return: (signal, phases) of the best ordering
+    """
+    orderings = list(permutations(settings))
+    evaluate = partial(amplifier_signal, memory, feedback=feedback)
+    if pool is None:
+        signals = list(map(evaluate, orderings))
+    else:
+        signals = pool.map(evaluate, orderings, chunksize=8)
+    return max(zip(signals, orderings))
 
-    if val:
-        ic.i = val
-        ic.compute()
-        amplifier_test(ic.mem, inputs)
 
-    else:
-        return ic.out
-
-results = []
-inputs = []
-for lst in permutations(range(5), 5):
-    lst = list(lst)
-    lst.append(False)
-    inputs.append(lst)
-    lst.reverse()
-    results.append(amplifier_test(memory, lst))
-
-print(results)
-maximum_output = max(results)
-pos = results.index(maximum_output)
-print(inputs[pos])
-print(maximum_output)
\ No newline at end of file
+if __name__ == "__main__":
+    memory = load_program('day07_input.txt')
+    with Pool() as pool:
+        print(max_thruster_signal(memory, range(5), pool=pool))
+        print(max_thruster_signal(memory, range(5, 10), True, pool=pool))
@@ -3,7 +3,8 @@
 A problem with breadth-first-search
 '''
 from copy import deepcopy
-from collections import deque
+from pathlib import Path
+import sys
 
 from typing import List, Dict, Set, Tuple, Optional
 
@@ -11,6 +12,10 @@ from typing import List, Dict, Set, Tuple, Optional
 import pprint
 pp = pprint.PrettyPrinter(indent=4)
 
+# Add the parent directory of 'utils' to sys.path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+from utils import search
+
 Vertex = Tuple[int,int,str]
 Graph = Dict[Tuple[int, int, str], List[Tuple[int, int, str]]]
 
@@ -70,23 +75,24 @@ def build_graph(grid: List[List[str]]) -> Graph:
 def bfs_shortest_distance(graph: Graph,
 						  start: Vertex,
 						  target: Vertex) -> Optional[int]:
+	return bfs_multi_source_distance(graph, [start], target)
 
-	visited: Set[Vertex] = set()
-	queue = deque([(start, 0)])  # Item in queue is a tuple (node, distance from start)
-
-	while queue:
-		vertex, distance = queue.popleft()  # Dequeue front node and distance from start
 
-		if vertex == target:
-			return distance  # Found target, return distance
+def bfs_multi_source_distance(graph: Graph,
+							  starts: List[Vertex],
+							  target: Vertex) -> Optional[int]:
+	# Number the vertices so the shared search can use flat arrays
+	vertices = list(graph)
+	index = {vertex: i for i, vertex in enumerate(vertices)}
+	goal = index[target]
 
-		if vertex not in visited:
-			visited.add(vertex)
-			for neighbor in graph[vertex]:
-				if neighbor not in visited:
-					queue.append((neighbor, distance + 1))
-
-	return None  # No distance == the target vertex is not reachable from start
+	result = search.bfs(
+		len(vertices),
+		[index[start] for start in starts],
+		lambda i: [index[neighbor] for neighbor in graph[vertices[i]]],
+		goal=lambda i: i == goal
+	)
+	return result.distance()  # None == the target vertex is not reachable
 
 
 def bfs_test():
@@ -125,12 +131,8 @@ def part_two(data):
 
 	end  = find_pos(data,'E')
 
-	distances = []
-	for start in start_vertices:
-		distance = bfs_shortest_distance(graph, start, end)
-		distances.append(distance)
-
-	return min(filter(lambda x: x is not None, distances))
+	# One search from all the lowest squares at once
+	return bfs_multi_source_distance(graph, start_vertices, end)
 
 
 def main():
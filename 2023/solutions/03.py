@@ -10,6 +10,13 @@ import sys
 from typing import Any, Dict, List, Tuple
 from collections import defaultdict
 
+from pathlib import Path
+
+# Add the parent directory of 'utils' to sys.path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+import utils  # noqa: E402
+
 input_directory: str = os.path.join(
     os.path.dirname(
         os.path.abspath(
@@ -19,56 +26,6 @@ input_directory: str = os.path.join(
 )
 
 
-def read_input(file_name: str) -> Dict[str, Any]:
-    """Reads input from a specified file and separates metadata for test files.
-
-    Args:
-        file_name (str): Name of the input file (.in or .test)
-
-    Returns:
-        Dict[str, Any]: Dictionary containing:
-            - 'data': Raw string of input data
-            - 'answer_a': Expected answer for part 1 (None for .in files)
-            - 'answer_b': Expected answer for part 2 (None for .in files)
-    """
-    file_path: str = os.path.join(input_directory, file_name)
-    result: Dict[str, Any] = {
-        'data': None,
-        'answer_a': None,
-        'answer_b': None
-    }
-
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content: str = file.read()
-
-        # Handle .test files with metadata
-        if file_name.endswith('.test'):
-            # Find the data section between Example data marker and answer
-            # section
-            data_start: int = content.find('Example data')
-            if data_start != -1:
-                data_start = content.find('\n', data_start) + 1
-                data_end: int = content.find('\n-----------------', data_start)
-                if data_end != -1:
-                    result['data'] = content[data_start:data_end].strip()
-
-            # Extract answers if present
-            answer_section: str = content[data_end:] if data_end != -1 else ''
-            for line in answer_section.splitlines():
-                if line.startswith('answer_a:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_a'] = ans if ans != '-' else None
-                elif line.startswith('answer_b:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_b'] = ans if ans != '-' else None
-
-        # Handle regular .in files
-        else:
-            result['data'] = content.strip()
-
-    return result
-
-
 def process(raw_data: str) -> Any:
     """Processes the input data.
     """
@@ -163,9 +120,10 @@ def solve(data: Any) -> Any:
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, _ = utils.parse_args(day)
     # infile: str = '03.test'
-    unprocessed_data = read_input(infile)
+    file_path: str = os.path.join(input_directory, infile)
+    unprocessed_data = utils.read_input(file_path)
     input_data = process(unprocessed_data['data'])
 
     result_part_one, result_part_two = solve(input_data)
@@ -7,7 +7,15 @@ The input files are expected to be located in the '2024/in' directory.
 
 import os
 import sys
-from typing import Any, Dict, List
+from collections import deque
+from typing import Any, Deque, Dict, Iterable, List, Set, Tuple
+
+from pathlib import Path
+
+# Add the parent directory of 'utils' to sys.path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+import utils  # noqa: E402
 
 
 input_directory: str = os.path.join(
@@ -19,77 +27,33 @@ input_directory: str = os.path.join(
 )
 
 
-def read_input(file_name: str) -> Dict[str, Any]:
-    """Reads input from a specified file and separates metadata for test files.
-
-    Args:
-        file_name (str): Name of the input file (.in or .test)
-
-    Returns:
-        Dict[str, Any]: Dictionary containing:
-            - 'data': Raw string of input data
-            - 'answer_a': Expected answer for part 1 (None for .in files)
-            - 'answer_b': Expected answer for part 2 (None for .in files)
-    """
-    file_path: str = os.path.join(input_directory, file_name)
-    result: Dict[str, Any] = {
-        'data': None,
-        'answer_a': None,
-        'answer_b': None
-    }
-
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content: str = file.read()
-
-        # Handle .test files with metadata
-        if file_name.endswith('.test'):
-            # Find the data section between Example data marker and answer
-            # section
-            data_start: int = content.find('Example data')
-            if data_start != -1:
-                data_start = content.find('\n', data_start) + 1
-                data_end: int = content.find('\n-----------------', data_start)
-                if data_end != -1:
-                    result['data'] = content[data_start:data_end].strip()
-
-            # Extract answers if present
-            answer_section: str = content[data_end:] if data_end != -1 else ''
-            for line in answer_section.splitlines():
-                if line.startswith('answer_a:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_a'] = ans if ans != '-' else None
-                elif line.startswith('answer_b:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_b'] = ans if ans != '-' else None
-
-        # Handle regular .in files
-        else:
-            result['data'] = content.strip()
-
-    return result
-
-
 def process(raw_data: str) -> Any:
     """Processes the input data.
     """
     cards: Dict[int, List[List[int]]] = {}
 
     for line in raw_data.splitlines():
-        split_vals = line.split(":")
-        card_num = int(split_vals[0].strip('Card').strip())
-
-        number_parts: List[str] = split_vals[1].split("|")
-        winning_nums: List[int] = [
-            int(n.strip()) for n in number_parts[0].split()
-        ]
-        player_nums: List[int] = [
-            int(n.strip()) for n in number_parts[1].split()
-        ]
-
-        cards[card_num] = [winning_nums, player_nums]
+        card_num, card = parse_line(line)
+        cards[card_num] = card
     return cards
 
 
+def parse_line(line: str) -> Tuple[int, List[List[int]]]:
+    """Parses one card into its number, winning and played numbers.
+    """
+    split_vals = line.split(":")
+    card_num = int(split_vals[0].strip('Card').strip())
+
+    number_parts: List[str] = split_vals[1].split("|")
+    winning_nums: List[int] = [
+        int(n.strip()) for n in number_parts[0].split()
+    ]
+    player_nums: List[int] = [
+        int(n.strip()) for n in number_parts[1].split()
+    ]
+    return card_num, [winning_nums, player_nums]
+
+
 def solve_part_one(data: Any) -> Any:
     """Solves part one of the challenge.
 
@@ -148,16 +112,56 @@ def solve_part_two(data: Any) -> Any:
     return sum(card_counts.values())
 
 
+def solve_stream(
+    records: Iterable[Tuple[int, List[List[int]]]]
+) -> Tuple[int, int]:
+    """Solves both parts in one pass, one card at a time.
+
+    A card only wins copies of the next `matches` cards, so the copies still
+    owed to upcoming cards fit in a window no longer than a card's count of
+    numbers.
+
+    Args:
+        records (Iterable[Tuple[int, List[List[int]]]]): Parsed cards, in
+            order.
+
+    Returns:
+        Tuple[int, int]: The answers of both parts.
+    """
+    points: int = 0
+    total_cards: int = 0
+    # pending[k]: copies won so far of the k-th card after the current one
+    pending: Deque[int] = deque()
+
+    for _, (winning_numbers, played_numbers) in records:
+        winning: Set[int] = set(winning_numbers)
+        matches: int = sum(1 for num in played_numbers if num in winning)
+        if matches > 0:
+            points += 2 ** (matches - 1)
+
+        copies: int = 1 + (pending.popleft() if pending else 0)
+        total_cards += copies
+        for k in range(matches):
+            if k < len(pending):
+                pending[k] += copies
+            else:
+                pending.append(copies)
+
+    return points, total_cards
+
+
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, parallel = utils.parse_args(day)
 
-    unprocessed_data = read_input(infile)
+    file_path: str = os.path.join(input_directory, infile)
+    unprocessed_data = utils.read_input(file_path)
     input_data = process(unprocessed_data['data'])
 
-    result_part_one = solve_part_one(input_data)
+    result_part_one, result_part_two = utils.run_parts(
+        input_data, [solve_part_one, solve_part_two], parallel
+    )
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
-    result_part_two = solve_part_two(input_data)
     if result_part_two is not None:
         print(f"Part Two: {result_part_two}")
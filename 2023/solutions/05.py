@@ -5,7 +5,6 @@ This file provides a structure for solving Advent of Code challenges.
 The input files are expected to be located in the 'YYYY/in' directory.
 """
 
-import utils
 from collections import deque
 import os
 from pprint import pprint
@@ -17,6 +16,7 @@ from pathlib import Path
 
 # Add the parent directory of 'utils' to sys.path
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+import utils  # noqa: E402
 
 Value = NewType('Value', int)
 MapEntry: TypeAlias = Tuple[int, int, int]
@@ -33,6 +33,7 @@ input_directory: str = os.path.join(
 )
 
 
+@utils.cached
 def process(raw_data: str) -> Any:
     """Processes the input data.
     """
@@ -202,15 +203,16 @@ def solve_part_two(data: Any) -> Any:
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, parallel = utils.parse_args(day)
 
     file_path: str = os.path.join(input_directory, infile)
     unprocessed_data = utils.read_input(file_path)
     input_data = process(unprocessed_data['data'])
 
-    result_part_one = solve_part_one(input_data)
+    result_part_one, result_part_two = utils.run_parts(
+        input_data, [solve_part_one, solve_part_two], parallel
+    )
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
-    result_part_two = solve_part_two(input_data)
     if result_part_two is not None:
         print(f"Part Two: {result_part_two}")
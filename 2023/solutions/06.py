@@ -79,15 +79,16 @@ def solve_part_two(data: Any) -> Any:
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, parallel = utils.parse_args(day)
 
     file_path: str = os.path.join(input_directory, infile)
     unprocessed_data = utils.read_input(file_path)
     input_data = process(unprocessed_data['data'])
 
-    result_part_one = solve_part_one(input_data)
+    result_part_one, result_part_two = utils.run_parts(
+        input_data, [solve_part_one, solve_part_two], parallel
+    )
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
-    result_part_two = solve_part_two(input_data)
     if result_part_two is not None:
         print(f"Part Two: {result_part_two}")
@@ -7,7 +7,7 @@ The input files are expected to be located in the 'YYYY/in' directory.
 
 import os
 import sys
-from typing import Any, Counter, Dict, List, Optional, Tuple
+from typing import Any, Counter, Dict, Iterable, List, Optional, Tuple
 from typing import Counter as TypingCounter
 
 from pathlib import Path
@@ -28,12 +28,14 @@ input_directory: str = os.path.join(
 def process(raw_data: str) -> Any:
     """Processes the input data.
     """
-    return [
-        (
-            line.split()[0],
-            int(line.split()[1])
-        ) for line in raw_data.splitlines()
-    ]
+    return [parse_line(line) for line in raw_data.splitlines()]
+
+
+def parse_line(line: str) -> Tuple[str, int]:
+    """Parses one hand and its bid.
+    """
+    hand, bid = line.split()
+    return hand, int(bid)
 
 
 def evaluate_hand(
@@ -134,17 +136,40 @@ def solve_part_two(data: Any) -> Any:
     return total_winnings
 
 
+def solve_stream(records: Iterable[Tuple[str, int]]) -> Tuple[int, int]:
+    """Solves both parts in one pass over the hands.
+
+    Winnings depend on the rank of a hand among all the others, so this day
+    cannot run in constant memory: it keeps the evaluated hands and bids of
+    both parts (never the input lines) and sorts them at the end.
+    """
+    plays_one: List[Tuple[int, List[int], int]] = []
+    plays_two: List[Tuple[int, List[int], int]] = []
+    for hand, bid in records:
+        plays_one.append((*evaluate_hand(hand, part2=False), bid))
+        plays_two.append((*evaluate_hand(hand, part2=True), bid))
+
+    answers: List[int] = []
+    for plays in (plays_one, plays_two):
+        plays.sort(key=lambda x: (x[0], x[1]))
+        answers.append(
+            sum((i + 1) * bid for i, (_, _, bid) in enumerate(plays))
+        )
+    return answers[0], answers[1]
+
+
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, parallel = utils.parse_args(day)
 
     file_path: str = os.path.join(input_directory, infile)
     unprocessed_data = utils.read_input(file_path)
     input_data = process(unprocessed_data['data'])
 
-    result_part_one = solve_part_one(input_data)
+    result_part_one, result_part_two = utils.run_parts(
+        input_data, [solve_part_one, solve_part_two], parallel
+    )
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
-    result_part_two = solve_part_two(input_data)
     if result_part_two is not None:
         print(f"Part Two: {result_part_two}")
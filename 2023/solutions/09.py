@@ -7,7 +7,7 @@ The input files are expected to be located in the 'YYYY/in' directory.
 
 import os
 import sys
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 from pprint import pprint
 
 from pathlib import Path
@@ -29,14 +29,13 @@ input_directory: str = os.path.join(
 def process(raw_data: str) -> Any:
     """Processes the input data.
     """
-    return [
-        list(
-            map(
-                int,
-                line.split()
-            )
-        ) for line in raw_data.splitlines()
-    ]
+    return [parse_line(line) for line in raw_data.splitlines()]
+
+
+def parse_line(line: str) -> List[int]:
+    """Parses the history of one value.
+    """
+    return list(map(int, line.split()))
 
 
 def find_next_value(values: List[int]):
@@ -81,17 +80,29 @@ def solve_part_two(data: Any) -> Any:
     return ans
 
 
+def solve_stream(records: Iterable[List[int]]) -> Tuple[int, int]:
+    """Solves both parts in one pass, one history at a time.
+    """
+    ans_one: int = 0
+    ans_two: int = 0
+    for line in records:
+        ans_one += find_next_value(line)
+        ans_two += find_next_value(line[::-1])
+    return ans_one, ans_two
+
+
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, parallel = utils.parse_args(day)
 
     file_path: str = os.path.join(input_directory, infile)
     unprocessed_data = utils.read_input(file_path)
     input_data = process(unprocessed_data['data'])
 
-    result_part_one = solve_part_one(input_data)
+    result_part_one, result_part_two = utils.run_parts(
+        input_data, [solve_part_one, solve_part_two], parallel
+    )
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
-    result_part_two = solve_part_two(input_data)
     if result_part_two is not None:
         print(f"Part Two: {result_part_two}")
@@ -8,7 +8,7 @@ The input files are expected to be located in the 'YYYY/in' directory.
 from collections import deque
 import os
 import sys
-from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+from typing import Any, Deque, Dict, Optional, Set, Tuple
 
 from pathlib import Path
 
@@ -16,6 +16,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 
 import utils  # noqa: E402
+from utils.grid import DOWN, LEFT, RIGHT, UP, Grid  # noqa: E402
 
 input_directory: str = os.path.join(
     os.path.dirname(
@@ -26,81 +27,67 @@ input_directory: str = os.path.join(
 )
 
 
-def process(raw_data: str) -> Any:
-    """Processes the input data.
+# Directions each pipe connects to, see `utils.grid`
+PIPES: Dict[int, Tuple[int, ...]] = {
+    ord(pipe): directions for pipe, directions in {
+        "|": (DOWN, UP),
+        "-": (RIGHT, LEFT),
+        "L": (RIGHT, UP),
+        "J": (LEFT, UP),
+        "7": (LEFT, DOWN),
+        "F": (RIGHT, DOWN),
+        "S": (DOWN, UP, RIGHT, LEFT),
+    }.items()
+}
+
+
+def process(raw_data: str) -> Grid:
+    """Processes the input data into a frozen grid.
     """
-    return [
-        [
-            c for c in line
-        ] for line in raw_data.splitlines()
-    ]
+    return Grid.from_text(raw_data).freeze()
 
 
-def find_start(grid: List[List[str]]) -> Optional[Tuple[int, int]]:
+def find_start(grid: Grid) -> Optional[int]:
     """Find starting point in grid"""
-    for i, row in enumerate(grid):
-        for j, val in enumerate(row):
-            if val == 'S':
-                return (i, j)
+    return grid.find('S')
 
 
 def solve_part_one(data: Any) -> Any:
     """Solves part one of the challenge.
+
+    Returns the distance to the furthest pipe and the flat indices of the
+    loop.
     """
     if data is None:
         return None
 
     # find start
-    start: Optional[Tuple[int, int]] = find_start(data)
+    start: Optional[int] = find_start(data)
     if start is None:
         error_message: str = "Grid has no starting value."
         raise ValueError(error_message)
 
     # simulate movement
-    rows: int = len(data)
-    cols: int = len(data[0])
-    directions: Dict[str, List[Tuple[int, int]]] = {
-        "|" : [(1, 0), (-1,0)],
-        "-" : [(0, 1), (0,-1)],
-        "L" : [(0, 1), (-1,0)],
-        "J" : [(0, -1), (-1,0)],
-        "7" : [(0, -1), (1,0)],
-        "F" : [(0, 1), (1,0)],
-        "S" : [(1, 0), (-1, 0), (0, 1), (0, -1)],
-        "." : []
-    }
-
-    visited: Set[Tuple[int, int]] = set()
-    q: Deque[Tuple[int, int, int]] = deque([(start[0], start[1], 0)])
-    visited.add(start)
-    furthest: Tuple[int, int] = start
+    cells: bytes = data.cells
+    offsets: Tuple[int, ...] = data.offsets
+
+    visited: Set[int] = {start}
+    q: Deque[Tuple[int, int]] = deque([(start, 0)])
     max_distance: int = 0
 
     while q:
-        r, c, dist = q.popleft()
-
-        if dist > max_distance:
-            max_distance = dist
-            furthest = (r, c)
-
-        curr_connection: str = data[r][c]
-
-        for dr, dc in directions[curr_connection]:
-            nr, nc = r + dr, c + dc
-            if not (0 <= nr < rows and 0 <= nc < cols):  # Ensure within bounds
-                continue
+        index, dist = q.popleft()
+        max_distance = max(max_distance, dist)
 
-            if data[nr][nc] == '.':  # Ignore empty spaces
-                continue
-
-            new_connection: str = data[nr][nc]
+        for d in PIPES[cells[index]]:
+            # Empty spaces and the sentinel border connect nowhere
+            ahead: int = index + offsets[d]
 
             # Check if this pipe connects back to the current pipe
-            if (-dr, -dc) in directions[new_connection]:  # Reverse direction
-                if (nr, nc) not in visited:  # Avoid revisiting
-                    visited.add((nr, nc))
-                    q.append((nr, nc, dist + 1))
-
+            if (d ^ 2) in PIPES.get(cells[ahead], ()):  # Reverse direction
+                if ahead not in visited:  # Avoid revisiting
+                    visited.add(ahead)
+                    q.append((ahead, dist + 1))
 
     return max_distance, visited
 
@@ -113,7 +100,8 @@ def solve_part_two_archive(grid, loop_set):
     if grid is None:
         raise ValueError("Grid not valid.")
 
-    rows, cols = len(grid), len(grid[0])
+    rows, cols = grid.rows, grid.cols
+    loop_set = {grid.position(index) for index in loop_set}
 
     def in_bounds(r, c):
         return 0 <= r < rows and 0 <= c < cols
@@ -181,79 +169,65 @@ def solve_part_two_archive(grid, loop_set):
     return enclosed_area
 
 
-def solve_part_two(data: Any, loop_set: Set[Tuple[int, int]]) -> Any:
+def solve_part_two(
+    data: Any,
+    loop_set: Optional[Set[int]] = None
+) -> Any:
     """Solves part two of the challenge."""
-    rows: int = len(data)
-    cols: int = len(data[0])
+    cells: bytes = data.cells
+    offsets: Tuple[int, ...] = data.offsets
 
     # find start
-    start: Optional[Tuple[int, int]] = find_start(data)
+    start: Optional[int] = find_start(data)
     if start is None:
         error_message: str = "Grid has no starting value."
         raise ValueError(error_message)
 
-    start_row, start_col = start
-
-    loop = {(start_row, start_col)}
-    q = deque([(start_row, start_col)])
+    loop: Set[int] = {start}
+    q: Deque[int] = deque([start])
 
     maybe_s = {"|", "-", "J", "L", "7", "F"}
 
+    # Direction, pipes leaving that way, pipes it enters, what S can be
+    # then; the sentinel border is in none of them
+    openings = (
+        (UP, "S|JL", "|7F", {"|", "J", "L"}),
+        (DOWN, "S|7F", "|JL", {"|", "7", "F"}),
+        (LEFT, "S-J7", "-LF", {"-", "J", "7"}),
+        (RIGHT, "S-LF", "-J7", {"-", "L", "F"}),
+    )
+
     while q:
-        r, c = q.popleft()
-        ch = data[r][c]
-
-        if r > 0 and ch in "S|JL" and data[r - 1][c] in "|7F" and (r - 1, c) not in loop:
-            loop.add((r - 1, c))
-            q.append((r - 1, c))
-            if ch == "S":
-                maybe_s &= {"|", "J", "L"}
-
-        if r < rows - 1 and ch in "S|7F" and data[r + 1][c] in "|JL" and (r + 1, c) not in loop:
-            loop.add((r + 1, c))
-            q.append((r + 1, c))
-            if ch == "S":
-                maybe_s &= {"|", "7", "F"}
-
-        if c > 0 and ch in "S-J7" and data[r][c - 1] in "-LF" and (r, c - 1) not in loop:
-            loop.add((r, c - 1))
-            q.append((r, c - 1))
-            if ch == "S":
-                maybe_s &= {"-", "J", "7"}
-
-        if c < cols - 1 and ch in "S-LF" and data[r][c + 1] in "-J7" and (r, c + 1) not in loop:
-            loop.add((r, c + 1))
-            q.append((r, c + 1))
-            if ch == "S":
-                maybe_s &= {"-", "L", "F"}
+        index: int = q.popleft()
+        ch: str = chr(cells[index])
+
+        for d, leaving, entering, s_types in openings:
+            ahead: int = index + offsets[d]
+            if ch in leaving and chr(cells[ahead]) in entering \
+                    and ahead not in loop:
+                loop.add(ahead)
+                q.append(ahead)
+                if ch == "S":
+                    maybe_s &= s_types
 
     assert len(maybe_s) == 1
     start_type: str = next(iter(maybe_s))
 
-    # Replace 'S' with its determined type
-    new_data: List[List[str]] = []
-    for row in data:
-        new_row: List[str] = [start_type if c == 'S' else c for c in row]
-        new_data.append(new_row)
-    data = new_data
-
-    # Create a cleaned grid with only loop pipes
-    cleaned_grid: List[List[str]] = []
-    for r, row in enumerate(data):
-        new_row: List[str] = [
-            data[r][c] if (r, c) in loop else '.'
-            for c in range(cols)
-        ]
-        cleaned_grid.append(new_row)
-    data = cleaned_grid
-
-    # Mark outside and loop cells
-    outside = set()
-
-    for r, row in enumerate(data):
+    # Scan each row of the loop, with S replaced by its determined type and
+    # every pipe off the loop read as ground
+    enclosed: int = 0
+    for r in range(data.rows):
         within = False
         up = None
-        for c, ch in enumerate(row):
+        for c in range(data.cols):
+            index = data.index(r, c)
+            if index not in loop:
+                ch = "."
+            elif index == start:
+                ch = start_type
+            else:
+                ch = chr(cells[index])
+
             if ch == "|":
                 assert up is None
                 within = not within
@@ -268,27 +242,31 @@ def solve_part_two(data: Any, loop_set: Set[Tuple[int, int]]) -> Any:
                     within = not within
                 up = None
             elif ch == ".":
-                pass
+                if within:
+                    enclosed += 1
             else:
                 raise RuntimeError(f"unexpected character (horizontal): {ch}")
-            if not within:
-                outside.add((r, c))
 
-    total_cells = rows * cols
-    return total_cells - len(outside | loop)
+    return enclosed
 
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, parallel = utils.parse_args(day)
 
     file_path: str = os.path.join(input_directory, infile)
     unprocessed_data = utils.read_input(file_path)
     input_data = process(unprocessed_data['data'])
 
-    result_part_one, loop_set = solve_part_one(input_data)
+    if parallel:
+        # Part two traces the loop again rather than wait for part one
+        (result_part_one, _), result_part_two = utils.run_parts(
+            input_data, [solve_part_one, solve_part_two], parallel
+        )
+    else:
+        result_part_one, loop_set = solve_part_one(input_data)
+        result_part_two = solve_part_two(input_data, loop_set)
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
-    result_part_two = solve_part_two(input_data, loop_set)
     if result_part_two is not None:
         print(f"Part Two: {result_part_two}")
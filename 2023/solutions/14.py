@@ -6,9 +6,8 @@ The input files are expected to be located in the 'YYYY/in' directory.
 """
 
 import os
-import re
 import sys
-from typing import Any, Dict, List, Set, Tuple
+from typing import Any, Dict, List, Tuple
 
 from pathlib import Path
 
@@ -16,6 +15,7 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 
 import utils
+from utils.grid import DOWN, LEFT, RIGHT, UP, Grid
 
 input_directory: str = os.path.join(
     os.path.dirname(
@@ -26,107 +26,69 @@ input_directory: str = os.path.join(
 )
 
 
-def process(raw_data: str) -> Any:
-    """Processes the input data.
-    """
-    return [
-        [
-            c for c in line
-        ] for line in raw_data.splitlines()
-    ]
+ROCK: int = ord('O')
+CUBE: int = ord('#')
+EMPTY: int = ord('.')
 
 
-def split_keep_delimiter(s: str, delimiter: str):
-    """Split string and keep delimiter in final list.
+def process(raw_data: str) -> Grid:
+    """Processes the input data into a frozen grid.
     """
-    escaped_delimiter = re.escape(delimiter)
-    return re.split(f"({escaped_delimiter})", s)
+    return Grid.from_text(raw_data).freeze()
 
 
-def simulate_board(grid: List[List[str]]) -> List[List[str]]:
-    """Slide board, where O represent movable rocks and # are fixed rocks.
+def lanes(grid: Grid, direction: int) -> List[range]:
+    """Flat indices of every line the rocks roll along towards `direction`,
+    starting at the edge they roll against.
     """
-    rows: int = len(grid)
-    cols: int = len(grid[0])
-
-    for col in range(cols):
-        column = [
-            grid[row][col] for row in range(rows)
+    rows: int = grid.rows
+    cols: int = grid.cols
+    width: int = grid.width
+    if direction == UP:
+        return [
+            range(grid.index(0, c), grid.index(rows, c), width)
+            for c in range(cols)
         ]
-        column_str: str = "".join(column)
-        parts = split_keep_delimiter(column_str, "#")
-        s: List[str] = list(
-                map(
-                    lambda x: "".join(
-                        sorted(
-                            [
-                                c for c in x
-                            ],
-                            reverse=True
-                        )
-                    ),
-                    parts
-                )
-        )
-        sorted_column: str = "".join(s)
-        for row in range(rows):
-            grid[row][col] = sorted_column[row]
-
-    return grid
-
-
-def simulate(grid: List[List[str]]) -> List[List[str]]:
-    """ Slide Board
-    """
-    grid = list(
-        map(
-            "".join,
-            zip(*grid)
-            )
-    )
-    grid = [
-        "#".join(  # Join groups with "#"
-            [
-                "".join(  # Join characters within each group
-                    sorted(  # Sort the characters in descending order
-                        list(group),
-                        reverse=True
-                    )
-                ) for group in row.split("#")  # Split the row by "#"
-            ]
-        ) for row in grid  # Iterate through each row in the grid
+    if direction == DOWN:
+        return [
+            range(grid.index(rows - 1, c), grid.index(-1, c), -width)
+            for c in range(cols)
+        ]
+    if direction == LEFT:
+        return [
+            range(grid.index(r, 0), grid.index(r, cols)) for r in range(rows)
+        ]
+    return [
+        range(grid.index(r, cols - 1), grid.index(r, -1), -1)
+        for r in range(rows)
     ]
-    grid = list(
-        map(
-            "".join,
-            zip(*grid)
-            )
-    )
-    return grid
 
 
-def calculate_load(grid: List[List[str]]) -> int:
-    """Calculate teh load on the north beam.
+def tilt(cells: bytearray, tilt_lanes: List[range]) -> None:
+    """Slide every O rock along its lane until it hits a # rock, another O
+    rock or the edge, in place.
     """
-    rows: int = len(grid)
-    load: int = 0
-
-    for r, row in enumerate(grid):
-        rocks_count: int = sum(
-            [
-                1 if val == 'O' else 0 for val in row
-            ]
-        )
-        load += (rows - r) * rocks_count
-
-    return load
-
-
-def calc_load(grid: List[List[str]]) -> int:
-    """Calculate teh load on the north beam for roated grid.
+    for lane in tilt_lanes:
+        step: int = lane.step
+        free: int = lane.start
+        for index in lane:
+            cell: int = cells[index]
+            if cell == CUBE:
+                free = index + step
+            elif cell == ROCK:
+                if index != free:
+                    cells[free] = ROCK
+                    cells[index] = EMPTY
+                free += step
+
+
+def calc_load(grid: Grid, cells: bytes) -> int:
+    """Calculate the load on the north beam of `grid` holding `cells`.
     """
     return sum(
-        row.count('O') * (len(grid) - r) for r, row in enumerate(grid)
+        cells.count(ROCK, grid.index(r, 0), grid.index(r, grid.cols))
+        * (grid.rows - r)
+        for r in range(grid.rows)
     )
 
 
@@ -137,9 +99,10 @@ def solve_part_one(data: Any) -> Any:
         error_msg: str = "Data not properly loaded"
         raise ValueError(error_msg)
 
-    tilted_grid: List[List[str]] = simulate_board(data)
+    cells: bytearray = bytearray(data.cells)
+    tilt(cells, lanes(data, UP))
 
-    return calc_load(tilted_grid)
+    return calc_load(data, cells)
 
 
 def solve_part_two(input_data: Any) -> Any:
@@ -149,84 +112,55 @@ def solve_part_two(input_data: Any) -> Any:
     if input_data is None:
         raise ValueError("Input data is not properly loaded.")
 
-    # Parse the input into an initial immutable grid
-    initial_grid: Tuple[str, ...] = tuple("".join(line) for line in input_data)
-
-    def transform_grid(grid: Tuple[str, ...]) -> Tuple[str, ...]:
-        """
-        Performs one full transformation cycle on the grid:
-        1. Transpose the grid.
-        2. Sort and process rows based on `#` delimiters.
-        3. Reverse each row.
-        """
-        for _ in range(4):
-            # Rotate grid 90 degrees clockwise
-            grid = tuple(map("".join, zip(*grid)))
-
-            # Sort each row's groups of rocks
-            grid = tuple(
-                "#".join(
-                    "".join(sorted(group, reverse=True)) for group in row.split("#")
-                )
-                for row in grid
-            )
-
-            # Reverse each row
-            grid = tuple(row[::-1] for row in grid)
-
-        return grid
-
-    # Initialize variables for cycle detection
-    seen_grids: Set[Tuple[str, ...]] = set()
-    seen_grids.add(initial_grid)
-
-    grid_history: List[Tuple[str, ...]] = [initial_grid]
-    current_grid = initial_grid
-
-    # Detect cycles in grid transformations
-    iteration = 0
+    # One spin cycle tilts north, west, south and east
+    cycle_lanes: List[List[range]] = [
+        lanes(input_data, direction)
+        for direction in (UP, LEFT, DOWN, RIGHT)
+    ]
+    cells: bytearray = bytearray(input_data.cells)
+
+    # Detect cycles in grid transformations, keyed by the cell bytes
+    seen_grids: Dict[bytes, int] = {bytes(cells): 0}
+    grid_history: List[bytes] = [bytes(cells)]
+
+    iteration: int = 0
     while True:
         iteration += 1
-        current_grid = transform_grid(current_grid)
+        for tilt_lanes in cycle_lanes:
+            tilt(cells, tilt_lanes)
+        current_grid: bytes = bytes(cells)
         if current_grid in seen_grids:
             # Cycle detected
             break
 
-        seen_grids.add(current_grid)
+        seen_grids[current_grid] = iteration
         grid_history.append(current_grid)
 
     # Determine cycle properties
-    start_of_cycle = grid_history.index(current_grid)
-    cycle_length = iteration - start_of_cycle
+    start_of_cycle: int = seen_grids[current_grid]
+    cycle_length: int = iteration - start_of_cycle
 
     # Calculate the target iteration within the cycle
-    target_iteration = (
+    target_iteration: int = (
         1_000_000_000 - start_of_cycle
     ) % cycle_length + start_of_cycle
-    target_grid = grid_history[target_iteration]
-
-    # Convert target grid for calc_load (if required by its implementation)
-    formatted_target_grid: List[List[str]] = [
-        [
-            c for c in line
-        ] for line in target_grid
-    ]
 
     # Calculate and return the load for the target grid
-    return calc_load(formatted_target_grid)
+    return calc_load(input_data, grid_history[target_iteration])
 
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, parallel = utils.parse_args(day)
 
     file_path: str = os.path.join(input_directory, infile)
     unprocessed_data = utils.read_input(file_path)
     input_data = process(unprocessed_data['data'])
 
-    result_part_one = solve_part_one(input_data)
+    result_part_one, result_part_two = utils.run_parts(
+        input_data, [solve_part_one, solve_part_two], parallel
+    )
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
-    result_part_two = solve_part_two(input_data)
     if result_part_two is not None:
         print(f"Part Two: {result_part_two}")
@@ -7,13 +7,14 @@ The input files are expected to be located in the 'YYYY/in' directory.
 
 import os
 import sys
-from typing import Any, Deque, Dict, List, Optional, Set, Tuple
+from typing import Any, Deque, Dict, Optional, Set, Tuple
 
 from pathlib import Path
 
 # Add the parent directory of 'utils' to sys.path
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 import utils
+from utils.grid import DOWN, LEFT, RIGHT, SENTINEL, UP, Grid
 
 
 input_directory: str = os.path.join(
@@ -28,72 +29,63 @@ input_directory: str = os.path.join(
 def process(raw_data: str) -> Any:
     """Processes the input data.
     """
-    return [
-        [
-            c for c in line
-        ] for line in raw_data.splitlines()
-    ]
+    return Grid.from_text(raw_data)
 
 
-def calc(data: Any, start: Tuple[int, int], dir: int) -> int:
+def calc(data: Grid, start: int, dir: int) -> int:
     """Calculates the number of energized tiles from a given starting position and direction.
 
     Args:
         data: The grid data
-        start: Starting position tuple (row, col)
-        dir: Initial direction (0=right, 1=down, 2=left, 3=up)
+        start: Starting flat index, on the border just outside the map
+        dir: Initial direction (UP, RIGHT, DOWN or LEFT)
 
     Returns:
         int: Number of energized tiles
     """
     q: Deque = Deque([
-        (start[0], start[1], dir)  # (row, col, direction)
+        (start, dir)  # (flat index, direction)
     ])
 
-    energized: Set[Tuple[int, int]] = set()
-    visited: Set[Tuple[int, int, int]] = set()
+    energized: Set[int] = set()
+    visited: Set[int] = set()
 
-    rows: int = len(data)
-    cols: int = len(data[0])
-    directions: List[Tuple[int, int]] = [
-        (0, 1), (1, 0), (0, -1), (-1, 0)]  # R,D,L,U
+    cells = data.cells
+    offsets: Tuple[int, ...] = data.offsets
+    backslash, slash, pipe, dash = b'\\/|-'
 
     while q:
-        r, c, dir = q.popleft()
+        i, dir = q.popleft()
 
         # Add current cell to energized set
-        energized.add((r, c))
+        energized.add(i)
 
-        if (r, c, dir) in visited:
+        # Flat index and direction packed into one int
+        state: int = i * 4 + dir
+        if state in visited:
             continue
-        visited.add((r, c, dir))
+        visited.add(state)
 
-        dr, dc = directions[dir]
-        nr, nc = r + dr, c + dc
+        ni: int = i + offsets[dir]
+        tile: int = cells[ni]
 
-        if nr < 0 or nr >= rows or nc < 0 or nc >= cols:
+        if tile == SENTINEL:
             continue
 
-        if data[nr][nc] == '.':
-            q.append((nr, nc, dir))
-        elif data[nr][nc] == '\\':
-            new_dir = dir ^ 1  # Smart way to flip between 0<->1 and 2<->3
-            q.append((nr, nc, new_dir))
-        elif data[nr][nc] == '/':
-            new_dir = 3 - dir  # Smart way to flip between 0<->3 and 1<->2
-            q.append((nr, nc, new_dir))
-        elif data[nr][nc] == '|':
-            if dir in (0, 2):  # Horizontal beam
-                q.append((nr, nc, 1))  # Split down
-                q.append((nr, nc, 3))  # Split up
-            else:  # Vertical beam
-                q.append((nr, nc, dir))
-        elif data[nr][nc] == '-':
-            if dir in (1, 3):  # Vertical beam
-                q.append((nr, nc, 0))  # Split right
-                q.append((nr, nc, 2))  # Split left
-            else:  # Horizontal beam
-                q.append((nr, nc, dir))
+        if tile == backslash:
+            new_dir = 3 - dir  # Flips between UP<->LEFT and RIGHT<->DOWN
+            q.append((ni, new_dir))
+        elif tile == slash:
+            new_dir = dir ^ 1  # Flips between UP<->RIGHT and DOWN<->LEFT
+            q.append((ni, new_dir))
+        elif tile == pipe and dir in (RIGHT, LEFT):  # Horizontal beam
+            q.append((ni, DOWN))  # Split down
+            q.append((ni, UP))  # Split up
+        elif tile == dash and dir in (UP, DOWN):  # Vertical beam
+            q.append((ni, RIGHT))  # Split right
+            q.append((ni, LEFT))  # Split left
+        else:  # Empty tile or a splitter hit end-on
+            q.append((ni, dir))
 
     return len(energized) - 1
 
@@ -104,7 +96,7 @@ def solve_part_one(data: Any) -> Any:
     if data is None:
         return None
 
-    return calc(data, (0, -1), 0)
+    return calc(data, data.index(0, -1), RIGHT)
 
 
 def solve_part_two(data: Any) -> Any:
@@ -114,29 +106,29 @@ def solve_part_two(data: Any) -> Any:
         return None
     max_val: int = 0
 
-    # Fixed the calc() calls and grid reference
-    for r in range(len(data)):
-        max_val = max(max_val, calc(data, (r, -1), 0))
-        max_val = max(max_val, calc(data, (r, len(data[0])), 2))
+    for r in range(data.rows):
+        max_val = max(max_val, calc(data, data.index(r, -1), RIGHT))
+        max_val = max(max_val, calc(data, data.index(r, data.cols), LEFT))
 
-    for c in range(len(data[0])):
-        max_val = max(max_val, calc(data, (-1, c), 1))
-        max_val = max(max_val, calc(data, (len(data), c), 3))
+    for c in range(data.cols):
+        max_val = max(max_val, calc(data, data.index(-1, c), DOWN))
+        max_val = max(max_val, calc(data, data.index(data.rows, c), UP))
 
     return max_val
 
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, parallel = utils.parse_args(day)
 
     file_path: str = os.path.join(input_directory, infile)
     unprocessed_data = utils.read_input(file_path)
     input_data = process(unprocessed_data['data'])
 
-    result_part_one = solve_part_one(input_data)
+    result_part_one, result_part_two = utils.run_parts(
+        input_data, [solve_part_one, solve_part_two], parallel
+    )
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
-    result_part_two = solve_part_two(input_data)
     if result_part_two is not None:
         print(f"Part Two: {result_part_two}")
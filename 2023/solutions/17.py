@@ -7,14 +7,16 @@ The input files are expected to be located in the 'YYYY/in' directory.
 
 import os
 import sys
-from typing import Any, List, Set, Tuple
-from heapq import heappush, heappop
+from typing import Any, Dict, List, Tuple
 
 from pathlib import Path
 
 # Add the parent directory of 'utils' to sys.path
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 import utils
+from utils import search
+from utils.grid import DOWN, RIGHT, SENTINEL, Grid
+from utils.search import SearchResult
 
 
 input_directory: str = os.path.join(
@@ -29,68 +31,66 @@ input_directory: str = os.path.join(
 def process(raw_data: str) -> Any:
     """Processes the input data.
     """
-    return [
-        [
-            int(c) for c in line
-        ] for line in raw_data.splitlines()
-    ]
+    return Grid.from_text(raw_data)
 
 
-def find_path(data: Any, max_straight: int, min_straight: int) -> Tuple:
-    """
+def find_path(data: Grid, max_straight: int, min_straight: int) -> Tuple:
+    """Least heat loss path of the crucible from the top left to the bottom
+    right block.
+
+    States are `(index * 4 + direction) * (max_straight + 1) + straight`,
+    heat losses are 1..9 so a bucket queue (Dial) replaces the heap.
     """
-    rows: int = len(data)
-    cols: int = len(data[0])
-    end: Tuple[int, int] = (rows-1, cols-1)
-
-    # Queue entries: (heat_loss, row, col, dir_index, steps, path)
-    q: List = [(0, 0, 0, -1, 0, [(0, 0)])]  # Now treated as a heap
-    seen: Set[Tuple[int, int, int, int]] = set()
-    
-    directions: List[Tuple[int, int]] = [(0, 1), (1, 0), (0, -1), (-1, 0)]  # R,D,L,U
-    min_heat: int = float('inf')
-    best_path: List = []
-
-    while q:
-        # Replace manual sort + pop with heappop
-        heat, r, c, prev_dir, straight, path = heappop(q)
-
-        # Only consider paths that have moved minimum straight blocks when reaching end
-        if (r, c) == end:
-            if prev_dir == -1 or straight >= min_straight:
-                if heat < min_heat:
-                    min_heat = heat
-                    best_path = path
-            continue
-
-        state: Tuple[int, int, int, int] = (r, c, prev_dir, straight)
-        if state in seen:
-            continue
-        seen.add(state)
-
-        for i, (dr, dc) in enumerate(directions):
+    cells = data.cells
+    offsets: Tuple[int, ...] = data.offsets
+    zero: int = ord('0')
+    span: int = max_straight + 1
+    start: int = data.index(0, 0)
+    end: int = data.index(data.rows - 1, data.cols - 1)
+
+    def moves(state: int) -> List[Tuple[int, int]]:
+        rest, straight = divmod(state, span)
+        i, prev_dir = divmod(rest, 4)
+        result: List[Tuple[int, int]] = []
+        for d in range(4):
             # Can't reverse direction
-            if prev_dir != -1 and abs(prev_dir - i) == 2:
+            if d == prev_dir ^ 2:
                 continue
 
             # Must continue straight if haven't met minimum
-            if prev_dir != -1 and straight < min_straight and i != prev_dir:
+            if straight < min_straight and d != prev_dir:
                 continue
 
             # Can't go more than max_straight blocks straight
-            if i == prev_dir and straight == max_straight:
+            if d == prev_dir and straight == max_straight:
                 continue
 
-            nr: int = r + dr
-            nc: int = c + dc
+            ni: int = i + offsets[d]
+            if cells[ni] == SENTINEL:
+                continue
+            new_straight: int = straight + 1 if d == prev_dir else 1
+            result.append(
+                ((ni * 4 + d) * span + new_straight, cells[ni] - zero)
+            )
+        return result
+
+    def at_end(state: int) -> bool:
+        # Only paths that moved minimum straight blocks may stop at the end
+        return (
+            state // span // 4 == end and state % span >= min_straight
+        )
 
-            if 0 <= nr < rows and 0 <= nc < cols:
-                new_heat: int = heat + data[nr][nc]
-                new_straight: int = straight + 1 if i == prev_dir else 1
-                new_path: List = path + [(nr, nc)]
-                # Replace append with heappush
-                heappush(q, (new_heat, nr, nc, i, new_straight, new_path))
-    return best_path, cols, end, min_heat, rows
+    # The crucible may leave the start going right or down
+    sources: List[int] = [(start * 4 + d) * span for d in (RIGHT, DOWN)]
+    result: SearchResult = search.dial(
+        len(cells) * 4 * span, sources, moves, 9, goal=at_end, parents=True
+    )
+    if result.goal is None:
+        return [], data.cols, end, float('inf'), data.rows
+
+    best_path: List[int] = [state // span // 4 for state in result.path()]
+    min_heat: int = result.distance()
+    return best_path, data.cols, end, min_heat, data.rows
 
 
 def solve_part_one(data: Any) -> Any:
@@ -111,24 +111,14 @@ def solve_part_one(data: Any) -> Any:
 
     # Print the path for debugging
     if best_path:
-        grid: List[List[str]] = [
-            ['.' for _ in range(cols)] for _ in range(rows)]
-        for i in range(len(best_path)-1):
-            curr_r, curr_c = best_path[i]
-            next_r, next_c = best_path[i+1]
-            if next_c > curr_c:
-                grid[curr_r][curr_c] = '>'
-            elif next_c < curr_c:
-                grid[curr_r][curr_c] = '<'
-            elif next_r > curr_r:
-                grid[curr_r][curr_c] = 'v'
-            else:
-                grid[curr_r][curr_c] = '^'
-        grid[end[0]][end[1]] = 'E'
+        grid: Grid = Grid.filled(rows, cols, '.')
+        arrows: Dict[int, str] = dict(zip(data.offsets, '^>v<'))
+        for curr, nxt in zip(best_path, best_path[1:]):
+            grid[curr] = arrows[nxt - curr]
+        grid[end] = 'E'
 
         # print("\nPath:")
-        # for row in grid:
-        #     print(''.join(row))
+        # print(grid)
 
     return min_heat
 
@@ -152,15 +142,16 @@ def solve_part_two(data: Any) -> Any:
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, parallel = utils.parse_args(day)
 
     file_path: str = os.path.join(input_directory, infile)
     unprocessed_data = utils.read_input(file_path)
     input_data = process(unprocessed_data['data'])
 
-    result_part_one = solve_part_one(input_data)
+    result_part_one, result_part_two = utils.run_parts(
+        input_data, [solve_part_one, solve_part_two], parallel
+    )
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
-    result_part_two = solve_part_two(input_data)
     if result_part_two is not None:
         print(f"Part Two: {result_part_two}")
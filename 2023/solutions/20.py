@@ -174,16 +174,20 @@ def solve_part_two(data: Any) -> Any:
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, parallel = utils.parse_args(day)
 
     file_path: str = os.path.join(input_directory, infile)
     unprocessed_data = utils.read_input(file_path)
     input_data = process(unprocessed_data['data'])
 
-
-    result_part_one = solve_part_one(copy.deepcopy(input_data))
+    # Both parts flip the module states, each gets its own copy
+    result_part_one, result_part_two = utils.run_parts(
+        input_data,
+        [lambda data: solve_part_one(copy.deepcopy(data)),
+         lambda data: solve_part_two(copy.deepcopy(data))],
+        parallel
+    )
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
-    result_part_two = solve_part_two(copy.deepcopy(input_data))
     if result_part_two is not None:
         print(f"Part Two: {result_part_two}")
@@ -5,17 +5,17 @@ This file provides a structure for solving Advent of Code challenges.
 The input files are expected to be located in the 'YYYY/in' directory.
 """
 
-import copy
 import os
 import sys
 from collections import deque
-from typing import Any, List, Tuple, Deque, Optional
+from typing import Any, List, Set, Tuple, Deque, Optional
 
 from pathlib import Path
 
 # Add the parent directory of 'utils' to sys.path
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 import utils  # noqa: E402
+from utils.grid import SENTINEL, Grid  # noqa: E402
 
 
 input_directory: str = os.path.join(
@@ -27,14 +27,13 @@ input_directory: str = os.path.join(
 )
 
 
-def process(raw_data: str) -> Any:
-    """Processes the input data.
+ROCK: int = ord('#')
+
+
+def process(raw_data: str) -> Grid:
+    """Processes the input data into a frozen grid.
     """
-    return [
-        [
-            c for c in line
-        ] for line in raw_data.splitlines()
-    ]
+    return Grid.from_text(raw_data).freeze()
 
 
 def count_reachable_plots(
@@ -46,85 +45,71 @@ def count_reachable_plots(
     if data is None:
         return None
 
-    grid: List[List[str]] = copy.deepcopy(data)
-    new_grid: List[List[str]] = copy.deepcopy(data)
-
-    rows: int = len(grid)
-    cols: int = len(grid[0])
+    cells: bytes = data.cells
+    offsets: Tuple[int, ...] = data.offsets
 
-    directions: List[Tuple[int, int]] = [
-        (0, 1), (1, 0), (0, -1), (-1, 0)
-    ]  # R,D,L,U
+    # The plots reached after each step, instead of a marked copy of the map
+    reached: Set[int] = set(data.find_all('S'))
+    for _ in range(steps):
+        next_reached: Set[int] = set()
+        for index in reached:
+            for offset in offsets:
+                ahead: int = index + offset
+                if cells[ahead] != ROCK and cells[ahead] != SENTINEL:
+                    next_reached.add(ahead)
+        reached = next_reached
 
-    for i in range(64):
-        for r, row in enumerate(grid):
-            for c, val in enumerate(row):
-                if val == 'O' or (i == 0 and val == 'S'):
-                    new_grid[r][c] = '.'
-                    for dr, dc in directions:
-                        nr, nc = r + dr, c + dc
-                        if (
-                            0 <= nr < rows and
-                            0 <= nc < cols and
-                            grid[nr][nc] != '#'
-                        ):
-                            new_grid[nr][nc] = 'O'
-
-        grid = copy.deepcopy(new_grid)
-
-    count: int = sum(row.count('O') for row in grid)
-    return count
+    return len(reached)
 
 
 def count_reachable_plots_bfs(
-    data: List[List[str]],
+    data: Grid,
     steps: int = 64
 ) -> int:
     """Count reachable plots using Breadth-First Search.
     """
+    cells: bytes = data.cells
+    offsets: Tuple[int, ...] = data.offsets
     # Find starting position
-    rows: int = len(data)
-    cols: int = len(data[0])
-    start_pos: Tuple[int, int] = next(
-        (r, c) for r, row in enumerate(data)
-        for c, ch in enumerate(row) if ch == 'S'
-    )
+    start_pos: Optional[int] = data.find('S')
 
     ans: set = set()
     seen: set = {start_pos}
-    q: Deque[Tuple[int, int, int]] = deque(
-        [(start_pos[0], start_pos[1], steps)]
-    )
+    q: Deque[Tuple[int, int]] = deque([(start_pos, steps)])
 
     while q:
-        r, c, s = q.popleft()
+        index, s = q.popleft()
 
         if s % 2 == 0:
-            ans.add((r, c))
+            ans.add(index)
         if s == 0:
             continue
 
-        for nr, nc in [(r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)]:
-            if (nr < 0 or nr >= rows or nc < 0 or nc >= cols or
-                    data[nr][nc] == '#' or (nr, nc) in seen):
+        for offset in offsets:
+            ahead: int = index + offset
+            if (cells[ahead] == ROCK or cells[ahead] == SENTINEL or
+                    ahead in seen):
                 continue
-            seen.add((nr, nc))
-            q.append((nr, nc, s - 1))
+            seen.add(ahead)
+            q.append((ahead, s - 1))
 
     return len(ans)
 
 
 def count_reachable_plots_infinite(
-    data: List[List[str]],
+    data: Grid,
     steps: int,
     start_pos: Optional[Tuple[int, int]] = None
 ) -> int:
     """Count reachable plots in infinite grid.
+
+    Positions are `(row, col)` in the tiled plane, folded back onto the map
+    with a modulo, which the sentinel border cannot do.
     """
-    size: int = len(data)
+    cells: bytes = data.cells
+    size: int = data.rows
     if not start_pos:
-        start_pos = next((r, c) for r, row in enumerate(data)
-                         for c, ch in enumerate(row) if ch == 'S')
+        start_pos = data.position(data.find('S'))
 
     plots: set = set()
     seen: set = set()
@@ -145,7 +130,7 @@ def count_reachable_plots_infinite(
 
         for nr, nc in [(r + 1, c), (r - 1, c), (r, c + 1), (r, c - 1)]:
             grid_r, grid_c = nr % size, nc % size
-            if data[grid_r][grid_c] != '#':
+            if cells[data.index(grid_r, grid_c)] != ROCK:
                 q.append((nr, nc, s - 1))
 
     return len(plots)
@@ -160,10 +145,10 @@ def solve_part_one(data: Any) -> Any:
     return count_reachable_plots(data)
 
 
-def solve_part_two(data: List[List[str]]) -> int:
+def solve_part_two(data: Grid) -> int:
     """Solves part two of the challenge.
     """
-    size: int = len(data)
+    size: int = data.rows
     steps: int = 26501365
 
     # The pattern repeats every size steps after the initial offset
@@ -186,15 +171,16 @@ def solve_part_two(data: List[List[str]]) -> int:
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, parallel = utils.parse_args(day)
 
     file_path: str = os.path.join(input_directory, infile)
     unprocessed_data = utils.read_input(file_path)
     input_data = process(unprocessed_data['data'])
 
-    result_part_one = solve_part_one(input_data)
+    result_part_one, result_part_two = utils.run_parts(
+        input_data, [solve_part_one, solve_part_two], parallel
+    )
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
-    result_part_two = solve_part_two(input_data)
     if result_part_two is not None:
         print(f"Part Two: {result_part_two}")
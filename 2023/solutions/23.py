@@ -9,7 +9,6 @@ from collections import deque
 import os
 import sys
 from typing import Any, Deque, Dict, List, Set, Tuple
-import copy
 
 from pathlib import Path
 
@@ -17,6 +16,9 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 
 import utils  # noqa: E402
+from utils.grid import (  # noqa: E402
+    DOWN, LEFT, RIGHT, SENTINEL, UP, Grid
+)
 
 input_directory: str = os.path.join(
     os.path.dirname(
@@ -27,81 +29,74 @@ input_directory: str = os.path.join(
 )
 
 
-def process(raw_data: str) -> Any:
-    """Processes the input data.
-    """
-    return [
-        [
-            c for c in line
-        ] for line in raw_data.splitlines()
-    ]
+# Directions allowed from each kind of tile, slopes only go downhill
+SLOPE_DIRS: Dict[int, Tuple[int, ...]] = {
+    ord("^"): (UP,),
+    ord("v"): (DOWN,),
+    ord("<"): (LEFT,),
+    ord(">"): (RIGHT,),
+    ord("."): (UP, DOWN, LEFT, RIGHT),
+}
 
+# Part two walks slopes like any other path tile
+PATH_DIRS: Dict[int, Tuple[int, ...]] = dict.fromkeys(
+    SLOPE_DIRS, SLOPE_DIRS[ord(".")]
+)
 
-def find_path(data: Any):
-    """Shared path finding algorithm"""
-    start: Tuple[int, int] = (0, "".join(data[0]).index("."))
-    end: Tuple[int, int] = (len(data) - 1, "".join(data[-1]).index("."))
+FOREST: int = ord("#")
 
-    points: List[Tuple[int, int]] = [start, end]
 
-    for r, row in enumerate(data):
-        for c, ch in enumerate(row):
-            if ch == "#":
-                continue
-            neighbors = 0
-            for nr, nc in [
-                (r - 1, c),
-                (r + 1, c),
-                (r, c - 1),
-                (r, c + 1)
-            ]:
-                if (
-                    0 <= nr < len(data) and
-                    0 <= nc < len(data[0]) and
-                    data[nr][nc] != "#"
-                ):
-                    neighbors += 1
-            if neighbors >= 3:
-                points.append((r, c))
+def process(raw_data: str) -> Grid:
+    """Processes the input data into a frozen grid.
+    """
+    return Grid.from_text(raw_data).freeze()
+
+
+def find_path(
+    data: Grid,
+    dirs: Dict[int, Tuple[int, ...]] = SLOPE_DIRS
+):
+    """Shared path finding algorithm"""
+    cells: bytes = data.cells
+    offsets: Tuple[int, ...] = data.offsets
+    start: int = cells.index(b".", data.index(0, 0))
+    end: int = cells.index(b".", data.index(data.rows - 1, 0))
+
+    def open_cell(index: int) -> bool:
+        return cells[index] != FOREST and cells[index] != SENTINEL
+
+    # Junctions: path tiles with three or more open neighbours
+    points: Set[int] = {start, end}
+    for index in data.indices():
+        if open_cell(index) and sum(
+            open_cell(index + offset) for offset in offsets
+        ) >= 3:
+            points.add(index)
 
     # Initialize graph dictionary for all points
-    graph: Dict[Tuple[int, int], Dict[Tuple[int, int], int]] = {
-        pt: {} for pt in points
-    }
-
-    dirs: Dict[str, List[Tuple[int, int]]] = {
-        "^": [(-1, 0)],
-        "v": [(1, 0)],
-        "<": [(0, -1)],
-        ">": [(0, 1)],
-        ".": [(-1, 0), (1, 0), (0, -1), (0, 1)],
-    }
+    graph: Dict[int, Dict[int, int]] = {pt: {} for pt in points}
 
     # Build graph of connections between points
-    for sr, sc in points:
-        stack: List[Tuple[int, int, int]] = [(0, sr, sc)]
-        seen: Set[Tuple[int, int]] = {(sr, sc)}
+    for source in points:
+        stack: List[Tuple[int, int]] = [(0, source)]
+        seen: Set[int] = {source}
 
         while stack:
-            n, r, c = stack.pop()
+            n, index = stack.pop()
 
-            if n != 0 and (r, c) in points:
-                graph[(sr, sc)][(r, c)] = n
+            if n != 0 and index in points:
+                graph[source][index] = n
                 continue
 
-            for dr, dc in dirs[data[r][c]]:
-                nr: int = r + dr
-                nc: int = c + dc
-                if (0 <= nr < len(data) and
-                    0 <= nc < len(data[0]) and
-                    data[nr][nc] != "#" and
-                        (nr, nc) not in seen):
-                    stack.append((n + 1, nr, nc))
-                    seen.add((nr, nc))
+            for d in dirs[cells[index]]:
+                ahead: int = index + offsets[d]
+                if open_cell(ahead) and ahead not in seen:
+                    stack.append((n + 1, ahead))
+                    seen.add(ahead)
 
-    seen: Set[Tuple[int, int]] = set()
+    seen: Set[int] = set()
 
-    def dfs(pt: Tuple[int, int]) -> int:
+    def dfs(pt: int) -> int:
         """Performs depth-first search to find longest path.
 
         Args:
@@ -138,29 +133,21 @@ def solve_part_one(data: Any) -> Any:
 def solve_part_two(data: Any) -> Any:
     """Solves part two of the challenge.
     """
-    grid = copy.deepcopy(data)
-
-    for r, row in enumerate(data):
-        for c, val in enumerate(row):
-            if val != '#':
-                grid[r][c] = '.'
-            else:
-                grid[r][c] = '#'
-
-    return find_path(grid)
+    return find_path(data, PATH_DIRS)
 
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, parallel = utils.parse_args(day)
 
     file_path: str = os.path.join(input_directory, infile)
     unprocessed_data = utils.read_input(file_path)
     input_data = process(unprocessed_data['data'])
 
-    result_part_one = solve_part_one(input_data)
+    result_part_one, result_part_two = utils.run_parts(
+        input_data, [solve_part_one, solve_part_two], parallel
+    )
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
-    result_part_two = solve_part_two(input_data)
     if result_part_two is not None:
         print(f"Part Two: {result_part_two}")
@@ -10,12 +10,13 @@ import sys
 from typing import Any, List
 
 from pathlib import Path
-import networkx as nx
 
 # Add the parent directory of 'utils' to sys.path
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 import utils
 
+nx = utils.lazy_import('networkx')
+
 
 input_directory: str = os.path.join(
     os.path.dirname(
@@ -26,6 +27,7 @@ input_directory: str = os.path.join(
 )
 
 
+@utils.cached
 def process(raw_data: str) -> Any:
     """Processes the input data.
     """
@@ -64,7 +66,7 @@ def solve_part_one(data: Any) -> Any:
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, _ = utils.parse_args(day)
 
     file_path: str = os.path.join(input_directory, infile)
     unprocessed_data = utils.read_input(file_path)
@@ -6,27 +6,46 @@ The input files are expected to be located in the '2024/in' directory.
 """
 
 import os
-from typing import List, Any, Dict
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
 from collections import Counter
 
+from pathlib import Path
 
-def read_input(file_name: str) -> Any:
-    """Reads the input from a specified file.
+# Add the parent directory of 'utils' to sys.path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+import utils
+
+input_directory: str = os.path.join(
+    os.path.dirname(
+        os.path.abspath(
+            os.path.dirname(__file__)
+        )
+    ), 'in'
+)
+
+
+def parse_line(line: str) -> Tuple[int, int]:
+    """Parses the two location ids of one input line."""
+    id_a, id_b = line.split()
+    return int(id_a), int(id_b)
+
+
+def process(raw_data: str) -> Any:
+    """Processes the input data.
 
     Args:
-        file_name (str): The name of the input file.
+        raw_data (str): The raw puzzle input.
 
     Returns:
-        Any: Processed data.
+        Any: Both location id columns, sorted.
     """
-    file_path = os.path.join('2024/in', file_name)
-    with open(file_path, 'r', encoding='utf-8') as file:
-        data: List[str] = file.read().strip().splitlines()
-        split_data: List[List[int]] = [
-            list(map(int, line.split())) for line in data]
-        column_a: List[int] = [line[0] for line in split_data]
-        column_b: List[int] = [line[1] for line in split_data]
-        return sorted(column_a), sorted(column_b)
+    split_data: List[Tuple[int, int]] = [
+        parse_line(line) for line in raw_data.splitlines()]
+    column_a: List[int] = [line[0] for line in split_data]
+    column_b: List[int] = [line[1] for line in split_data]
+    return sorted(column_a), sorted(column_b)
 
 
 def solve_part_one(data: List[str]) -> Any:
@@ -69,9 +88,53 @@ def solve_part_two(data: List[str]) -> Any:
     return ANS
 
 
+def solve_stream(records: Iterable[Tuple[int, int]]) -> Tuple[int, int]:
+    """Solves both parts in one pass over the location id pairs.
+
+    Only a histogram of each column is kept, so memory grows with the
+    number of distinct ids rather than with the number of lines. Pairing
+    the smallest ids first (part one) walks both histograms in order.
+
+    Args:
+        records (Iterable[Tuple[int, int]]): Location id pairs.
+
+    Returns:
+        Tuple[int, int]: The answers to part one and part two.
+    """
+    count_a: Counter = Counter()
+    count_b: Counter = Counter()
+    for id_a, id_b in records:
+        count_a[id_a] += 1
+        count_b[id_b] += 1
+
+    distance: int = 0
+    ids_b: Iterator[Tuple[int, int]] = iter(sorted(count_b.items()))
+    id_b, left_b = next(ids_b, (0, 0))
+    for id_a, left_a in sorted(count_a.items()):
+        while left_a:
+            pairs: int = min(left_a, left_b)
+            distance += pairs * abs(id_a - id_b)
+            left_a -= pairs
+            left_b -= pairs
+            if not left_b:
+                id_b, left_b = next(ids_b, (0, 0))
+
+    similarity: int = sum(
+        num * count * count_b[num] for num, count in count_a.items()
+    )
+    return distance, similarity
+
+
 if __name__ == "__main__":
-    input_data = read_input('1.in')
-    result_part_one = solve_part_one(input_data)
+    day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
+    infile, parallel = utils.parse_args(day)
+
+    file_path: str = os.path.join(input_directory, infile)
+    unprocessed_data = utils.read_input(file_path)
+    input_data = process(unprocessed_data['data'])
+
+    result_part_one, result_part_two = utils.run_parts(
+        input_data, [solve_part_one, solve_part_two], parallel
+    )
     print(f"Part One: {result_part_one}")
-    result_part_two = solve_part_two(input_data)
     print(f"Part Two: {result_part_two}")
@@ -6,12 +6,19 @@ The input files are expected to be located in the '2024/in' directory.
 """
 
 import os
-from typing import List, Any, Dict
+from typing import Any, Dict, Iterable, List, Tuple
 from collections import Counter
 
 import sys
 from collections import defaultdict, Counter
 
+from pathlib import Path
+
+# Add the parent directory of 'utils' to sys.path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+import utils  # noqa: E402
+
 input_directory: str = os.path.join(
     os.path.dirname(
         os.path.abspath(
@@ -21,53 +28,9 @@ input_directory: str = os.path.join(
 )
 
 
-def read_input(file_name: str) -> Dict[str, Any]:
-    """Reads input from a specified file and separates metadata for test files.
-
-    Args:
-        file_name (str): Name of the input file (.in or .test)
-
-    Returns:
-        Dict[str, Any]: Dictionary containing:
-            - 'data': Raw string of input data
-            - 'answer_a': Expected answer for part 1 (None for .in files)
-            - 'answer_b': Expected answer for part 2 (None for .in files)
-    """
-    file_path: str = os.path.join(input_directory, file_name)
-    result: Dict[str, Any] = {
-        'data': None,
-        'answer_a': None,
-        'answer_b': None
-    }
-
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content: str = file.read()
-
-        # Handle .test files with metadata
-        if file_name.endswith('.test'):
-            # Find the data section between Example data marker and answer section
-            data_start: int = content.find('Example data')
-            if data_start != -1:
-                data_start = content.find('\n', data_start) + 1
-                data_end: int = content.find('\n-----------------', data_start)
-                if data_end != -1:
-                    result['data'] = content[data_start:data_end].strip()
-
-            # Extract answers if present
-            answer_section: str = content[data_end:] if data_end != -1 else ''
-            for line in answer_section.splitlines():
-                if line.startswith('answer_a:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_a'] = int(ans) if ans != '-' else None
-                elif line.startswith('answer_b:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_b'] = int(ans) if ans != '-' else None
-
-        # Handle regular .in files
-        else:
-            result['data'] = content.strip()
-
-    return result
+def parse_line(line: str) -> List[int]:
+    """Parses the levels of one report."""
+    return list(map(int, line.split()))
 
 
 def process(raw_data: str) -> Any:
@@ -80,11 +43,7 @@ def process(raw_data: str) -> Any:
         Any: Processed data.
     """
     rows: List[str] = raw_data.strip().splitlines()
-    data: List[List[int]] = [
-        list(
-            map(int, row.split())
-        ) for row in rows
-    ]
+    data: List[List[int]] = [parse_line(row) for row in rows]
     return data
 
 
@@ -99,26 +58,67 @@ def is_good(xs):
     return inc_or_dec and ok
 
 
-if __name__ == "__main__":
-    day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+def is_good_dampened(xs: List[int]) -> bool:
+    """Check if a sequence is good once at most one level is removed."""
+    return any(is_good(xs[:j] + xs[j+1:]) for j in range(len(xs)))
 
-    raw_data = read_input(infile)
-    input_data = process(raw_data['data'])
 
-    p1 = 0
-    p2 = 0
-    for row in input_data:
+def solve_part_one(data: List[List[int]]) -> Any:
+    """Solves part one of the challenge.
+
+    Args:
+        data (List[List[int]]): The reports, one list of levels per row.
+
+    Returns:
+        Any: The number of safe reports.
+    """
+    return sum(1 for row in data if is_good(row))
+
+
+def solve_part_two(data: List[List[int]]) -> Any:
+    """Solves part two of the challenge.
+
+    Args:
+        data (List[List[int]]): The reports, one list of levels per row.
+
+    Returns:
+        Any: The number of reports that are safe after removing one level.
+    """
+    return sum(1 for row in data if is_good_dampened(row))
+
+
+def solve_stream(records: Iterable[List[int]]) -> Tuple[int, int]:
+    """Solves both parts in one pass, one report at a time.
+
+    Args:
+        records (Iterable[List[int]]): The reports.
+
+    Returns:
+        Tuple[int, int]: The answers to part one and part two.
+    """
+    p1: int = 0
+    p2: int = 0
+    for row in records:
         if is_good(row):
             p1 += 1
-
-        good = False
-        for j in range(len(row)):
-            subline = row[:j] + row[j+1:]
-            if is_good(subline):
-                good = True
-        if good:
             p2 += 1
+        elif is_good_dampened(row):
+            p2 += 1
+    return p1, p2
+
+
+if __name__ == "__main__":
+    day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
+    infile, parallel = utils.parse_args(day)
+
+    file_path: str = os.path.join(input_directory, infile)
+    raw_data = utils.read_input(file_path)
+    input_data = process(raw_data['data'])
 
-    print(f"Part One: {p1}")
-    print(f"Part Two: {p2}")
+    result_part_one, result_part_two = utils.run_parts(
+        input_data, [solve_part_one, solve_part_two], parallel
+    )
+    if result_part_one is not None:
+        print(f"Part One: {result_part_one}")
+    if result_part_two is not None:
+        print(f"Part Two: {result_part_two}")
@@ -5,10 +5,19 @@ This module provides a structure for solving Advent of Code challenges.
 The input files are expected to be located in the '2024/in' directory.
 """
 
+import functools
 import os
 import sys
-from typing import Optional, Tuple, List, Any, Dict, Set
-import copy
+from typing import Optional, Tuple, List, Any, Dict, Sequence, Set
+
+from pathlib import Path
+
+# Add the parent directory of 'utils' to sys.path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+import utils  # noqa: E402
+from utils.grid import SENTINEL, Grid, GridOverlay  # noqa: E402
+from utils.parallel import fork_parts  # noqa: E402
 
 
 input_directory: str = os.path.join(
@@ -20,209 +29,230 @@ input_directory: str = os.path.join(
 )
 
 
-def read_input(file_name: str) -> Dict[str, Any]:
-    """Reads input from a specified file and separates metadata for test files.
-
-    Args:
-        file_name (str): Name of the input file (.in or .test)
-
-    Returns:
-        Dict[str, Any]: Dictionary containing:
-            - 'data': Raw string of input data
-            - 'answer_a': Expected answer for part 1 (None for .in files)
-            - 'answer_b': Expected answer for part 2 (None for .in files)
+def process(data: str) -> Grid:
+    """Processes the input data into a frozen grid, shared by both parts.
     """
-    file_path: str = os.path.join(input_directory, file_name)
-    result: Dict[str, Any] = {
-        'data': None,
-        'answer_a': None,
-        'answer_b': None
-    }
-
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content: str = file.read()
-
-        # Handle .test files with metadata
-        if file_name.endswith('.test'):
-            # Find the data section between Example data marker and answer
-            # section
-            data_start: int = content.find('Example data')
-            if data_start != -1:
-                data_start = content.find('\n', data_start) + 1
-                data_end: int = content.find('\n-----------------', data_start)
-                if data_end != -1:
-                    result['data'] = content[data_start:data_end].strip()
-
-            # Extract answers if present
-            answer_section: str = content[data_end:] if data_end != -1 else ''
-            for line in answer_section.splitlines():
-                if line.startswith('answer_a:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_a'] = ans if ans != '-' else None
-                elif line.startswith('answer_b:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_b'] = ans if ans != '-' else None
-
-        # Handle regular .in files
-        else:
-            result['data'] = content.strip()
-
-    return result
-
-
-def process(data: str) -> Any:
-    """Processes the input data.
-    """
-    processed_data: List[List[str]] = [
-        list(line.strip()) for line in data.splitlines()
-    ]
+    return Grid.from_text(data).freeze()
 
-    return processed_data
 
-
-def solve_part_one(data: List[List[str]]) -> Any:
+def solve_part_one(data: Grid) -> Any:
     """Solves part one of the challenge.
 
     Args:
-        data (List[List[str]]): The input data for the challenge.
+        data (Grid): The input data for the challenge.
 
     Returns:
-        Any: The result of the solution for part one.
+        Any: The result of the solution for part one, and an overlay of the
+        map with the visited cells marked 'X'.
     """
-    guard_col: Optional[int] = None
-    for i, line in enumerate(data):
-        for j, val in enumerate(line):
-            if val == '^':
-                guard_col = j
-        # What if we have > V < instead of ^?
-        if guard_col is not None:
-            guard_row: int = i
-            break
-
-    rows: int = len(data)
-    cols: int = len(data[0])
-
-    dirr: List[Tuple[int]] = [
-        (-1, 0),  # 0 → ^
-        (0, 1),   # 0 → >
-        (1, 0),   # 0 → v
-        (0, -1)   # 0 → <
-    ]
+    # What if we have > V < instead of ^?
+    guard_pos: int = data.find('^')
+    cells = data.cells
+    offsets: Tuple[int, ...] = data.offsets  # ^ > v <
+    obstacle: int = ord('#')
     guard: int = 0  # Starting direction (^)
-
-    loop_corner = [guard_row, guard_col]
-    loops = [[]]
-
-    while (0 <= guard_row < rows) and (0 <= guard_col < cols):
-        d: Tuple[int, int] = dirr[guard]
-        new_row: int = guard_row + d[0]
-        new_col: int = guard_col + d[1]
-
-        data[guard_row][guard_col] = 'X'
-
-        if not (0 <= new_row < rows and 0 <= new_col < cols):
-            break
-
-        if data[new_row][new_col] == '#':
+    # The input is shared with part two, marks go to an overlay
+    marked: GridOverlay = data.overlay()
+
+    # The guard leaves the map when stepping onto the sentinel border
+    while cells[guard_pos] != SENTINEL:
+        marked[guard_pos] = 'X'
+        new_pos: int = guard_pos + offsets[guard]
+        if cells[new_pos] == obstacle:
             guard = (guard + 1) % 4
-            loop_corner = [new_row, new_col]
-            if len(loops[-1]) < 4:
-                loops[-1].append(loop_corner)
-            else:
-                loops.append([])
-                loops[-1].append(loop_corner)
             continue
+        guard_pos = new_pos
 
-        if len(loops[-1]) == 3:
-            first_corner = loops[-1][0]
-            if (new_row == first_corner[0] or new_col == first_corner[1]):
-                loop_corner = [new_row, new_col]
-                loops[-1].append(loop_corner)
-                loops.append([])
+    ans: int = marked.count('X')
+    return ans, marked
 
-        guard_row = new_row
-        guard_col = new_col
 
-    # Attempt to solve pt2 with pt1
-    # valid_loops: int = len([loop for loop in loops if len(loop) == 4])
+# Jump table entry of a cell from which the guard walks off the map
+EXIT: int = -1
 
-    ans: int = sum(row.count('X') for row in data)
-    return ans, data
+# Fewest candidate obstacles worth forking a process for
+MIN_CHUNK: int = 512
 
+# Processes part two may fork, 1 (no fork) unless asked for with --workers
+WORKERS: int = 1
 
-def solve_part_two(data: List[List[str]]) -> Any:
-    """Solves part two of the challenge.
+
+def jump_tables(data: Grid) -> List[List[int]]:
+    """Precomputes where the guard stops when walking in each direction.
+
+    `tables[d][i]` is the last free cell before the next obstacle when
+    walking in direction `d` from cell `i` (`i` itself when blocked right
+    away), or `EXIT` if the guard walks off the map. Every row and column
+    is filled in one pass against the walking direction, so each entry is
+    the one of the neighbour ahead.
 
     Args:
-        data (List[List[str]]): The input data for the challenge.
+        data (Grid): The map.
 
     Returns:
-        Any: The result of the solution for part one.
+        List[List[int]]: One table per direction, indexed by flat index.
     """
-    # Find guard's starting position
-    guard_start: Optional[Tuple[int, int]] = None
-    rows: int = len(data)
-    cols: int = len(data[0])
-
-    for r in range(rows):
-        for c in range(cols):
-            if data[r][c] == '^':
-                guard_start = (r, c)
-                break
-        if guard_start:
-            break
-
-    loop_count: int = 0
-    # Try placing obstacle at each position
-    for o_r in range(rows):
-        for o_c in range(cols):
-            # Skip existing obstacles and guard's starting position
-            if data[o_r][o_c] in ['#', '^']:
+    cells = data.cells
+    obstacle: int = ord('#')
+    tables: List[List[int]] = []
+    for step in data.offsets:
+        table: List[int] = [EXIT] * len(cells)
+        order = range(len(cells)) if step < 0 else \
+            range(len(cells) - 1, -1, -1)
+        for i in order:
+            if cells[i] == obstacle or cells[i] == SENTINEL:
                 continue
+            ahead: int = cells[i + step]
+            if ahead == obstacle:
+                table[i] = i
+            elif ahead != SENTINEL:
+                table[i] = table[i + step]
+        tables.append(table)
+    return tables
+
+
+def path_candidates(data: Grid) -> List[Tuple[int, int, int]]:
+    """Cells of the original patrol where a new obstacle could go.
 
-            r, c = guard_start
-            d: int = 0  # 0=up, 1=right, 2=down, 3=left
-            seen: Set[Tuple[int, int, int]] = set()
+    An obstacle off the path is never met, so only cells the guard walks
+    through are tried, each once: with the state the guard is in right
+    before first stepping onto it. Up to there the patrol is unchanged,
+    so the walk with the new obstacle starts from that state.
 
-            while True:
-                state: Tuple[int, int, int] = (r, c, d)
-                if state in seen:
-                    loop_count += 1
-                    break
-                seen.add(state)
+    Returns:
+        List[Tuple[int, int, int]]: `(obstacle, position, direction)`.
+    """
+    guard_pos: int = data.find('^')
+    cells = data.cells
+    offsets: Tuple[int, ...] = data.offsets
+    obstacle: int = ord('#')
+    guard: int = 0
+    visited: Set[int] = {guard_pos}
+    candidates: List[Tuple[int, int, int]] = []
+    while True:
+        new_pos: int = guard_pos + offsets[guard]
+        if cells[new_pos] == SENTINEL:
+            return candidates
+        if cells[new_pos] == obstacle:
+            guard = (guard + 1) % 4
+            continue
+        if new_pos not in visited:
+            visited.add(new_pos)
+            candidates.append((new_pos, guard_pos, guard))
+        guard_pos = new_pos
+
+
+def loops_with(
+    tables: List[List[int]],
+    offsets: Tuple[int, ...],
+    width: int,
+    block: int,
+    pos: int,
+    d: int
+) -> bool:
+    """Whether the guard loops once an obstacle is put on `block`.
+
+    The guard jumps from turn to turn with the jump tables. The one new
+    obstacle only changes entries on its own row and column, so they are
+    patched on the fly instead of rebuilding the tables: a jump running
+    through `block` stops right before it.
+
+    Args:
+        tables (List[List[int]]): See `jump_tables`.
+        offsets (Tuple[int, ...]): Flat index step per direction.
+        width (int): Row stride of the grid.
+        block (int): The new obstacle.
+        pos (int): Where the guard starts from.
+        d (int): The direction it faces.
 
-                dr, dc = [(-1, 0), (0, 1), (1, 0), (0, -1)][d]
-                new_r: int = r + dr
-                new_c: int = c + dc
+    Returns:
+        bool: True if the guard walks in a loop.
+    """
+    block_row: int = block // width
+    block_col: int = block % width
+    turns: Set[int] = set()
+    while True:
+        stop: int = tables[d][pos]
+        step: int = offsets[d]
+        if (
+            (block_row == pos // width if d & 1 else block_col == pos % width)
+            and (block - pos) * step > 0
+            and (stop == EXIT or (stop - block) * step >= 0)
+        ):
+            stop = block - step
+        if stop == EXIT:
+            return False
+        # Only the turning points are remembered
+        state: int = stop * 4 + d
+        if state in turns:
+            return True
+        turns.add(state)
+        pos = stop
+        d = (d + 1) % 4
+
+
+def count_loops(
+    tables: List[List[int]],
+    offsets: Tuple[int, ...],
+    width: int,
+    candidates: Sequence[Tuple[int, int, int]]
+) -> int:
+    """Number of candidate obstacles that make the guard loop."""
+    return sum(
+        loops_with(tables, offsets, width, block, pos, d)
+        for block, pos, d in candidates
+    )
+
+
+def solve_part_two(data: Grid, workers: Optional[int] = None) -> Any:
+    """Solves part two of the challenge.
 
-                # Break if guard hits boundary
-                if not (0 <= new_r < rows and 0 <= new_c < cols):
-                    break
+    With more than one worker, the candidates are split across forked
+    processes, which share the jump tables copy-on-write (see
+    `utils.parallel`).
 
-                # Check if guard hits obstacle (existing or new)
-                if data[new_r][new_c] == '#' or \
-                        (new_r == o_r and new_c == o_c):
-                    d = (d + 1) % 4
-                else:
-                    r, c = new_r, new_c
+    Args:
+        data (Grid): The input data for the challenge.
+        workers (Optional[int]): Processes to use, `WORKERS` by default.
 
-    return loop_count
+    Returns:
+        Any: The result of the solution for part two.
+    """
+    tables: List[List[int]] = jump_tables(data)
+    candidates: List[Tuple[int, int, int]] = path_candidates(data)
+    count = functools.partial(count_loops, tables, data.offsets, data.width)
+
+    workers = min(workers or WORKERS,
+                  max(1, len(candidates) // MIN_CHUNK))
+    if workers == 1:
+        return count(candidates)
+    chunks: List[List[Tuple[int, int, int]]] = [
+        candidates[k::workers] for k in range(workers)
+    ]
+    return sum(fork_parts([
+        functools.partial(count, chunk) for chunk in chunks
+    ]))
 
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
-
-    raw_data = read_input(infile)
+    parser = utils.argument_parser(day)
+    parser.add_argument(
+        '--workers', type=int, default=WORKERS,
+        help="spread part two's candidates over this many forked processes"
+    )
+    args = parser.parse_args()
+    WORKERS = args.workers
+    infile, parallel = args.input_file, args.parallel
+
+    file_path: str = os.path.join(input_directory, infile)
+    raw_data = utils.read_input(file_path)
     input_data = process(raw_data['data'])
 
-    # Create separate copies for each part
-    part_one_data = copy.deepcopy(input_data)
-    part_two_data = copy.deepcopy(input_data)
-    # [row[:] for row in input_data]
-
-    result_part_one, marked_data = solve_part_one(part_one_data)
-    result_part_two = solve_part_two(part_two_data)
+    # Both parts share the frozen grid
+    (result_part_one, marked_data), result_part_two = utils.run_parts(
+        input_data, [solve_part_one, solve_part_two], parallel
+    )
 
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
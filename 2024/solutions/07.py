@@ -7,8 +7,18 @@ The input files are expected to be located in the '2024/in' directory.
 
 import os
 import sys
-import copy
-from typing import List, Any, Dict, Union
+import functools
+from typing import (
+    Any, Dict, Iterable, List, Optional, Sequence, Tuple, Union
+)
+
+from pathlib import Path
+
+# Add the parent directory of 'utils' to sys.path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+import utils  # noqa: E402
+from utils.parallel import fork_parts  # noqa: E402
 
 
 input_directory: str = os.path.join(
@@ -20,151 +30,207 @@ input_directory: str = os.path.join(
 )
 
 
-def read_input(file_name: str) -> Dict[str, Any]:
-    """Reads input from a specified file and separates metadata for test files.
-
-    Args:
-        file_name (str): Name of the input file (.in or .test)
-
-    Returns:
-        Dict[str, Any]: Dictionary containing:
-            - 'data': Raw string of input data
-            - 'answer_a': Expected answer for part 1 (None for .in files)
-            - 'answer_b': Expected answer for part 2 (None for .in files)
-    """
-    file_path: str = os.path.join(input_directory, file_name)
-    result: Dict[str, Any] = {
-        'data': None,
-        'answer_a': None,
-        'answer_b': None
-    }
-
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content: str = file.read()
-
-        # Handle .test files with metadata
-        if file_name.endswith('.test'):
-            # Find the data section between Example data marker and answer
-            # section
-            data_start: int = content.find('Example data')
-            if data_start != -1:
-                data_start = content.find('\n', data_start) + 1
-                data_end: int = content.find('\n-----------------', data_start)
-                if data_end != -1:
-                    result['data'] = content[data_start:data_end].strip()
-
-            # Extract answers if present
-            answer_section: str = content[data_end:] if data_end != -1 else ''
-            for line in answer_section.splitlines():
-                if line.startswith('answer_a:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_a'] = ans if ans != '-' else None
-                elif line.startswith('answer_b:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_b'] = ans if ans != '-' else None
-
-        # Handle regular .in files
-        else:
-            result['data'] = content.strip()
-
-    return result
+def parse_line(line: str) -> List[Union[List[int], int]]:
+    """Parses one equation into its test value and its numbers."""
+    separated_line = line.split(": ")
+    num = int(separated_line[0])
+    vals = list(
+        map(
+            int,
+            separated_line[1].split()
+        )
+    )
+    return [num, vals]
 
 
 def process(raw_data: str) -> Any:
     """Processes the input data.
     """
-    processed_data: List[List[Union[List[int], int]]] = []
-    for line in raw_data.splitlines():
-        separated_line = line.split(": ")
-        num = int(separated_line[0])
-        vals = list(
-            map(
-                int,
-                separated_line[1].split()
-            )
-        )
-        processed_data.append(
-            [
-                num,
-                vals
-            ]
-        )
+    processed_data: List[List[Union[List[int], int]]] = [
+        parse_line(line) for line in raw_data.splitlines()
+    ]
 
     return processed_data
 
 
+# Fewest equations worth forking a process for
+MIN_CHUNK: int = 256
+
+# Processes a part may fork, 1 (no fork) unless asked for with --workers
+WORKERS: int = 1
+
+
+def next_power_of_ten(value: int) -> int:
+    """Smallest power of ten above `value`: `a || value` is
+    `a * next_power_of_ten(value) + value`."""
+    power: int = 10
+    while power <= value:
+        power *= 10
+    return power
+
+
 def is_valid(
         target: int,
-        list_of_nums: List[int],
+        list_of_nums: Sequence[int],
         part_2: bool = False) -> bool:
-    """Find Valid sum"""
-    if len(list_of_nums) == 1:
-        return list_of_nums[0] == target
-    n0: int = list_of_nums.pop(0)
-    n1: int = list_of_nums.pop(0)
-
-    if is_valid(target, [n0 + n1] + list_of_nums, part_2):
-        return True
-    if is_valid(target, [n0 * n1] + list_of_nums, part_2):
-        return True
-
-    if part_2:
-        concat_num: int = int(
-            str(n0) + str(n1)
-        )
-        # print(n0, n1, concat_num)
-        if is_valid(target, [concat_num] + list_of_nums, part_2):
-            return True
+    """Whether some operators between the numbers evaluate to the target.
 
+    Operators are applied left to right, so the search runs right to left
+    from the target, undoing the last number at each step, and only keeps
+    the undos that can possibly hold:
+
+    - `*` when the value divides evenly by the number,
+    - `||` (part two) when the value ends with the number's digits,
+      checked with a power of ten rather than strings,
+    - `+` while the value stays non-negative.
+
+    Most branches die on the first check, so long equations are pruned
+    almost entirely instead of exploring all 2^n (3^n) combinations.
+
+    Args:
+        target (int): The test value.
+        list_of_nums (Sequence[int]): The numbers, left unchanged.
+        part_2 (bool): Allow the concatenation operator.
+
+    Returns:
+        bool: True if the equation can be made true.
+    """
+    if not list_of_nums:
+        return False
+    powers: List[int] = [next_power_of_ten(n) for n in list_of_nums] \
+        if part_2 else []
+    # (value still to reach, index of the last number not undone)
+    stack: List[Tuple[int, int]] = [(target, len(list_of_nums) - 1)]
+    while stack:
+        value, i = stack.pop()
+        n: int = list_of_nums[i]
+        if i == 0:
+            if value == n:
+                return True
+            continue
+        if value >= n:
+            stack.append((value - n, i - 1))
+        if n == 0:
+            if value == 0:
+                # Anything times zero
+                return True
+        elif value % n == 0:
+            stack.append((value // n, i - 1))
+        if part_2 and value % powers[i] == n:
+            stack.append((value // powers[i], i - 1))
     return False
 
 
-def solve_part_one(data: List[str]) -> Any:
+def calibration_total(
+    data: Sequence[List[Union[List[int], int]]],
+    part_2: bool = False
+) -> int:
+    """Sum of the test values of the equations that can be made true."""
+    return sum(
+        target for target, list_of_nums in data
+        if is_valid(target, list_of_nums, part_2)
+    )
+
+
+def solve_batch(
+    data: Sequence[List[Union[List[int], int]]],
+    part_2: bool = False,
+    workers: Optional[int] = None
+) -> int:
+    """`calibration_total` with the equations spread across processes.
+
+    Equations are independent, so with more than one worker each forked
+    child (see `utils.parallel`) checks every `workers`-th one.
+
+    Args:
+        data (Sequence[List[Union[List[int], int]]]): The equations.
+        part_2 (bool): Allow the concatenation operator.
+        workers (Optional[int]): Processes to use, `WORKERS` by default.
+
+    Returns:
+        int: The calibration total.
+    """
+    workers = min(workers or WORKERS, max(1, len(data) // MIN_CHUNK))
+    if workers == 1:
+        return calibration_total(data, part_2)
+    return sum(fork_parts([
+        functools.partial(calibration_total, data[k::workers], part_2)
+        for k in range(workers)
+    ]))
+
+
+def solve_part_one(data: Sequence[List[Union[List[int], int]]]) -> int:
     """Solves part one of the challenge.
 
     Args:
-        data (List[str]): The input data for the challenge.
+        data (Sequence[List[Union[List[int], int]]]): The equations, as
+            `[target, numbers]` records from `process`.
 
     Returns:
-        Any: The result of the solution for part one.
+        int: The calibration total for part one.
     """
-    ans: int = 0
-    for target, list_of_nums in data:
-        if is_valid(target, list_of_nums):
-            ans += target
-    return ans
+    return solve_batch(data)
 
 
-def solve_part_two(data: List[str]) -> Any:
+def solve_part_two(data: Sequence[List[Union[List[int], int]]]) -> int:
     """Solves part two of the challenge.
 
     Args:
-        data (List[str]): The input data for the challenge.
+        data (Sequence[List[Union[List[int], int]]]): The equations, as
+            `[target, numbers]` records from `process`.
 
     Returns:
-        Any: The result of the solution for part two.
+        int: The calibration total for part two.
     """
-    ans: int = 0
-    for target, list_of_nums in data:
-        if is_valid(target, list_of_nums, part_2=True):
-            ans += target
-    return ans
+    return solve_batch(data, part_2=True)
+
+
+def solve_stream(
+    records: Iterable[List[Union[List[int], int]]]
+) -> Tuple[int, int]:
+    """Solves both parts in one pass, one equation at a time.
+
+    An equation valid with + and * is valid with || too, so the part two
+    check only runs for the equations part one rejects.
+
+    Args:
+        records (Iterable[List[Union[List[int], int]]]): The equations.
+
+    Returns:
+        Tuple[int, int]: The answers to part one and part two.
+    """
+    ans_one: int = 0
+    ans_two: int = 0
+    for target, list_of_nums in records:
+        if is_valid(target, list_of_nums):
+            ans_one += target
+            ans_two += target
+        elif is_valid(target, list_of_nums, part_2=True):
+            ans_two += target
+    return ans_one, ans_two
 
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
-
-    raw_data = read_input(infile)
+    parser = utils.argument_parser(day)
+    parser.add_argument(
+        '--workers', type=int, default=WORKERS,
+        help='spread the equations over this many forked processes'
+    )
+    args = parser.parse_args()
+    WORKERS = args.workers
+    infile, parallel = args.input_file, args.parallel
+
+    file_path: str = os.path.join(input_directory, infile)
+    raw_data = utils.read_input(file_path)
 
     input_data = process(raw_data['data'])
-    data_part_one = copy.deepcopy(input_data)
-    data_part_two = copy.deepcopy(input_data)
 
-    result_part_one = solve_part_one(data_part_one)
+    # is_valid leaves the equations unchanged, both parts share them
+    result_part_one, result_part_two = utils.run_parts(
+        input_data, [solve_part_one, solve_part_two], parallel
+    )
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
-
-    result_part_two = solve_part_two(data_part_two)
     if result_part_two is not None:
         print(f"Part Two: {result_part_two}")
@@ -5,9 +5,17 @@ This module provides a structure for solving Advent of Code challenges.
 The input files are expected to be located in the '2024/in' directory.
 """
 
+import heapq
 import os
 import sys
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, List, Sequence, Tuple
+
+from pathlib import Path
+
+# Add the parent directory of 'utils' to sys.path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+import utils  # noqa: E402
 
 
 input_directory: str = os.path.join(
@@ -19,165 +27,109 @@ input_directory: str = os.path.join(
 )
 
 
-def read_input(file_name: str) -> Dict[str, Any]:
-    """Reads input from a specified file and separates metadata for test files.
+def process(raw_data: str) -> Any:
+    """Processes the input data.
+    """
+    return list(map(int, raw_data))
+
+
+def file_span_checksum(file_id: int, start: int, length: int) -> int:
+    """Checksum of one file of `length` blocks from `start` on:
+    `file_id * (start + ... + start + length - 1)`."""
+    return file_id * (length * start + length * (length - 1) // 2)
+
+
+def defrag_checksum(disk_map: Sequence[int]) -> int:
+    """Checksum after moving whole files to the leftmost gap that fits.
+
+    Gaps are kept in one min-heap of start positions per gap size (1 to
+    9). A file of length `n` goes to the leftmost of the heads of the
+    heaps for sizes `n` to 9, if that is left of the file; what is left of
+    the gap goes back into the heap of its new size. A move is then
+    O(log n), and nothing is ever scanned or rebuilt. The space a file
+    leaves behind is never reused: every file still to move lies left of
+    it.
+
+    The checksum is added up per file span, the block list is never
+    built.
 
     Args:
-        file_name (str): Name of the input file (.in or .test)
+        disk_map (Sequence[int]): The dense disk map digits.
 
     Returns:
-        Dict[str, Any]: Dictionary containing:
-            - 'data': Raw string of input data
-            - 'answer_a': Expected answer for part 1 (None for .in files)
-            - 'answer_b': Expected answer for part 2 (None for .in files)
+        int: The filesystem checksum.
     """
-    file_path: str = os.path.join(input_directory, file_name)
-    result: Dict[str, Any] = {
-        'data': None,
-        'answer_a': None,
-        'answer_b': None
-    }
-
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content: str = file.read()
-
-        # Handle .test files with metadata
-        if file_name.endswith('.test'):
-            # Find the data section between Example data marker and answer
-            # section
-            data_start: int = content.find('Example data')
-            if data_start != -1:
-                data_start = content.find('\n', data_start) + 1
-                data_end: int = content.find('\n-----------------', data_start)
-                if data_end != -1:
-                    result['data'] = content[data_start:data_end].strip()
-
-            # Extract answers if present
-            answer_section: str = content[data_end:] if data_end != -1 else ''
-            for line in answer_section.splitlines():
-                if line.startswith('answer_a:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_a'] = ans if ans != '-' else None
-                elif line.startswith('answer_b:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_b'] = ans if ans != '-' else None
-
-        # Handle regular .in files
-        else:
-            result['data'] = content.strip()
-
-    return result
+    files: List[Tuple[int, int]] = []
+    gaps: List[List[int]] = [[] for _ in range(10)]
+    position: int = 0
+    for index, length in enumerate(disk_map):
+        if index % 2 == 0:
+            files.append((position, length))
+        elif length:
+            gaps[length].append(position)
+        position += length
+    # Starts were appended in increasing order: every list is a heap
 
+    checksum: int = 0
+    for file_id in range(len(files) - 1, -1, -1):
+        start, length = files[file_id]
+        if not length:
+            continue
+        best_size: int = 0
+        for size in range(length, 10):
+            heap: List[int] = gaps[size]
+            if heap and heap[0] < start:
+                start, best_size = heap[0], size
+        if best_size:
+            heapq.heappop(gaps[best_size])
+            if best_size > length:
+                heapq.heappush(gaps[best_size - length], start + length)
+        checksum += file_span_checksum(file_id, start, length)
+    return checksum
 
-def process(raw_data: str) -> Any:
-    """Processes the input data.
-    """
-    return list(map(int, raw_data))
 
+def compact_checksum(disk_map: Sequence[int]) -> int:
+    """Checksum after moving file blocks one by one to the leftmost gap.
 
-def decrypt_disk(encryption: str) -> List[Optional[int]]:
-    """Decrypt Disk
-    """
-    decrypted_disk_list: List[Optional[int]] = []
-    val: int = 0
-    for position, count in enumerate(encryption):
-        # Ensure count is treated as an integer
-        count: int = int(count)  # Convert count to int
-        if position % 2 == 0:
-            decrypted_disk_list.extend([val] * count)
-            val += 1
-        else:
-            decrypted_disk_list.extend([None] * count)
-    return decrypted_disk_list
-
-
-def tuple_decrypt_disk(encryption: str) -> List[Tuple[int, Optional[int]]]:
-    """Decrypt Disk using Tuples
-    """
-    decrypted_disk_list: List[Tuple[int, Optional[int]]] = []
-    val: int = 0
-    for position, count in enumerate(encryption):
-        # Ensure count is treated as an integer
-        count: int = int(count)  # Convert count to int
-        if position % 2 == 0:
-            decrypted_disk_list.append((count, val))
-            val += 1
-        else:
-            decrypted_disk_list.append((count, None))
-    return decrypted_disk_list
-
-
-def move_file_blocks(dd: List[Optional[int]]) -> List[Optional[int]]:
-    """Moves file blocks
-    """
-    p1, p2 = 0, len(dd) - 1
-    while p1 < p2:
-        if dd[p1] is not None:
-            p1 += 1
-        else:
-            if dd[p2] is None:
-                p2 -= 1
-                continue
-            dd[p1], dd[p2] = dd[p2], dd[p1]
-
-    return dd
-
-
-def defrag(
-    disk: List[Tuple[int, Optional[int]]]
-) -> List[Tuple[int, Optional[int]]]:
-    """ Defrag Disk
-    """
-    p2: int = len(disk) - 1
+    Works on the run-length encoding with two pointers: the files are
+    laid out left to right, and every gap is filled from the tail of the
+    rightmost file not moved yet. Each piece placed adds its span to the
+    checksum arithmetically, so memory stays O(number of runs) instead of
+    one list entry per block.
 
-    while p2 > 0:
-        if disk[p2][1] is None:
-            p2 -= 1
-            continue
-        p1: int = 0
-        while p1 < p2:
-            if disk[p1][1] is not None:
-                p1 += 1
-                continue
-            if disk[p2][0] == disk[p1][0]:
-                disk[p1], disk[p2] = disk[p2], disk[p1]
-                break
-            elif disk[p2][0] < disk[p1][0]:
-                moving_part = disk[p2]
-                still_part = (disk[p1][0] - disk[p2][0], None)
-                empty_part = (disk[p2][0], None)
-                disk = (
-                    disk[:p1] + [moving_part, still_part]
-                    + disk[p1+1:p2] + [empty_part] + disk[p2+1:]
-                )
-                p2 += 1
-                break
-            else:
-                p1 += 1
-
-        p2 -= 1
-    return disk
-
-
-def linearise_disk(
-    tuple_disk: List[Tuple[int, Optional[int]]]
-) -> List[Optional[int]]:
-    """Go from Tuple representation of list of ints"""
-    disk: List[Optional[int]] = []
-    for count, val in tuple_disk:
-        disk.extend([val] * count)
-    return disk
-
-
-def filesystem_checksum(disk: List[Optional[int]]) -> int:
-    """Calculate disk checksum
+    Args:
+        disk_map (Sequence[int]): The dense disk map digits.
+
+    Returns:
+        int: The filesystem checksum.
     """
+    files: Sequence[int] = disk_map[0::2]
+    gaps: Sequence[int] = disk_map[1::2]
+    if not files:
+        return 0
     checksum: int = 0
-
-    for pos, digit in enumerate(disk, start=0):
-        if digit is not None:
-            checksum += pos * int(digit)
-
+    position: int = 0
+    left: int = 0
+    right: int = len(files) - 1
+    remaining: int = files[right]
+    while left < right:
+        checksum += file_span_checksum(left, position, files[left])
+        position += files[left]
+        gap: int = gaps[left]
+        while gap and left < right:
+            moved: int = min(gap, remaining)
+            checksum += file_span_checksum(right, position, moved)
+            position += moved
+            gap -= moved
+            remaining -= moved
+            if not remaining:
+                right -= 1
+                remaining = files[right]
+        left += 1
+    if left == right:
+        # What is left of the last file moved stays where it is, right
+        # after the gap it filled
+        checksum += file_span_checksum(right, position, remaining)
     return checksum
 
 
@@ -190,23 +142,10 @@ def solve_part_one(data: Any) -> Any:
     Returns:
         Any: The result of the solution for part one.
     """
-    decrypted_disk_str: List[Optional[int]] = decrypt_disk(data)
-    cleared_disk_str: List[Optional[int]] = move_file_blocks(
-        decrypted_disk_str
-    )
-    checksum: int = filesystem_checksum(cleared_disk_str)
+    checksum: int = compact_checksum(data)
     return checksum
 
 
-def print_disk(disk: List[Optional[int]]) -> None:
-    """Print disk
-    """
-    disk_str: str = ''.join(
-        [str(digit) if digit is not None else '.' for digit in disk]
-    )
-    print(disk_str)
-
-
 def solve_part_two(data: Any) -> Any:
     """Solves part two of the challenge.
 
@@ -216,23 +155,22 @@ def solve_part_two(data: Any) -> Any:
     Returns:
         Any: The result of the solution for part two.
     """
-    decrypted_disk: List[Tuple[int, Optional[int]]] = tuple_decrypt_disk(data)
-    defragged_disk: List[Tuple[int, Optional[int]]] = defrag(decrypted_disk)
-    linearised_disk: List[Optional[int]] = linearise_disk(defragged_disk)
-    checksum: int = filesystem_checksum(linearised_disk)
+    checksum: int = defrag_checksum(data)
     return checksum
 
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, parallel = utils.parse_args(day)
 
-    unprocessed_data = read_input(infile)
+    file_path: str = os.path.join(input_directory, infile)
+    unprocessed_data = utils.read_input(file_path)
     input_data = process(unprocessed_data['data'])
 
-    result_part_one = solve_part_one(input_data)
+    result_part_one, result_part_two = utils.run_parts(
+        input_data, [solve_part_one, solve_part_two], parallel
+    )
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
-    result_part_two = solve_part_two(input_data)
     if result_part_two is not None:
         print(f"Part Two: {result_part_two}")
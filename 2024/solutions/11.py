@@ -7,7 +7,15 @@ The input files are expected to be located in the '2024/in' directory.
 
 import os
 import sys
-from typing import Any, Dict, List
+from collections import Counter
+from typing import Any, Iterable, List, Tuple
+
+from pathlib import Path
+
+# Add the parent directory of 'utils' to sys.path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+import utils  # noqa: E402
 
 
 input_directory: str = os.path.join(
@@ -19,56 +27,6 @@ input_directory: str = os.path.join(
 )
 
 
-def read_input(file_name: str) -> Dict[str, Any]:
-    """Reads input from a specified file and separates metadata for test files.
-
-    Args:
-        file_name (str): Name of the input file (.in or .test)
-
-    Returns:
-        Dict[str, Any]: Dictionary containing:
-            - 'data': Raw string of input data
-            - 'answer_a': Expected answer for part 1 (None for .in files)
-            - 'answer_b': Expected answer for part 2 (None for .in files)
-    """
-    file_path: str = os.path.join(input_directory, file_name)
-    result: Dict[str, Any] = {
-        'data': None,
-        'answer_a': None,
-        'answer_b': None
-    }
-
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content: str = file.read()
-
-        # Handle .test files with metadata
-        if file_name.endswith('.test'):
-            # Find the data section between Example data marker and answer
-            # section
-            data_start: int = content.find('Example data')
-            if data_start != -1:
-                data_start = content.find('\n', data_start) + 1
-                data_end: int = content.find('\n-----------------', data_start)
-                if data_end != -1:
-                    result['data'] = content[data_start:data_end].strip()
-
-            # Extract answers if present
-            answer_section: str = content[data_end:] if data_end != -1 else ''
-            for line in answer_section.splitlines():
-                if line.startswith('answer_a:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_a'] = ans if ans != '-' else None
-                elif line.startswith('answer_b:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_b'] = ans if ans != '-' else None
-
-        # Handle regular .in files
-        else:
-            result['data'] = content.strip()
-
-    return result
-
-
 def process(raw_data: str) -> Any:
     """Processes the input data.
     """
@@ -80,21 +38,79 @@ def process(raw_data: str) -> Any:
     )
 
 
-def process_stone(stone: int) -> List[int]:
-    """Process a single stone"""
+# 10 ** k at index k, extended on demand by digit_count
+POWERS_OF_TEN: List[int] = [10 ** k for k in range(20)]
+
+
+def digit_count(value: int) -> int:
+    """Number of decimal digits of a non-negative integer, without `str`.
+
+    `bit_length * log10(2)` (1233 / 4096) gives the count, or one too
+    many, which a single comparison with a power of ten settles. 1233 / 4096
+    is slightly below log10(2), so from about 680 bits on the estimate can
+    also come out short; comparisons upwards then make up for it.
+    """
+    if value < 10:
+        return 1
+    estimate: int = (value.bit_length() * 1233 >> 12) + 1
+    while len(POWERS_OF_TEN) <= estimate:
+        POWERS_OF_TEN.append(POWERS_OF_TEN[-1] * 10)
+    if value < POWERS_OF_TEN[estimate - 1]:
+        return estimate - 1
+    while value >= POWERS_OF_TEN[estimate]:
+        estimate += 1
+        if len(POWERS_OF_TEN) <= estimate:
+            POWERS_OF_TEN.append(POWERS_OF_TEN[-1] * 10)
+    return estimate
+
+
+def blink_stone(stone: int) -> Tuple[int, ...]:
+    """The stones one stone turns into after one blink."""
     if stone == 0:
-        yield 1
-    stone_str: str = str(stone)
-    if len(str(stone)) % 2 == 0:  # Even number of digits
-        mid: int = len(str(stone)) // 2
-        yield int(stone_str[:mid])
-        yield int(stone_str[mid:])
-    yield stone * 2024
+        return (1,)
+    digits: int = digit_count(stone)
+    if digits % 2 == 0:
+        return divmod(stone, POWERS_OF_TEN[digits // 2])
+    return (stone * 2024,)
+
 
+def evolve(counts: Counter, blinks: int) -> Counter:
+    """Stone value to count after some blinks.
 
-def blink(stones):
-    """A single step in the blinking process"""
-    return [item for sublist in map(process_stone, stones) for item in sublist]
+    Stones with the same value evolve the same way, so each distinct value
+    is handled once per blink whatever its count. There are only a few
+    thousand distinct values however long the run, which makes thousands
+    of blinks cheap.
+
+    Args:
+        counts (Counter): Stone value to count.
+        blinks (int): Number of blinks.
+
+    Returns:
+        Counter: Stone value to count after the blinks.
+    """
+    for _ in range(blinks):
+        after: Counter = Counter()
+        for stone, count in counts.items():
+            for child in blink_stone(stone):
+                after[child] += count
+        counts = after
+    return counts
+
+
+def count_stones(stones: Iterable[int], blinks: int) -> int:
+    """Number of stones after some blinks.
+
+    All the starting stones are evolved together as one Counter.
+
+    Args:
+        stones (Iterable[int]): The starting stones.
+        blinks (int): Number of blinks.
+
+    Returns:
+        int: The number of stones.
+    """
+    return sum(evolve(Counter(stones), blinks).values())
 
 
 def solve_part_one(data: Any) -> Any:
@@ -106,48 +122,33 @@ def solve_part_one(data: Any) -> Any:
     Returns:
         Any: The result of the solution for part one.
     """
-    current_stone = data.copy()
-    for _ in range(25):
-        current_stone = blink(current_stone)
-    return len(current_stone)
+    return count_stones(data, 25)
+
+
+def solve_part_two(data: Any) -> Any:
+    """Solves part two of the challenge.
+
+    Args:
+        data (Any): The input data for the challenge.
+
+    Returns:
+        Any: The result of the solution for part two.
+    """
+    return count_stones(data, 75)
 
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
-
-    unprocessed_data = read_input(infile)
-    data = process(unprocessed_data['data'])
-
-    DP = {}
-    def solve(x, t):
-        """If we put [x] through [t] steps, how long is the resulting list?"""
-        num_str = str(x)
-        if (x,t) in DP:
-            return DP[(x, t)]
-        if t == 0:
-            ret = 1
-        elif x == 0:
-            ret = solve(1, t-1)
-        elif len(num_str) % 2 == 0 and len(num_str) > 1:
-            num_str = str(x)
-            mid: int = len(num_str) // 2
-            num_left = int(num_str[:mid])
-            num_right = int(num_str[mid:])
-            ret = solve(num_left, t-1) + solve(num_right, t-1)
-        else:
-            ret = solve(x * 2024, t - 1)
-        DP[(x,t)] = ret
-        return ret
-
-    def solve_all(t):
-        return sum(solve(x,t) for x in data)
-
-    result_part_one: int = solve_all(25)
-    result_part_two: int = solve_all(75)
+    infile, parallel = utils.parse_args(day)
+
+    file_path: str = os.path.join(input_directory, infile)
+    unprocessed_data = utils.read_input(file_path)
+    input_data = process(unprocessed_data['data'])
 
+    result_part_one, result_part_two = utils.run_parts(
+        input_data, [solve_part_one, solve_part_two], parallel
+    )
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
     if result_part_two is not None:
         print(f"Part Two: {result_part_two}")
-
@@ -8,7 +8,14 @@ The input files are expected to be located in the '2024/in' directory.
 import os
 import sys
 from typing import Any, Dict, Set, List, Tuple
-import copy
+
+from pathlib import Path
+
+# Add the parent directory of 'utils' to sys.path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+import utils  # noqa: E402
+from utils.grid import Grid  # noqa: E402
 
 
 input_directory: str = os.path.join(
@@ -20,81 +27,30 @@ input_directory: str = os.path.join(
 )
 
 
-def read_input(file_name: str) -> Dict[str, Any]:
-    """Reads input from a specified file and separates metadata for test files.
-
-    Args:
-        file_name (str): Name of the input file (.in or .test)
-
-    Returns:
-        Dict[str, Any]: Dictionary containing:
-            - 'data': Raw string of input data
-            - 'answer_a': Expected answer for part 1 (None for .in files)
-            - 'answer_b': Expected answer for part 2 (None for .in files)
-    """
-    file_path: str = os.path.join(input_directory, file_name)
-    result: Dict[str, Any] = {
-        'data': None,
-        'answer_a': None,
-        'answer_b': None
-    }
-
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content: str = file.read()
-
-        # Handle .test files with metadata
-        if file_name.endswith('.test'):
-            # Find the data section between Example data marker and answer
-            # section
-            data_start: int = content.find('Example data')
-            if data_start != -1:
-                data_start = content.find('\n', data_start) + 1
-                data_end: int = content.find('\n-----------------', data_start)
-                if data_end != -1:
-                    result['data'] = content[data_start:data_end].strip()
-
-            # Extract answers if present
-            answer_section: str = content[data_end:] if data_end != -1 else ''
-            for line in answer_section.splitlines():
-                if line.startswith('answer_a:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_a'] = ans if ans != '-' else None
-                elif line.startswith('answer_b:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_b'] = ans if ans != '-' else None
-
-        # Handle regular .in files
-        else:
-            result['data'] = content.strip()
-
-    return result
-
-
-def process(raw_data: str) -> Any:
-    """Processes the input data.
+def process(raw_data: str) -> Grid:
+    """Processes the input data into a frozen grid.
     """
-    return [
-        list(line) for line in raw_data.splitlines()
-    ]
+    return Grid.from_text(raw_data).freeze()
 
 
-def solve(data: Any) -> Any:
+def solve(data: Grid) -> Any:
     """Solves part one of the challenge.
 
     Args:
-        data (Any): The input data for the challenge.
+        data (Grid): The input data for the challenge.
 
     Returns:
         Any: The result of the solution for part one.
     """
     # Find Regions
     # This is similar to Island problems in Leetcode
-    rows: int = len(data)
-    cols: int = len(data[0])
+    rows: int = data.rows
+    cols: int = data.cols
+    cells: bytes = data.cells
+    offsets: Tuple[int, ...] = data.offsets
 
     regions: Dict = {}
-    visited: Set = set()
-    grid: List[List[str]] = copy.deepcopy(data)
+    visited: bytearray = bytearray(len(cells))
 
     def get_edges(plants: List[Tuple[int, int]],
                   perimeter_points: List[Tuple[int, int]]) -> int:
@@ -180,50 +136,36 @@ def solve(data: Any) -> Any:
         print(f"Total components found: {components}\n")
         return components
 
-    def dfs(i, j, region):
-        if (
-            i < 0 or
-            i >= rows or
-            j < 0 or
-            j >= cols or
-            grid[i][j] != region[0]
-        ):
-            regions[region]["perimeter"] += 1
-            return "Perimeter"
-        elif (i, j) in visited:
-            return "Visited"
-
-        visited.add((i, j))
-        regions[region]["plants"].append((i, j))
-        regions[region]["area"] += 1
-        status = dfs(i+1, j, region)
-        if status == "Perimeter":
-            regions[region]["PerimeterPlants"].append((i+1, j))
-        status = dfs(i-1, j, region)
-        if status == "Perimeter":
-            regions[region]["PerimeterPlants"].append((i-1, j))
-        status = dfs(i, j+1, region)
-        if status == "Perimeter":
-            regions[region]["PerimeterPlants"].append((i, j+1))
-        status = dfs(i, j-1, region)
-        if status == "Perimeter":
-            regions[region]["PerimeterPlants"].append((i, j-1))
-        return
-
-    for r in range(rows):
-        for c in range(cols):
-            if (r, c) not in visited:
-                label: str = grid[r][c]
-                region: Tuple[str, int, int] = (label, r, c)
-
-                regions[region] = {
-                    "plants": [],
-                    "perimeter": 0,
-                    "area": 0,
-                    "PerimeterPlants": []
-                }
-                # use region for differentiate regions with same letter
-                dfs(r, c, region)
+    # Flood fill each region; a neighbour with another plant, or the
+    # sentinel border, is one unit of perimeter
+    for start in data.indices():
+        if visited[start]:
+            continue
+        label: int = cells[start]
+        region: Tuple[str, int, int] = (chr(label), *data.position(start))
+        # use region for differentiate regions with same letter
+        info: Dict[str, Any] = {
+            "plants": [],
+            "perimeter": 0,
+            "area": 0,
+            "PerimeterPlants": []
+        }
+        regions[region] = info
+
+        visited[start] = 1
+        stack: List[int] = [start]
+        while stack:
+            index: int = stack.pop()
+            info["plants"].append(data.position(index))
+            info["area"] += 1
+            for offset in offsets:
+                neighbour: int = index + offset
+                if cells[neighbour] != label:
+                    info["perimeter"] += 1
+                    info["PerimeterPlants"].append(data.position(neighbour))
+                elif not visited[neighbour]:
+                    visited[neighbour] = 1
+                    stack.append(neighbour)
 
     # calc values
     ans: int = 0
@@ -259,9 +201,10 @@ def solve(data: Any) -> Any:
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, _ = utils.parse_args(day)
 
-    unprocessed_data = read_input(infile)
+    file_path: str = os.path.join(input_directory, infile)
+    unprocessed_data = utils.read_input(file_path)
     input_data = process(unprocessed_data['data'])
     result_part_one = solve(input_data)
     if result_part_one is not None:
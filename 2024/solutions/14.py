@@ -5,33 +5,44 @@ This module provides a structure for solving Advent of Code challenges.
 The input files are expected to be located in the '2024/in' directory.
 """
 
+import functools
 import os
 import re
 import sys
 from typing import Any, Dict, Tuple, List, Optional
 from dataclasses import dataclass
-import argparse
-import copy
-
-import numpy as np
-from scipy.fft import fft2, fftshift
-import matplotlib.pyplot as plt
 import zlib
 
+from pathlib import Path
+
+# Add the parent directory of 'utils' to sys.path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+import utils  # noqa: E402
+
+np = utils.lazy_import('numpy')
+scipy_fft = utils.lazy_import('scipy.fft')
+plt = utils.lazy_import('matplotlib.pyplot')
 
-@dataclass
+
+@dataclass(frozen=True)
 class Robot:
-    """Robot class"""
+    """Robot class, immutable so that both parts share the parsed robots"""
     position: Tuple[int, int]
     velocity: Tuple[int, int]
 
-    def move(self, grid_width: int, grid_height: int, steps: int = 1):
-        """Update position after given steps, considering wrapping."""
+    def moved(
+        self,
+        grid_width: int,
+        grid_height: int,
+        steps: int = 1
+    ) -> 'Robot':
+        """The robot after given steps, considering wrapping."""
         x, y = self.position
         vx, vy = self.velocity
         x = (x + vx * steps) % grid_width
         y = (y + vy * steps) % grid_height
-        self.position = (x, y)
+        return Robot((x, y), self.velocity)
 
 
 input_directory: str = os.path.join(
@@ -52,56 +63,6 @@ output_directory: str = os.path.join(
 )
 
 
-def read_input(file_name: str) -> Dict[str, Any]:
-    """Reads input from a specified file and separates metadata for test files.
-
-    Args:
-        file_name (str): Name of the input file (.in or .test)
-
-    Returns:
-        Dict[str, Any]: Dictionary containing:
-            - 'data': Raw string of input data
-            - 'answer_a': Expected answer for part 1 (None for .in files)
-            - 'answer_b': Expected answer for part 2 (None for .in files)
-    """
-    file_path: str = os.path.join(input_directory, file_name)
-    result: Dict[str, Any] = {
-        'data': None,
-        'answer_a': None,
-        'answer_b': None
-    }
-
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content: str = file.read()
-
-        # Handle .test files with metadata
-        if file_name.endswith('.test'):
-            # Find the data section between Example data marker and answer
-            # section
-            data_start: int = content.find('Example data')
-            if data_start != -1:
-                data_start = content.find('\n', data_start) + 1
-                data_end: int = content.find('\n-----------------', data_start)
-                if data_end != -1:
-                    result['data'] = content[data_start:data_end].strip()
-
-            # Extract answers if present
-            answer_section: str = content[data_end:] if data_end != -1 else ''
-            for line in answer_section.splitlines():
-                if line.startswith('answer_a:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_a'] = ans if ans != '-' else None
-                elif line.startswith('answer_b:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_b'] = ans if ans != '-' else None
-
-        # Handle regular .in files
-        else:
-            result['data'] = content.strip()
-
-    return result
-
-
 def process(raw_data: str) -> Any:
     """Processes the input data.
     """
@@ -118,7 +79,16 @@ def process(raw_data: str) -> Any:
             )
         )
 
-    return list_of_robots
+    # The example space is 11x7 tiles, the real one 101x103
+    is_example: bool = all(
+        x < 11 and y < 7 for x, y in (r.position for r in list_of_robots)
+    )
+
+    return utils.freeze({
+        "rows": 7 if is_example else 103,
+        "cols": 11 if is_example else 101,
+        "list_of_robots": list_of_robots
+    })
 
 
 def count_robots_in_quadrants(
@@ -150,8 +120,7 @@ def count_robots_in_quadrants(
 
 def calculate_safety_factor(robots, grid_height, grid_width, steps):
     """Simulate robot movement"""
-    for robot in robots:
-        robot.move(grid_width, grid_height, steps)
+    robots = [robot.moved(grid_width, grid_height, steps) for robot in robots]
 
     q1, q2, q3, q4 = count_robots_in_quadrants(robots, grid_width, grid_height)
 
@@ -167,7 +136,7 @@ def solve_part_one(data: Any) -> Any:
     Returns:
         Any: The result of the solution for part one.
     """
-    list_of_robots: List[Robot] = copy.deepcopy(data["list_of_robots"])
+    list_of_robots: Tuple[Robot, ...] = data["list_of_robots"]
     rows: int = data["rows"]
     cols: int = data["cols"]
     steps: int = 100
@@ -194,7 +163,9 @@ def analyze_pattern(pic: List[List[str]], rows: int, cols: int) -> bool:
             grid[r, c] = 1.0 if pic[r][c] == '#' else 0.0
 
     # Apply 2D FFT
-    fft_result: np.ndarray = fftshift(np.abs(fft2(grid)))
+    fft_result: np.ndarray = scipy_fft.fftshift(
+        np.abs(scipy_fft.fft2(grid))
+    )
 
     # Calculate metrics for pattern detection
     total_energy: float = np.sum(fft_result)
@@ -233,7 +204,9 @@ def visualize_fft(
             grid[r, c] = 1.0 if pic[r][c] == '#' else 0.0
 
     # Compute FFT and shift
-    fft_result: np.ndarray = fftshift(np.abs(fft2(grid)))
+    fft_result: np.ndarray = scipy_fft.fftshift(
+        np.abs(scipy_fft.fft2(grid))
+    )
 
     # Create visualization
     plt.figure(figsize=(15, 5))
@@ -333,9 +306,16 @@ def solve_part_two(data: Any, save_images: bool = False) -> Any:
     Returns:
         Any: The result of the solution for part two.
     """
-    list_of_robots: List[Robot] = copy.deepcopy(data["list_of_robots"])
+    list_of_robots: Tuple[Robot, ...] = data["list_of_robots"]
     rows: int = data["rows"]
     cols: int = data["cols"]
+    # The parsed robots are shared and immutable: step local copies of
+    # their positions in place instead of rebuilding every robot
+    xs: List[int] = [robot.position[0] for robot in list_of_robots]
+    ys: List[int] = [robot.position[1] for robot in list_of_robots]
+    vxs: List[int] = [robot.velocity[0] for robot in list_of_robots]
+    vys: List[int] = [robot.velocity[1] for robot in list_of_robots]
+    robot_range: range = range(len(list_of_robots))
     i: int = 0
     easter_egg_iter_num: Optional[int] = None
     # First horizontal pattern by visual inspection
@@ -354,9 +334,9 @@ def solve_part_two(data: Any, save_images: bool = False) -> Any:
 
         # Update all robot positions
         new_positions: List[Tuple[int, int]] = []
-        for robot in list_of_robots:
-            robot.move(cols, rows)
-            c, r = robot.position
+        for k in robot_range:
+            c = xs[k] = (xs[k] + vxs[k]) % cols
+            r = ys[k] = (ys[k] + vys[k]) % rows
             if 0 <= r < rows and 0 <= c < cols:
                 new_positions.append((r, c))
 
@@ -423,38 +403,26 @@ def save_output_to_file(
 
 
 if __name__ == "__main__":
-    parser: argparse.ArgumentParser = argparse.ArgumentParser(
-        description='Solve Advent of Code Day 14'
-    )
-    parser.add_argument(
-        'input_file',
-        nargs='?',
-        default='14.in',
-        help='Input file name'
-    )
+    day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
+    parser = utils.argument_parser(day)
     parser.add_argument(
         '--save-images',
         action='store_true',
         help='Save FFT visualization images'
     )
-    args: argparse.Namespace = parser.parse_args()
+    args = parser.parse_args()
 
-    day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    input_data: Dict[str, Any] = {
-        "rows": 103,
-        "cols": 101,
-        "list_of_robots": []
-    }
-    if args.input_file.endswith("test"):
-        input_data["rows"] = 7
-        input_data["cols"] = 11
-
-    unprocessed_data = read_input(args.input_file)
-    input_data["list_of_robots"] = process(unprocessed_data['data'])
-
-    result_part_one = solve_part_one(input_data)
+    file_path: str = os.path.join(input_directory, args.input_file)
+    unprocessed_data = utils.read_input(file_path)
+    input_data: Dict[str, Any] = process(unprocessed_data['data'])
+
+    result_part_one, result_part_two = utils.run_parts(
+        input_data,
+        [solve_part_one,
+         functools.partial(solve_part_two, save_images=args.save_images)],
+        args.parallel
+    )
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
-    result_part_two = solve_part_two(input_data, args.save_images)
     if result_part_two is not None:
         print(f"Part Two: {result_part_two}")
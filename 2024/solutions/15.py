@@ -5,13 +5,23 @@ This module provides a structure for solving Advent of Code challenges.
 The input files are expected to be located in the '2024/in' directory.
 """
 
+import functools
 import os
 import sys
 from typing import Any, Dict, List, Optional, Tuple
-import numpy as np
-import cv2
 from collections import deque
 
+from pathlib import Path
+
+# Add the parent directory of 'utils' to sys.path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+import utils  # noqa: E402
+from utils.grid import DOWN, LEFT, RIGHT, UP, Grid  # noqa: E402
+
+np = utils.lazy_import('numpy')
+cv2 = utils.lazy_import('cv2')
+
 
 input_directory: str = os.path.join(
     os.path.dirname(
@@ -31,93 +41,47 @@ output_directory: str = os.path.join(
 )
 
 
-def read_input(file_name: str) -> Dict[str, Any]:
-    """Reads input from a specified file and separates metadata for test files.
+# Direction of each instruction, see `utils.grid`
+MOVES: Dict[str, int] = {"^": UP, ">": RIGHT, "v": DOWN, "<": LEFT}
 
-    Args:
-        file_name (str): Name of the input file (.in or .test)
+WALL: int = ord('#')
+EMPTY: int = ord('.')
+ROBOT: int = ord('@')
+BOX: int = ord('O')
+BOX_LEFT: int = ord('[')
+BOX_RIGHT: int = ord(']')
 
-    Returns:
-        Dict[str, Any]: Dictionary containing:
-            - 'data': Raw string of input data
-            - 'answer_a': Expected answer for part 1 (None for .in files)
-            - 'answer_b': Expected answer for part 2 (None for .in files)
-    """
-    file_path: str = os.path.join(input_directory, file_name)
-    result: Dict[str, Any] = {
-        'data': None,
-        'answer_a': None,
-        'answer_b': None
-    }
 
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content: str = file.read()
-
-        # Handle .test files with metadata
-        if file_name.endswith('.test'):
-            # Find the data section between Example data marker and answer
-            # section
-            data_start: int = content.find('Example data')
-            if data_start != -1:
-                data_start = content.find('\n', data_start) + 1
-                data_end: int = content.find('\n-----------------', data_start)
-                if data_end != -1:
-                    result['data'] = content[data_start:data_end].strip()
-
-            # Extract answers if present
-            answer_section: str = content[data_end:] if data_end != -1 else ''
-            for line in answer_section.splitlines():
-                if line.startswith('answer_a:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_a'] = ans if ans != '-' else None
-                elif line.startswith('answer_b:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_b'] = ans if ans != '-' else None
-
-        # Handle regular .in files
-        else:
-            result['data'] = content.strip()
-
-    return result
-
-
-def enlanrge_warehouse(raw_board: str) -> List[List[str]]:
+def enlanrge_warehouse(raw_board: str) -> Grid:
     """Enlarge warehouse to account for robot and box pushing.
     """
-    transform: Dict[str, List[str]] = {
-        'O': ['[', ']'],
-        '#': ['#', '#'],
-        '.': ['.', '.'],
-        '@': ['@', '.']
+    transform: Dict[str, str] = {
+        'O': '[]',
+        '#': '##',
+        '.': '..',
+        '@': '@.'
     }
 
-    enlarged_board: List[List[str]] = []
-    for line in raw_board.splitlines():
-        enlarged_line: List[str] = []
-        for char in line:
-            enlarged_line.extend(transform.get(char, [char, char]))
-        enlarged_board.append(enlarged_line)
-
-    return enlarged_board
+    return Grid.from_rows(
+        ''.join(transform.get(char, char * 2) for char in line)
+        for line in raw_board.splitlines()
+    )
 
 
 def process(raw_data: str) -> Any:
     """Processes the input data.
+
+    Both boards are frozen; each part moves the boxes on its own copy.
     """
     raw_board, raw_instructions = raw_data.split('\n\n')
-    board: List[List[str]] = [
-        [
-            c for c in line
-        ] for line in raw_board.splitlines()
-    ]
     instructions: List[str] = [
         c for line in raw_instructions.splitlines() for c in line
     ]
 
-    data: Dict[str, List] = {
-        "board": board,
+    data: Dict[str, Any] = {
+        "board": Grid.from_text(raw_board).freeze(),
         "instructions": instructions,
-        "enlarged_board": enlanrge_warehouse(raw_board)
+        "enlarged_board": enlanrge_warehouse(raw_board).freeze()
     }
 
     return data
@@ -125,49 +89,40 @@ def process(raw_data: str) -> Any:
 
 def can_move(
     instruction: str,
-    board: List[List[str]],
-    position: Tuple[int, int]
+    board: Grid,
+    position: int
 ) -> bool:
     """Check if a piece can be moved in the specified direction.
     """
-    moves: Dict[str, Tuple[int, int]] = {
-        "^": (-1, 0),
-        "<": (0, -1),
-        "v": (1, 0),
-        ">": (0, 1)
-    }
-
-    next_pos: Tuple[int, int] = (
-        position[0] + moves[instruction][0],
-        position[1] + moves[instruction][1]
-    )
+    cells = board.cells
+    next_pos: int = position + board.offsets[MOVES[instruction]]
 
     # Wall - cannot move
-    if board[next_pos[0]][next_pos[1]] == '#':
+    if cells[next_pos] == WALL:
         return False
 
     # Empty space - can move
-    if board[next_pos[0]][next_pos[1]] == '.':
+    if cells[next_pos] == EMPTY:
         return True
 
     # Handle box movement
     # Check for both single and multi-character boxes
-    if board[next_pos[0]][next_pos[1]] in ['O', '[', ']', '@']:
+    if cells[next_pos] in (BOX, BOX_LEFT, BOX_RIGHT, ROBOT):
         # Vertical movement
         if instruction in ['^', 'v']:
             # Box with '[' at the start
-            if board[next_pos[0]][next_pos[1]] == '[':
+            if cells[next_pos] == BOX_LEFT:
                 # Check both halves of the box can move vertically
                 left_move: bool = can_move(instruction, board, next_pos)
                 right_move: bool = can_move(
-                    instruction, board, (next_pos[0], next_pos[1]+1))
+                    instruction, board, next_pos + 1)
                 return left_move and right_move
 
             # Box with ']' at the end
-            elif board[next_pos[0]][next_pos[1]] == ']':
+            elif cells[next_pos] == BOX_RIGHT:
                 # Check both halves of the box can move vertically
                 left_move: bool = can_move(
-                    instruction, board, (next_pos[0], next_pos[1]-1))
+                    instruction, board, next_pos - 1)
                 right_move: bool = can_move(instruction, board, next_pos)
                 return left_move and right_move
 
@@ -178,18 +133,18 @@ def can_move(
         # Horizontal movement
         elif instruction == '>':
             # Box with '[' at the start
-            if board[next_pos[0]][next_pos[1]] == '[':
+            if cells[next_pos] == BOX_LEFT:
                 # Other half of the box can move horizontally
                 right_move: bool = can_move(
-                    instruction, board, (next_pos[0], next_pos[1] + 1))
+                    instruction, board, next_pos + 1)
                 return right_move
 
         elif instruction == '<':
             # Box with ']' at the end
-            if board[next_pos[0]][next_pos[1]] == ']':
+            if cells[next_pos] == BOX_RIGHT:
                 # Check both halves of the box can move horizontally
                 left_move: bool = can_move(
-                    instruction, board, (next_pos[0], next_pos[1] - 1))
+                    instruction, board, next_pos - 1)
                 return left_move
 
         # Single character box or robot
@@ -200,97 +155,95 @@ def can_move(
 
 def move_with_bfs(
     instruction: str,
-    board: List[List[str]],
-    position: Tuple[int, int]
-) -> Tuple[List[List[str]], Tuple[int, int]]:
+    board: Grid,
+    position: int
+) -> Tuple[Grid, int]:
     """Move pieces using BFS to handle connected components.
 
     Args:
         instruction (str): Direction to move (^, v, <, >)
-        board (List[List[str]]): Current board state
-        position (Tuple[int, int]): Current position (r,c)
+        board (Grid): Current board state, changed in place
+        position (int): Current flat index of the robot
 
     Returns:
-        Tuple[List[List[str]], Tuple[int, int]]: Updated board and new position
+        Tuple[Grid, int]: Updated board and new position
     """
-    moves: Dict[str, Tuple[int, int]] = {
-        "^": (-1, 0),
-        ">": (0, 1),
-        "v": (1, 0),
-        "<": (0, -1)
-    }
-
-    r, c = position
-    dr, dc = moves[instruction]
+    cells = board.cells
+    step: int = board.offsets[MOVES[instruction]]
+    target: int = position + step
 
     # Check if next position is wall
-    if board[r + dr][c + dc] == '#':
+    if cells[target] == WALL:
         return board, position
 
     # If next position is empty, just move
-    if board[r + dr][c + dc] == '.':
-        board[r + dr][c + dc] = '@'
-        board[r][c] = '.'
-        return board, (r + dr, c + dc)
+    if cells[target] == EMPTY:
+        cells[target] = ROBOT
+        cells[position] = EMPTY
+        return board, target
 
     # If we hit a box or part of box, do BFS
-    if board[r + dr][c + dc] in ['[', ']', 'O']:
-        queue: deque = deque([(r, c)])
+    if cells[target] in (BOX_LEFT, BOX_RIGHT, BOX):
+        queue: deque = deque([position])
         seen: set = set()
         can_move: bool = True
 
         # First phase: BFS to check if movement is possible
         while queue:
-            rr, cc = queue.popleft()
-            if (rr, cc) in seen:
+            index: int = queue.popleft()
+            if index in seen:
                 continue
-            seen.add((rr, cc))
+            seen.add(index)
 
-            rrr, ccc = rr + dr, cc + dc
+            ahead: int = index + step
 
             # Hit a wall - movement impossible
-            if board[rrr][ccc] == '#':
+            if cells[ahead] == WALL:
                 can_move = False
                 break
 
             # Add connected box parts to queue
-            if board[rrr][ccc] in ['O', '[', ']']:
-                queue.append((rrr, ccc))
+            if cells[ahead] in (BOX, BOX_LEFT, BOX_RIGHT):
+                queue.append(ahead)
 
                 # Handle two-part boxes
-                if board[rrr][ccc] == '[':
-                    assert board[rrr][ccc + 1] == ']'
-                    queue.append((rrr, ccc + 1))
-                elif board[rrr][ccc] == ']':
-                    assert board[rrr][ccc - 1] == '['
-                    queue.append((rrr, ccc - 1))
+                if cells[ahead] == BOX_LEFT:
+                    assert cells[ahead + 1] == BOX_RIGHT
+                    queue.append(ahead + 1)
+                elif cells[ahead] == BOX_RIGHT:
+                    assert cells[ahead - 1] == BOX_LEFT
+                    queue.append(ahead - 1)
 
         # If movement is impossible, return unchanged
         if not can_move:
             return board, position
 
-        # Second phase: Move all pieces
+        # Second phase: Move all pieces, front ones first
         while seen:
-            # Sort to ensure consistent movement
-            movable = []
-            for rr, cc in sorted(seen):
-                rrr, ccc = rr + dr, cc + dc
-                if (rrr, ccc) not in seen:
-                    movable.append((rr, cc))
+            movable: List[int] = [
+                index for index in seen if index + step not in seen
+            ]
 
             # Move pieces that can move
-            for rr, cc in movable:
-                rrr, ccc = rr + dr, cc + dc
-                assert board[rrr][ccc] == '.'
-                board[rrr][ccc] = board[rr][cc]
-                board[rr][cc] = '.'
-                seen.remove((rr, cc))
+            for index in movable:
+                assert cells[index + step] == EMPTY
+                cells[index + step] = cells[index]
+                cells[index] = EMPTY
+                seen.remove(index)
 
-        return board, (r + dr, c + dc)
+        return board, target
 
     return board, position
 
 
+def gps_total(board: Grid, box: int) -> int:
+    """Sum of the GPS coordinates of every `box` cell."""
+    return sum(
+        calculate_coordinate_value(board.position(index))
+        for index in board.find_all(box)
+    )
+
+
 def calculate_coordinate_value(position: Tuple[int, int]) -> int:
     """Calculates the GPS coordinate value based on the position.
     """
@@ -308,20 +261,11 @@ def solve_part_one(data: Any) -> Any:
         Any: The result of the solution for part one.
     """
     # setup
-    board: List[List[str]] = data["board"]
+    board: Grid = data["board"].copy()
     instructions: List[str] = data["instructions"]
 
-    rows: int = len(board)
-    cols: int = len(board[0])
-
     # find position
-    robot_position: Optional[Tuple[int, int]] = None
-
-    for r in range(rows):
-        for c in range(cols):
-            if board[r][c] == "@":
-                robot_position = (r, c)
-                break
+    robot_position: Optional[int] = board.find(ROBOT)
 
     if robot_position is None:
         return None
@@ -330,29 +274,18 @@ def solve_part_one(data: Any) -> Any:
     for instr in instructions:
         board, robot_position = move_with_bfs(instr, board, robot_position)
 
-    ans: int = 0
     # calculate GPS coordinates
-    for r in range(rows):
-        for c in range(cols):
-            if board[r][c] == 'O':
-                ans += calculate_coordinate_value((r, c))
-
-    return ans
+    return gps_total(board, BOX)
 
 
-def print_board(board: List[List[str]]) -> None:
+def print_board(board: Grid) -> None:
     """Prints the board.
     """
-    rows: int = len(board)
-
-    for r in range(rows):
-        print("".join(board[r]))
-
-    return
+    print(board)
 
 
 def create_ascii_video(
-    board_history: List[List[List[str]]],
+    board_history: List[List[str]],
     instructions: List[str],
     output_file: str = 'board_animation.mp4',
     font_scale: float = 0.5,
@@ -361,7 +294,8 @@ def create_ascii_video(
     """Create a video from ASCII board states using OpenCV.
 
     Args:
-        board_history (List[List[List[str]]]): List of board states to animate.
+        board_history (List[List[str]]): Rows of each board state to
+            animate.
         instructions (List[str]): List of movement instructions.
         output_file (str, optional): Path to save the output video.
         font_scale (float, optional): Font scale for rendering. Defaults to 0.5.
@@ -428,35 +362,26 @@ def create_ascii_video(
     out.release()
 
 
-def solve_part_two(data: Any, infile: str) -> Any:
+def solve_part_two(data: Any, infile: Optional[str] = None) -> Any:
     """Solves part two of the challenge.
 
     Args:
         data (List[str]): The input data for the challenge.
-        infile (str): Name of the input file being processed.
+        infile (Optional[str]): Name of the input file being processed. The
+            board animation is only rendered when it is given.
 
     Returns:
         Any: The result of the solution for part two.
     """
     # setup
-    board: List[List[str]] = data["enlarged_board"]
+    board: Grid = data["enlarged_board"].copy()
     instructions: List[str] = data["instructions"]
 
-    rows: int = len(board)
-    cols: int = len(board[0])
-
-    # Track board history for animation
-    board_history: List[List[List[str]]] = [
-        [row.copy() for row in board]
-    ]
+    # Track board history for animation, only when it is rendered
+    board_history: List[List[str]] = [board.lines()]
 
     # find position
-    robot_position: Optional[Tuple[int, int]] = None
-
-    for r in range(rows):
-        for c in range(cols):
-            if board[r][c] == "@":
-                robot_position = (r, c)
+    robot_position: Optional[int] = board.find(ROBOT)
 
     if robot_position is None:
         return None
@@ -464,39 +389,38 @@ def solve_part_two(data: Any, infile: str) -> Any:
     # simulate movements
     for instr in instructions:
         board, robot_position = move_with_bfs(instr, board, robot_position)
-        # Create a deep copy of the board for history
-        board_history.append([row.copy() for row in board])
+        if infile is not None:
+            board_history.append(board.lines())
 
-    # Create output filename based on input file
-    prefix: str = 'day15_test_' if '.test' in infile else 'day15_'
-    output_file: str = os.path.join(output_directory, f'{prefix}board_animation.mp4')
+    if infile is not None:
+        # Create output filename based on input file
+        prefix: str = 'day15_test_' if '.test' in infile else 'day15_'
+        output_file: str = os.path.join(output_directory, f'{prefix}board_animation.mp4')
 
-    # Ensure output directory exists
-    os.makedirs(output_directory, exist_ok=True)
+        # Ensure output directory exists
+        os.makedirs(output_directory, exist_ok=True)
 
-    # Create ASCII video
-    create_ascii_video(board_history, instructions, output_file)
+        # Create ASCII video
+        create_ascii_video(board_history, instructions, output_file)
 
-    ans: int = 0
     # calculate GPS coordinates
-    for r in range(rows):
-        for c in range(cols):
-            if board[r][c] == '[':
-                ans += calculate_coordinate_value((r, c))
-
-    return ans
+    return gps_total(board, BOX_LEFT)
 
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, parallel = utils.parse_args(day)
 
-    unprocessed_data = read_input(infile)
+    file_path: str = os.path.join(input_directory, infile)
+    unprocessed_data = utils.read_input(file_path)
     input_data = process(unprocessed_data['data'])
 
-    result_part_one = solve_part_one(input_data)
+    result_part_one, result_part_two = utils.run_parts(
+        input_data,
+        [solve_part_one, functools.partial(solve_part_two, infile=infile)],
+        parallel
+    )
     if result_part_one is not None:
         print(f"Part One: {result_part_one}")
-    result_part_two = solve_part_two(input_data, infile)
     if result_part_two is not None:
         print(f"Part Two: {result_part_two}")
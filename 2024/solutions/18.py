@@ -5,11 +5,19 @@ This module provides a structure for solving Advent of Code challenges.
 The input files are expected to be located in the '2024/in' directory.
 """
 
-from collections import deque
 import os
 import sys
-from typing import Any, Deque, Dict, List, Optional, Set, Tuple
-import copy
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from pathlib import Path
+
+# Add the parent directory of 'utils' to sys.path
+sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
+
+import utils  # noqa: E402
+from utils import search  # noqa: E402
+from utils.grid import Grid  # noqa: E402
+from utils.search import SearchResult  # noqa: E402
 
 
 input_directory: str = os.path.join(
@@ -21,56 +29,6 @@ input_directory: str = os.path.join(
 )
 
 
-def read_input(file_name: str) -> Dict[str, Any]:
-    """Reads input from a specified file and separates metadata for test files.
-
-    Args:
-        file_name (str): Name of the input file (.in or .test)
-
-    Returns:
-        Dict[str, Any]: Dictionary containing:
-            - 'data': Raw string of input data
-            - 'answer_a': Expected answer for part 1 (None for .in files)
-            - 'answer_b': Expected answer for part 2 (None for .in files)
-    """
-    file_path: str = os.path.join(input_directory, file_name)
-    result: Dict[str, Any] = {
-        'data': None,
-        'answer_a': None,
-        'answer_b': None
-    }
-
-    with open(file_path, 'r', encoding='utf-8') as file:
-        content: str = file.read()
-
-        # Handle .test files with metadata
-        if file_name.endswith('.test'):
-            # Find the data section between Example data marker and answer
-            # section
-            data_start: int = content.find('Example data')
-            if data_start != -1:
-                data_start = content.find('\n', data_start) + 1
-                data_end: int = content.find('\n-----------------', data_start)
-                if data_end != -1:
-                    result['data'] = content[data_start:data_end].strip()
-
-            # Extract answers if present
-            answer_section: str = content[data_end:] if data_end != -1 else ''
-            for line in answer_section.splitlines():
-                if line.startswith('answer_a:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_a'] = ans if ans != '-' else None
-                elif line.startswith('answer_b:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_b'] = ans if ans != '-' else None
-
-        # Handle regular .in files
-        else:
-            result['data'] = content.strip()
-
-    return result
-
-
 def process(raw_data: str) -> Any:
     """Processes the input data.
     """
@@ -83,9 +41,41 @@ def process(raw_data: str) -> Any:
                 )
             ) for line in raw_data.splitlines()
     ]
+    # The example memory space is 7x7 (0 to 6), the real one 71x71
+    if max(max(coordinate) for coordinate in data['coordinates']) <= 6:
+        data['rows'] = 7
+        data['cols'] = 7
+        data['threshold'] = 12
+    else:
+        data['rows'] = 71
+        data['cols'] = 71
+        data['threshold'] = 1024
     return data
 
 
+def shortest_path(grid: Grid, start: int, end: int) -> Optional[List[int]]:
+    """Breadth-First Search, the path from start to end or None if the exit
+    is cut off.
+    """
+    cells = grid.cells
+    offsets: Tuple[int, ...] = grid.offsets
+    free: int = ord('.')
+    if cells[start] != free or cells[end] != free:
+        return None
+
+    def neighbours(i: int) -> List[int]:
+        # Corrupted bytes and the sentinel border are both not free
+        return [i + offset for offset in offsets if cells[i + offset] == free]
+
+    result: SearchResult = search.bfs(
+        len(cells), [start], neighbours, goal=lambda i: i == end,
+        parents=True
+    )
+    if result.goal is None:
+        return None
+    return result.path()
+
+
 def solve(data: Any) -> Any:
     """Solves part one of the challenge.
 
@@ -99,118 +89,43 @@ def solve(data: Any) -> Any:
     rows: int = data['rows']
     coordinates: List[Tuple[int, int]] = data['coordinates']
     threshold: int = data['threshold']
-    grid : List[List[str]] = [['.' for _ in range(cols)] for _ in range(rows)]
-
-    for i, coordinate in enumerate(coordinates):
-        x: int = coordinate[0]
-        y: int = coordinate[1]
-        grid[y][x] = '#'
-        if i + 1 == threshold:
-            break
-
-     # for line in grid:
-     #    print("".join(line))
-
-
-    def bfs(
-        grid: List[List[str]],
-        start: Tuple[int, int],
-        end: Tuple[int, int]
-    ) -> Tuple[int, Optional[List[Tuple[int, int]]]]:
-        """Breadth-First Search"""
-        directions = [(0, 1), (1, 0), (0, -1), (-1, 0)]
-        rows, cols = len(grid), len(grid[0])
-        if (
-            grid[start[1]][start[0]] == '#' or # x, y coordinate system
-            grid[end[1]][end[0]] == '#'
-        ):
-            return -1, None
-        queue: Deque[Tuple[Tuple[int, int], int]] = deque([(start, 0)])
-        visited = set()
-        parent: Dict[Tuple[int, int], Tuple[int, int]] = {}
-        visited.add(start)
-
-
-        while queue:
-            coordinate, steps = queue.popleft()
-
-            r, c = coordinate
-
-            # Have we reached the end?
-            if (r, c) == end:
-                path = []
-                current = end
-                while current != start:
-                    path.append(current)
-                    current = parent[current]
-                path.append(start)
-                path.reverse()
-                return steps, path
-
-            # Erplore neighbors
-            for dr, dc in directions:
-                nr: int = r + dr
-                nc: int = c + dc
-
-                # Check bounds
-                if (
-                    0 <= nr < rows and
-                    0 <= nc < cols and
-                    (nr, nc) not in visited and
-                    grid[nr][nc] != '#'
-                ):
-                    visited.add((nr, nc))
-                    parent[(nr, nc)] = (r, c)
-                    queue.append(((nr, nc), steps + 1))
-        return -1, None  # Path not found
-
-    shortest_path_steps, path = \
-        bfs(grid, (0,0), (cols-1, rows-1))  # from x,y to r,c
-
-    if path is None:
-        return shortest_path_steps, None
+    grid: Grid = Grid.filled(rows, cols, '.')
 
-    printable_grid = copy.deepcopy(grid)
+    for x, y in coordinates[:threshold]:
+        grid[grid.index(y, x)] = '#'  # x, y coordinate system
 
-    for i, coordinate in enumerate(list(path)):
-        r: int = coordinate[0]
-        c: int = coordinate[1]
-        printable_grid[r][c] = 'O'
+    start: int = grid.index(0, 0)
+    end: int = grid.index(rows - 1, cols - 1)
+    path: Optional[List[int]] = shortest_path(grid, start, end)
 
-    #     print()
-    #     for line in grid:
-    #         print("".join(line))
-    #     print()
-    #     for line in printable_grid:
-    #         print("".join(line))
-
-
-    # Place bytes one by one and check if the exit becomes unreachable
-    for i, (x, y) in enumerate(coordinates[threshold:]):
-        grid[y][x] = '#'  # Corrupt the memory at this coordinate
-
-        # Check if the path is blocked
-        shortest_path_len, _ = bfs(grid, (0, 0), (cols - 1, rows - 1))
-        if shortest_path_len < 0:
-             return shortest_path_steps, f"{x},{y}"
+    if path is None:
+        return -1, None
+    shortest_path_steps: int = len(path) - 1
+
+    # Place bytes one by one and check if the exit becomes unreachable. The
+    # path only has to be searched again when a byte falls onto it.
+    on_path: Set[int] = set(path)
+    for x, y in coordinates[threshold:]:
+        i: int = grid.index(y, x)
+        grid[i] = '#'  # Corrupt the memory at this coordinate
+        if i not in on_path:
+            continue
+
+        path = shortest_path(grid, start, end)
+        if path is None:
+            return shortest_path_steps, f"{x},{y}"
+        on_path = set(path)
 
     return shortest_path_steps, None
 
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, _ = utils.parse_args(day)
 
-    unprocessed_data = read_input(infile)
+    file_path: str = os.path.join(input_directory, infile)
+    unprocessed_data = utils.read_input(file_path)
     input_data = process(unprocessed_data['data'])
-    if 'test' in infile:
-        input_data['rows'] = 7  # from 0 to 6 both included
-        input_data['cols'] = 7
-        input_data['threshold'] = 12
-    else:
-        input_data['rows'] = 71  # from 0 to 70 both included
-        input_data['cols'] = 71
-        input_data['threshold'] = 1024
 
     result_part_one, result_part_two = solve(input_data)
     if result_part_one is not None:
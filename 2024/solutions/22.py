@@ -5,9 +5,10 @@ This file provides secret_num structure for solving Advent of Code challenges.
 The input files are expected to be located in the 'YYYY/in' directory.
 """
 
+from collections import defaultdict
 import os
 import sys
-from typing import Any, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from pathlib import Path
 
@@ -25,12 +26,17 @@ input_directory: str = os.path.join(
 )
 
 
+def parse_line(line: str) -> int:
+    """Parses the initial secret number of one buyer."""
+    return int(line)
+
+
 def process(raw_data: str) -> Any:
     """Processes the input data.
     """
     return list(
         map(
-            int,
+            parse_line,
             raw_data.splitlines()
         )
     )
@@ -42,6 +48,16 @@ def solve(data: Any) -> Any:
     if data is None:
         return None
 
+    return solve_stream(data)
+
+
+def solve_stream(records: Iterable[int]) -> Tuple[int, int]:
+    """Solves both parts in one pass, one buyer at a time.
+
+    Bananas are summed per pattern as buyers go by, so memory is bounded by
+    the 19^4 possible patterns whatever the number of buyers.
+    """
+
     def mix(secret_num: int, new_num: int) -> int:
         """Mix two number using XOR
         """
@@ -53,10 +69,10 @@ def solve(data: Any) -> Any:
         return secret_num % pruning_num
 
     part_one_ans: int = 0
-    # Pattern -> List of prices (one per buyer)
-    pattern_scores: dict[tuple[int, ...], list[int]] = {}
+    # Pattern -> Total price over the buyers seen so far
+    pattern_sums: Dict[Tuple[int, ...], int] = defaultdict(int)
 
-    for start_num in data:
+    for start_num in records:
         # Generate sequence
         nums: list[int] = [start_num]
         current_num: int = start_num
@@ -81,14 +97,7 @@ def solve(data: Any) -> Any:
             pattern = tuple(changes[i:i+4])
             if pattern not in seen_patterns:  # Only record first occurrence
                 seen_patterns.add(pattern)
-                if pattern not in pattern_scores:
-                    pattern_scores[pattern] = [prices[i+4]]  # Start new list
-                else:
-                    pattern_scores[pattern].append(
-                        prices[i+4])  # Add to existing list
-
-    pattern_sums = {pattern: sum(prices)
-                    for pattern, prices in pattern_scores.items()}
+                pattern_sums[pattern] += prices[i+4]
 
     part_two_ans: int = max(pattern_sums.values())
     return part_one_ans, part_two_ans
@@ -96,7 +105,7 @@ def solve(data: Any) -> Any:
 
 if __name__ == "__main__":
     day: str = __file__.rsplit('/', maxsplit=1)[-1].replace('.py', '')
-    infile = sys.argv[1] if len(sys.argv) >= 2 else f'{day}.in'
+    infile, _ = utils.parse_args(day)
 
     file_path: str = os.path.join(input_directory, infile)
     unprocessed_data = utils.read_input(file_path)
@@ -1,4 +1,22 @@
+from .cache import cached
+from .frozen import FrozenDict, freeze, is_frozen
 from .get_input import read_input
+from .grid import Grid
+from .lazy import lazy_import
+from .loader import PuzzleInput, load_input
+from .parallel import argument_parser, parse_args, run_parts
 
-__all__ = ['read_input']
-
+__all__ = [
+    'FrozenDict',
+    'Grid',
+    'PuzzleInput',
+    'argument_parser',
+    'cached',
+    'freeze',
+    'is_frozen',
+    'lazy_import',
+    'load_input',
+    'parse_args',
+    'read_input',
+    'run_parts',
+]
@@ -0,0 +1,343 @@
+"""
+Benchmark the solutions of a year against a saved baseline.
+
+Every day's `process` and solve functions are timed over a number of
+repetitions after a few warmup runs. Min, median and p95 are reported per
+stage. Medians are compared with a baseline file and the command exits with
+status 1 when a stage got slower than its baseline by more than a threshold.
+With `--memory` each stage also runs once under tracemalloc and its peak
+traced memory is held against the baseline with the same threshold.
+
+Usage:
+    python -m utils.benchmark 2024 --save-baseline
+    python -m utils.benchmark 2024 --days 6 14 --threshold 15
+    python -m utils.benchmark 2024 --memory
+"""
+import argparse
+import contextlib
+import io
+import json
+import math
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .frozen import copy_for_part
+from .get_input import read_input
+from .memory import traced_call
+from .runner import (
+    discover_days,
+    input_path,
+    load_solution,
+    parse,
+    solution_parts,
+    year_directory,
+)
+
+__all__ = [
+    'baseline_key',
+    'benchmark_day',
+    'compare_with_baseline',
+    'summarise',
+]
+
+
+def baseline_key(day: int, input_name: str) -> str:
+    """Baseline entry of a day on one input file, e.g. `6/06.in`.
+
+    Timings only compare on the same input, so a stress input never meets
+    the baseline of the real one.
+    """
+    return f'{day}/{input_name}'
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """Nearest-rank percentile of a list of samples."""
+    ordered: List[float] = sorted(samples)
+    rank: int = max(1, math.ceil(fraction * len(ordered)))
+    return ordered[rank - 1]
+
+
+def summarise(samples: List[float]) -> Dict[str, float]:
+    """Reduces timing samples to min, median and p95 (in seconds)."""
+    return {
+        'min': min(samples),
+        'median': statistics.median(samples),
+        'p95': percentile(samples, 0.95),
+    }
+
+
+def time_repeated(
+    func: Callable[[Any], Any],
+    data: Any,
+    repeat: int,
+    warmup: int
+) -> List[float]:
+    """Times `func(copy_of_data)` over `repeat` runs after `warmup` runs.
+
+    The input is deep copied before each run, outside of the timed region,
+    since some solutions mutate their input. Frozen inputs are shared.
+    """
+    samples: List[float] = []
+    for i in range(warmup + repeat):
+        arg: Any = copy_for_part(data)
+        start: float = time.perf_counter()
+        func(arg)
+        elapsed: float = time.perf_counter() - start
+        if i >= warmup:
+            samples.append(elapsed)
+    return samples
+
+
+def peak_kb(func: Callable[[Any], Any], data: Any) -> int:
+    """Peak traced memory of one `func(copy_of_data)` run, in KiB."""
+    arg: Any = copy_for_part(data)
+    return traced_call(lambda: func(arg), top=0)[1] // 1024
+
+
+def benchmark_day(
+    year: int,
+    day: int,
+    repeat: int = 5,
+    warmup: int = 1,
+    infile: Optional[str] = None,
+    cache: bool = False,
+    memory: bool = False
+) -> Dict[str, Any]:
+    """Benchmarks every stage of a day.
+
+    Args:
+        year (int): Puzzle year.
+        day (int): Puzzle day.
+        repeat (int): Timed runs per stage.
+        warmup (int): Untimed runs per stage before timing.
+        infile (Optional[str]): Input file name, `NN.in` by default.
+        cache (bool): Time loading the parsed input from the on-disk cache
+            instead of parsing it.
+        memory (bool): Also record the peak traced memory of each stage as
+            `peak_kb` in its stats.
+
+    Returns:
+        Dict[str, Any]: `{'day', 'input', 'stages': {stage: stats},
+        'error'}`, `input` being the input file name.
+    """
+    path: str = input_path(year, day, infile)
+    result: Dict[str, Any] = {
+        'day': day, 'input': os.path.basename(path), 'stages': {},
+        'error': None
+    }
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            module: ModuleType = load_solution(year, day)
+            raw_data: Optional[str] = read_input(path)['data']
+
+            data: Any = raw_data
+            if callable(getattr(module, 'process', None)):
+                data = parse(module, raw_data, cache)[0]
+                stages: List[Tuple[str, Callable[[Any], Any], Any]] = [(
+                    'process', lambda raw: parse(module, raw, cache), raw_data
+                )]
+            else:
+                stages = []
+            stages += [
+                (name, func, data) for name, func in solution_parts(module)
+            ]
+
+            for name, func, arg in stages:
+                stats: Dict[str, Any] = summarise(
+                    time_repeated(func, arg, repeat, warmup)
+                )
+                if memory:
+                    stats['peak_kb'] = peak_kb(func, arg)
+                result['stages'][name] = stats
+    except Exception as error:  # pylint: disable=broad-except
+        result['error'] = f'{type(error).__name__}: {error}'
+    return result
+
+
+def _benchmark_day_task(
+    args: Tuple[int, int, int, int, Optional[str], bool, bool]
+) -> Dict[str, Any]:
+    """Pool entry point for `benchmark_day`."""
+    return benchmark_day(*args)
+
+
+def compare_with_baseline(
+    results: List[Dict[str, Any]],
+    baseline: Dict[str, Dict[str, Dict[str, float]]],
+    threshold: float,
+    min_time: float = 0.0,
+    min_kb: int = 0
+) -> List[Tuple[int, str, str, float, float]]:
+    """Finds stages whose median time or peak memory grew by > threshold %.
+
+    Args:
+        results (List[Dict[str, Any]]): Output of `benchmark_day`.
+        baseline (Dict): `{baseline_key: {stage: stats}}` as saved by
+            this module.
+        threshold (float): Allowed growth in percent.
+        min_time (float): Medians below this many seconds are timer noise
+            and never count as a regression.
+        min_kb (int): Same floor for peak memory, in KiB.
+
+    Returns:
+        List[Tuple[int, str, str, float, float]]: `(day, stage, metric, old,
+        new)` of every regression, metric being 'median' or 'peak_kb'.
+    """
+    floors: Dict[str, float] = {'median': min_time, 'peak_kb': min_kb}
+    regressions: List[Tuple[int, str, str, float, float]] = []
+    for result in results:
+        old_stages: Dict[str, Dict[str, float]] = baseline.get(
+            baseline_key(result['day'], result['input']), {}
+        )
+        for stage, stats in result['stages'].items():
+            if stage not in old_stages:
+                continue
+            for metric, floor in floors.items():
+                if metric not in stats or metric not in old_stages[stage]:
+                    continue
+                old: float = old_stages[stage][metric]
+                new: float = stats[metric]
+                if new < floor:
+                    continue
+                if new > old * (1 + threshold / 100):
+                    regressions.append(
+                        (result['day'], stage, metric, old, new)
+                    )
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Benchmark solutions against a baseline'
+    )
+    parser.add_argument('year', type=int, help='Puzzle year')
+    parser.add_argument(
+        '--days', type=int, nargs='+', help='Days to run (default: all)'
+    )
+    parser.add_argument(
+        '--input', dest='infile', help='Input file name (default: NN.in)'
+    )
+    parser.add_argument(
+        '--repeat', type=int, default=5, help='Timed runs per stage'
+    )
+    parser.add_argument(
+        '--warmup', type=int, default=1, help='Warmup runs per stage'
+    )
+    parser.add_argument(
+        '--workers', type=int, default=1,
+        help='Days benchmarked in parallel (default: 1, for stable timings)'
+    )
+    parser.add_argument(
+        '--cache', action='store_true',
+        help='Load parsed inputs from the on-disk cache (YYYY/out/cache)'
+    )
+    parser.add_argument(
+        '--memory', action='store_true',
+        help='Also measure and compare the peak traced memory of each stage'
+    )
+    parser.add_argument(
+        '--baseline', help='Baseline file (default: YYYY/out/baseline.json)'
+    )
+    parser.add_argument(
+        '--save-baseline', action='store_true',
+        help='Store the results as the new baseline'
+    )
+    parser.add_argument(
+        '--threshold', type=float, default=10.0,
+        help='Allowed slowdown of a median in percent (default: 10)'
+    )
+    parser.add_argument(
+        '--min-time', type=float, default=1.0,
+        help='Ignore stages with a median below this many ms (default: 1)'
+    )
+    parser.add_argument(
+        '--min-kb', type=int, default=64,
+        help='Ignore stages with a peak below this many KiB (default: 64)'
+    )
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    baseline_path: str = args.baseline or os.path.join(
+        year_directory(args.year), 'out', 'baseline.json'
+    )
+    days: List[int] = args.days or discover_days(args.year)
+    tasks: List[Tuple[int, int, int, int, Optional[str], bool, bool]] = [
+        (args.year, day, args.repeat, args.warmup, args.infile, args.cache,
+         args.memory)
+        for day in days
+    ]
+
+    if args.workers > 1:
+        with multiprocessing.Pool(args.workers, maxtasksperchild=1) as pool:
+            results: List[Dict[str, Any]] = pool.map(
+                _benchmark_day_task, tasks, chunksize=1
+            )
+    else:
+        results = [_benchmark_day_task(task) for task in tasks]
+
+    for result in results:
+        if result['error']:
+            print(f"{result['day']:02d} error {result['error']}")
+            continue
+        for stage, stats in result['stages'].items():
+            line: str = (
+                f"{result['day']:02d} {stage:15s}"
+                f" min {stats['min'] * 1000:9.2f}ms"
+                f" median {stats['median'] * 1000:9.2f}ms"
+                f" p95 {stats['p95'] * 1000:9.2f}ms"
+            )
+            if 'peak_kb' in stats:
+                line += f" peak {stats['peak_kb']:8d}KiB"
+            print(line)
+
+    measured: Dict[str, Dict[str, Dict[str, float]]] = {
+        baseline_key(result['day'], result['input']): result['stages']
+        for result in results if not result['error']
+    }
+
+    if args.save_baseline:
+        baseline: Dict[str, Any] = {}
+        if os.path.isfile(baseline_path):
+            with open(baseline_path, 'r', encoding='utf-8') as file:
+                baseline = json.load(file)
+        baseline.update(measured)
+        os.makedirs(os.path.dirname(baseline_path), exist_ok=True)
+        with open(baseline_path, 'w', encoding='utf-8') as file:
+            json.dump(baseline, file, indent=2, sort_keys=True)
+        print(f'Baseline written to {baseline_path}')
+        return 0
+
+    if not os.path.isfile(baseline_path):
+        print(f'No baseline at {baseline_path}, run with --save-baseline')
+        return 0
+
+    with open(baseline_path, 'r', encoding='utf-8') as file:
+        baseline = json.load(file)
+    regressions = compare_with_baseline(
+        results, baseline, args.threshold, args.min_time / 1000, args.min_kb
+    )
+    for day, stage, metric, old, new in regressions:
+        growth: str = f'+{(new / old - 1) * 100:.1f}%' if old else 'new'
+        if metric == 'median':
+            change: str = f'{old * 1000:.2f}ms -> {new * 1000:.2f}ms'
+        else:
+            change = f'{old:.0f}KiB -> {new:.0f}KiB'
+        print(f'REGRESSION {day:02d} {stage}: {metric} {change} ({growth})')
+    # A day that used to run and now fails is the worst regression of all
+    broken: List[Dict[str, Any]] = [
+        result for result in results
+        if result['error']
+        and baseline_key(result['day'], result['input']) in baseline
+    ]
+    for result in broken:
+        print(f"REGRESSION {result['day']:02d}: fails with {result['error']}")
+    return 1 if regressions or broken else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
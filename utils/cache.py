@@ -0,0 +1,229 @@
+"""
+Content-addressed on-disk cache of parsed inputs.
+
+The parsed result of a day's `process()` is stored with pickle (protocol 5)
+under `YYYY/out/cache/`, keyed by a hash of the raw input and of the source
+of `process` and of everything it depends on: the functions and classes of
+its own module it uses, the ones those use in turn, and the whole source of
+every `utils` module involved (`Grid`, `freeze`, ...). Editing the parser,
+a helper, a parsed class or the input therefore never returns a stale
+result.
+
+Nothing is cached unless asked: the runner does it with `--cache`, and a
+`process` decorated with `cached` only uses the cache when the
+`AOC_CACHE` environment variable is set to a non-empty value other than
+`0`.
+"""
+import functools
+import hashlib
+import inspect
+import os
+import pickle
+import sys
+from types import CodeType, FunctionType, ModuleType
+from typing import Any, Callable, List, Optional, Set, Tuple
+
+__all__ = ['cache_enabled', 'cache_key', 'cached', 'cached_process']
+
+PROTOCOL: int = 5
+
+# Environment variable turning on the `cached` decorator
+CACHE_VARIABLE: str = 'AOC_CACHE'
+
+
+def cache_enabled() -> bool:
+    """Whether `AOC_CACHE` asks decorated `process` functions to cache."""
+    return os.environ.get(CACHE_VARIABLE, '') not in ('', '0')
+
+
+def _source_of(func: Callable[..., Any]) -> str:
+    """Source of a function, empty when it is not available."""
+    try:
+        return inspect.getsource(func)
+    except (OSError, TypeError):
+        return ''
+
+
+def _code_names(code: CodeType) -> Set[str]:
+    """Global and attribute names used by a code object and the functions,
+    lambdas and comprehensions nested in it."""
+    names: Set[str] = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= _code_names(const)
+    return names
+
+
+def _class_members(cls: type) -> List[Any]:
+    """Functions defined in a class body, and its base classes."""
+    members: List[Any] = list(cls.__bases__)
+    for value in vars(cls).values():
+        if isinstance(value, (staticmethod, classmethod)):
+            value = value.__func__
+        if isinstance(value, property):
+            members.extend(
+                accessor for accessor in (value.fget, value.fset, value.fdel)
+                if accessor is not None
+            )
+        elif isinstance(value, FunctionType):
+            members.append(value)
+    return members
+
+
+def _dependency_sources(func: FunctionType) -> List[str]:
+    """Sources of everything `func` depends on, in a stable order.
+
+    Functions and classes of `func`'s own module and of the `utils` package
+    are followed transitively, through the globals their code names and the
+    attributes it reads from a `utils` module (`utils.freeze`). Every
+    `utils` module reached is hashed whole, which also covers its private
+    helpers.
+    """
+    home: str = func.__module__
+
+    def tracked(module_name: Optional[str]) -> bool:
+        return module_name is not None and (
+            module_name == home or module_name == 'utils'
+            or module_name.startswith('utils.')
+        )
+
+    sources: List[str] = []
+    modules: Set[str] = set()
+    seen: Set[int] = {id(func)}
+    pending: List[Any] = [func]
+
+    def follow(value: Any) -> None:
+        if not isinstance(value, (FunctionType, type)) or id(value) in seen:
+            return
+        module_name: Optional[str] = getattr(value, '__module__', None)
+        if not tracked(module_name):
+            return
+        seen.add(id(value))
+        pending.append(value)
+        if module_name != home:
+            modules.add(module_name)
+
+    while pending:
+        item: Any = pending.pop(0)
+        # utils modules are hashed whole below, and a method is part of
+        # its class source
+        if item is not func and item.__module__ == home \
+                and '.' not in item.__qualname__:
+            sources.append(_source_of(item))
+        if isinstance(item, type):
+            for member in _class_members(item):
+                follow(member)
+            continue
+        names: List[str] = sorted(_code_names(item.__code__))
+        for name in names:
+            value: Any = item.__globals__.get(name)
+            if isinstance(value, ModuleType):
+                if tracked(value.__name__):
+                    if value.__name__ != home:
+                        modules.add(value.__name__)
+                    for attribute in names:
+                        follow(getattr(value, attribute, None))
+                continue
+            follow(value)
+
+    for module_name in sorted(modules):
+        module: Optional[ModuleType] = sys.modules.get(module_name)
+        if module is not None:
+            sources.append(_source_of(module))
+    return sources
+
+
+def cache_key(raw_data: str, func: Callable[..., Any]) -> str:
+    """Hashes the raw input together with the parser source.
+
+    Args:
+        raw_data (str): Raw puzzle input.
+        func (Callable[..., Any]): The parsing function.
+
+    Returns:
+        str: Hex digest identifying the parsed result.
+    """
+    func = inspect.unwrap(func)
+    digest = hashlib.sha256()
+    digest.update(f'{sys.version_info[:2]}:{func.__module__}:'.encode())
+    digest.update(_source_of(func).encode('utf-8'))
+    if isinstance(func, FunctionType):
+        for source in _dependency_sources(func):
+            digest.update(source.encode('utf-8'))
+    digest.update(b'\0')
+    digest.update(raw_data.encode('utf-8'))
+    return digest.hexdigest()
+
+
+def default_cache_directory(func: Callable[..., Any]) -> str:
+    """`YYYY/out/cache` next to the `YYYY/solutions` file defining `func`."""
+    source_file: str = os.path.abspath(inspect.getfile(inspect.unwrap(func)))
+    year_directory: str = os.path.dirname(os.path.dirname(source_file))
+    return os.path.join(year_directory, 'out', 'cache')
+
+
+def cached_process(
+    func: Callable[[str], Any],
+    raw_data: str,
+    cache_directory: Optional[str] = None
+) -> Tuple[Any, bool]:
+    """Calls `func(raw_data)`, or loads its result from the cache.
+
+    Results that cannot be pickled are returned but not cached. A cache file
+    that fails to load (e.g. written by another Python) is recomputed.
+
+    Args:
+        func (Callable[[str], Any]): The day's `process` function.
+        raw_data (str): Raw puzzle input.
+        cache_directory (Optional[str]): Where to keep the cache files,
+            `YYYY/out/cache` by default.
+
+    Returns:
+        Tuple[Any, bool]: The parsed input and whether it came from the cache.
+    """
+    cache_directory = cache_directory or default_cache_directory(func)
+    cache_path: str = os.path.join(
+        cache_directory, f'{cache_key(raw_data, func)}.pickle'
+    )
+
+    if os.path.isfile(cache_path):
+        try:
+            with open(cache_path, 'rb') as file:
+                return pickle.load(file), True
+        except Exception:  # pylint: disable=broad-except
+            pass
+
+    result: Any = func(raw_data)
+    try:
+        payload: bytes = pickle.dumps(result, protocol=PROTOCOL)
+    except Exception:  # pylint: disable=broad-except
+        return result, False
+
+    os.makedirs(cache_directory, exist_ok=True)
+    # Write then rename so concurrent runs never read a partial file
+    temp_path: str = f'{cache_path}.{os.getpid()}.tmp'
+    with open(temp_path, 'wb') as file:
+        file.write(payload)
+    os.replace(temp_path, cache_path)
+    return result, False
+
+
+def cached(func: Callable[[str], Any]) -> Callable[[str], Any]:
+    """Decorator caching a `process(raw_data)` function on disk.
+
+    The cache is only used while `cache_enabled()`; otherwise the wrapper
+    just calls `func`.
+
+    Args:
+        func (Callable[[str], Any]): The day's `process` function.
+
+    Returns:
+        Callable[[str], Any]: A drop-in replacement of `func`.
+    """
+    @functools.wraps(func)
+    def wrapper(raw_data: str) -> Any:
+        if not cache_enabled():
+            return func(raw_data)
+        return cached_process(func, raw_data)[0]
+
+    return wrapper
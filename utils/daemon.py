@@ -0,0 +1,315 @@
+"""
+Warm solver daemon on a Unix domain socket.
+
+The daemon keeps solution modules imported and parsed inputs in memory, so a
+repeated solve only pays for the solve itself. A solution file is imported
+again when its source changes, and an input is parsed again when the input
+file (or the module) changes.
+
+The protocol is one JSON object per line. A request is
+`{"year": 2024, "day": 6, "part": 1, "input": "06.in"}` (`part` 1, 2 or null
+for both, `input` a name inside `YYYY/in` or an absolute path, `NN.in` by
+default), or `{"command": "shutdown"}`. The response holds the answers,
+the seconds spent importing, parsing and solving each part, and whether the
+module and the parsed input were already warm.
+
+Usage:
+    python -m utils.daemon serve &
+    python -m utils.daemon solve 2024 6 --part 2
+    python -m utils.daemon solve 2024 9 --input 09.test
+    python -m utils.daemon shutdown
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import os
+import socket
+import sys
+import tempfile
+import time
+import traceback
+from types import ModuleType
+from typing import Any, Dict, List, Optional, Tuple
+
+from .frozen import copy_for_part
+from .get_input import read_input
+from .runner import (
+    STAGE_FIELDS,
+    answer_of,
+    input_path,
+    load_solution,
+    parse,
+    solution_parts,
+    solution_path,
+    timed,
+)
+
+__all__ = ['SolverDaemon', 'default_socket_path', 'request']
+
+
+def default_socket_path() -> str:
+    """Per-user socket path in the temporary directory."""
+    return os.path.join(
+        tempfile.gettempdir(), f'aoc-solver-{os.getuid()}.sock'
+    )
+
+
+def file_signature(path: str) -> Tuple[int, int]:
+    """`(mtime_ns, size)` of a file, changes whenever the file is edited."""
+    stat: os.stat_result = os.stat(path)
+    return stat.st_mtime_ns, stat.st_size
+
+
+class SolverDaemon:
+    """Serves solve requests from warm modules and parsed inputs.
+
+    Requests are solved one at a time in a worker thread, so the event loop
+    keeps accepting clients while a long solve runs.
+    """
+
+    def __init__(self) -> None:
+        # (year, day) -> (source signature, module)
+        self.modules: Dict[Tuple[int, int], Tuple[Tuple[int, int],
+                                                   ModuleType]] = {}
+        # (year, day, input path) -> (input signature, module, parsed input)
+        self.inputs: Dict[Tuple[int, int, str],
+                          Tuple[Tuple[int, int], ModuleType, Any]] = {}
+        self.lock: asyncio.Lock = asyncio.Lock()
+        self.server: Optional[asyncio.AbstractServer] = None
+
+    def module(self, year: int, day: int) -> Tuple[ModuleType, bool, float]:
+        """The solution module of a day, imported again if edited.
+
+        Returns:
+            Tuple[ModuleType, bool, float]: The module, whether it was warm,
+            and the seconds spent importing it.
+        """
+        signature: Tuple[int, int] = file_signature(solution_path(year, day))
+        known = self.modules.get((year, day))
+        if known is not None and known[0] == signature:
+            return known[1], True, 0.0
+
+        sys.modules.pop(f'aoc{year}_{day:02d}', None)
+        module, elapsed = timed(load_solution, year, day)
+        self.modules[(year, day)] = (signature, module)
+        return module, False, elapsed
+
+    def parsed(
+        self,
+        year: int,
+        day: int,
+        module: ModuleType,
+        path: str
+    ) -> Tuple[Any, bool, float]:
+        """The parsed input of a day, parsed again if the input or the
+        module changed.
+
+        Returns:
+            Tuple[Any, bool, float]: The parsed input, whether it was warm,
+            and the seconds spent parsing it.
+        """
+        key: Tuple[int, int, str] = (year, day, path)
+        signature: Tuple[int, int] = file_signature(path)
+        known = self.inputs.get(key)
+        if known is not None and known[0] == signature and \
+                known[1] is module:
+            return known[2], True, 0.0
+
+        start: float = time.perf_counter()
+        data: Any = read_input(path)['data']
+        if callable(getattr(module, 'process', None)):
+            data = parse(module, data)[0]
+        elapsed: float = time.perf_counter() - start
+        self.inputs[key] = (signature, module, data)
+        return data, False, elapsed
+
+    def solve(self, query: Dict[str, Any]) -> Dict[str, Any]:
+        """Answers one solve request.
+
+        Args:
+            query (Dict[str, Any]): `year`, `day`, optional `part` (1, 2 or
+                None) and optional `input`.
+
+        Returns:
+            Dict[str, Any]: `{'ok', 'part_one', 'part_two', 'timings',
+            'module_warm', 'input_warm', 'error'}`.
+        """
+        response: Dict[str, Any] = {
+            'ok': False, 'part_one': None, 'part_two': None,
+            'timings': {}, 'module_warm': None, 'input_warm': None,
+            'error': None,
+        }
+        try:
+            year: int = int(query['year'])
+            day: int = int(query['day'])
+            part: Optional[int] = query.get('part')
+            if part not in (None, 1, 2):
+                raise ValueError(f'part must be 1, 2 or null, got {part!r}')
+            path: str = input_path(year, day, query.get('input'))
+            timings: Dict[str, float] = response['timings']
+
+            with contextlib.redirect_stdout(io.StringIO()):
+                module, response['module_warm'], timings['load'] = \
+                    self.module(year, day)
+                data, response['input_warm'], timings['parse'] = \
+                    self.parsed(year, day, module, path)
+
+                wanted: Optional[str] = {1: 'part_one', 2: 'part_two'}.get(
+                    part  # type: ignore[arg-type]
+                )
+                for name, func in solution_parts(module):
+                    field: str = STAGE_FIELDS[name]
+                    if name != 'solve' and wanted not in (None, field):
+                        continue
+                    # Parts may mutate their input, the cached one stays
+                    # pristine (frozen inputs are shared as they are)
+                    result, timings[field] = timed(func, copy_for_part(data))
+                    if name == 'solve':
+                        if isinstance(result, tuple) and len(result) == 2:
+                            response['part_one'], response['part_two'] = \
+                                result
+                        else:
+                            response['part_one'] = result
+                    else:
+                        response[field] = answer_of(result)
+            response['ok'] = True
+        except Exception as error:  # pylint: disable=broad-except
+            response['error'] = ''.join(
+                traceback.format_exception_only(type(error), error)
+            ).strip()
+        return response
+
+    async def handle(
+        self,
+        reader: asyncio.StreamReader,
+        writer: asyncio.StreamWriter
+    ) -> None:
+        """Serves the requests of one client connection."""
+        try:
+            while True:
+                line: bytes = await reader.readline()
+                if not line:
+                    break
+                try:
+                    query: Dict[str, Any] = json.loads(line)
+                except ValueError as error:
+                    response: Dict[str, Any] = {
+                        'ok': False, 'error': f'invalid request: {error}'
+                    }
+                else:
+                    if query.get('command') == 'shutdown':
+                        writer.write(b'{"ok": true}\n')
+                        await writer.drain()
+                        if self.server is not None:
+                            self.server.close()
+                        break
+                    loop = asyncio.get_running_loop()
+                    async with self.lock:
+                        response = await loop.run_in_executor(
+                            None, self.solve, query
+                        )
+                writer.write(
+                    json.dumps(response, default=str).encode() + b'\n'
+                )
+                await writer.drain()
+        finally:
+            writer.close()
+
+    async def serve(self, path: str) -> None:
+        """Listens on `path` until a shutdown request arrives."""
+        if os.path.exists(path):
+            os.unlink(path)
+        self.server = await asyncio.start_unix_server(self.handle, path=path)
+        try:
+            async with self.server:
+                await self.server.wait_closed()
+        finally:
+            if os.path.exists(path):
+                os.unlink(path)
+
+
+def request(
+    query: Dict[str, Any],
+    path: Optional[str] = None,
+    timeout: Optional[float] = None
+) -> Dict[str, Any]:
+    """Sends one request to the daemon and waits for its response.
+
+    Args:
+        query (Dict[str, Any]): The request object.
+        path (Optional[str]): Socket path, `default_socket_path()` if None.
+        timeout (Optional[float]): Seconds to wait, forever if None.
+
+    Returns:
+        Dict[str, Any]: The decoded response.
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(path or default_socket_path())
+        client.sendall(json.dumps(query).encode() + b'\n')
+        with client.makefile('rb') as stream:
+            return json.loads(stream.readline())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Warm solver daemon and its client'
+    )
+    parser.add_argument(
+        '--socket', help='Socket path (default: per-user temporary file)'
+    )
+    commands = parser.add_subparsers(dest='command', required=True)
+    commands.add_parser('serve', help='Run the daemon')
+    solve_parser = commands.add_parser('solve', help='Solve through it')
+    solve_parser.add_argument('year', type=int, help='Puzzle year')
+    solve_parser.add_argument('day', type=int, help='Puzzle day')
+    solve_parser.add_argument(
+        '--part', type=int, choices=[1, 2], help='Part (default: both)'
+    )
+    solve_parser.add_argument(
+        '--input', dest='infile', help='Input file name (default: NN.in)'
+    )
+    commands.add_parser('shutdown', help='Stop the daemon')
+    args: argparse.Namespace = parser.parse_args(argv)
+    path: str = args.socket or default_socket_path()
+
+    if args.command == 'serve':
+        print(f'Serving on {path}')
+        asyncio.run(SolverDaemon().serve(path))
+        return 0
+
+    if args.command == 'shutdown':
+        request({'command': 'shutdown'}, path)
+        return 0
+
+    infile: Optional[str] = args.infile
+    if infile is not None and os.path.exists(infile):
+        infile = os.path.abspath(infile)
+    response: Dict[str, Any] = request(
+        {'year': args.year, 'day': args.day, 'part': args.part,
+         'input': infile},
+        path
+    )
+    if not response['ok']:
+        print(f"Error: {response['error']}")
+        return 1
+    for field, label in (('part_one', 'Part One'), ('part_two', 'Part Two')):
+        if field in response['timings'] or response[field] is not None:
+            print(f'{label}: {response[field]}')
+    warmth: Dict[bool, str] = {True: 'warm', False: 'cold'}
+    timings: str = ', '.join(
+        f'{stage} {seconds * 1000:.2f}ms'
+        for stage, seconds in response['timings'].items()
+    )
+    print(
+        f"[module {warmth[response['module_warm']]},"
+        f" input {warmth[response['input_warm']]}] {timings}"
+    )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
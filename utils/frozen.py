@@ -0,0 +1,121 @@
+"""
+Immutable parsed inputs, shared by both parts without copying.
+
+The runner, the benchmark and the daemon hand every part a deep copy of the
+parsed input, since some parts mutate it. That copy is O(size) per part and
+is skipped when `process` returns immutable data: both parts then read the
+very same object. `freeze` turns the usual parse results (lists, dicts,
+sets, bytearrays, grids) into their immutable counterparts, `is_frozen`
+tells whether a value is immutable all the way down, and `copy_for_part`
+is what the drivers call before each part.
+
+A part that needs to write takes a copy-on-write overlay instead of a copy
+(`Grid.overlay()` for grids), or builds its own state next to the input.
+"""
+import copy
+import dataclasses
+from typing import Any, Dict, Iterator, NoReturn, Tuple
+
+from .grid import Grid
+
+__all__ = ['FrozenDict', 'copy_for_part', 'freeze', 'is_frozen']
+
+# Types whose instances are immutable and hold no mutable values
+ATOMS: Tuple[type, ...] = (
+    int, float, complex, str, bytes, bool, range, type(None)
+)
+
+
+class FrozenDict(dict):
+    """A dict that refuses to change after it is built.
+
+    It is still a `dict`, so `data['key']` and friends work unchanged, and it
+    is hashable when its values are.
+    """
+
+    def _readonly(self, *args: Any, **kwargs: Any) -> NoReturn:
+        raise TypeError('FrozenDict does not support item assignment')
+
+    __setitem__ = __delitem__ = _readonly
+    clear = pop = popitem = setdefault = update = _readonly
+    __ior__ = _readonly
+
+    def __hash__(self) -> int:  # type: ignore[override]
+        return hash(frozenset(self.items()))
+
+    def __reduce__(self) -> Tuple[type, Tuple[Dict[Any, Any]]]:
+        # Unpickling would otherwise fill the dict through __setitem__
+        return FrozenDict, (dict(self),)
+
+    def __copy__(self) -> 'FrozenDict':
+        return self
+
+    def __deepcopy__(self, memo: Dict[int, Any]) -> 'FrozenDict':
+        return self
+
+    def __repr__(self) -> str:
+        return f'FrozenDict({dict.__repr__(self)})'
+
+
+def freeze(value: Any) -> Any:
+    """Immutable version of a parsed input.
+
+    Lists and tuples become tuples, sets frozensets, dicts `FrozenDict`s,
+    bytearrays bytes and grids frozen grids, recursively. Frozen dataclass
+    instances are kept as they are.
+
+    Args:
+        value (Any): The parsed input.
+
+    Returns:
+        Any: An equal value for which `is_frozen` holds.
+
+    Raises:
+        TypeError: If a value has no immutable counterpart.
+    """
+    if isinstance(value, ATOMS):
+        return value
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(value)
+    if isinstance(value, dict):
+        return FrozenDict(
+            (key, freeze(item)) for key, item in value.items()
+        )
+    if isinstance(value, bytearray):
+        return bytes(value)
+    if isinstance(value, Grid):
+        return value.freeze()
+    if is_frozen(value):
+        return value
+    raise TypeError(f'cannot freeze {type(value).__name__} values')
+
+
+def _values(value: Any) -> Iterator[Any]:
+    """Values held by a frozen dataclass instance."""
+    for field in dataclasses.fields(value):
+        yield getattr(value, field.name)
+
+
+def is_frozen(value: Any) -> bool:
+    """Whether a value, and everything it holds, is immutable."""
+    if isinstance(value, ATOMS):
+        return True
+    if isinstance(value, (tuple, frozenset)):
+        return all(is_frozen(item) for item in value)
+    if isinstance(value, FrozenDict):
+        return all(is_frozen(item) for item in value.values())
+    if isinstance(value, Grid):
+        return value.frozen
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return value.__dataclass_params__.frozen and all(
+            is_frozen(item) for item in _values(value)
+        )
+    return False
+
+
+def copy_for_part(data: Any) -> Any:
+    """The input handed to a part: `data` itself when it is frozen, a deep
+    copy otherwise."""
+    return data if is_frozen(data) else copy.deepcopy(data)
@@ -0,0 +1,606 @@
+"""
+Synthetic stress inputs at adjustable scale.
+
+A generator builds a valid puzzle input of a given size for one day, with
+its reference answers whenever they can be known without running the
+solution (by construction, or with a simple independent computation).
+Inputs are written in the `.test` layout to `YYYY/out/stress/NN_<scale>.test`
+so that the runner, the benchmark and `utils.verify.check_answer` all read
+them like the examples.
+
+With `--run`, each generated input is solved in a fresh worker process and
+the time per part is reported against the input size, together with the
+exponent `k` of `time ~ size^k` between consecutive scales (1 for linear
+solutions, 2 for quadratic ones).
+
+Generators exist for 2024 days 1, 2, 6, 7, 9, 10, 11 and 16. Days whose
+input has a fixed size (2024/18 is always a 71 x 71 memory space), or whose
+answers cannot be known without a second full solution, have none.
+
+Usage:
+    python -m utils.generate 2024 2 --scales 10000 100000 1000000
+    python -m utils.generate 2024 16 --scales 101 201 401 --run
+"""
+import argparse
+import functools
+import math
+import multiprocessing
+import os
+import random
+import sys
+from collections import Counter
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .grid import Grid
+from .loader import load_input
+from .runner import run_day, year_directory
+from .search import bfs
+from .verify import check_answer
+
+__all__ = ['GENERATORS', 'format_test_file', 'generate', 'write_input']
+
+Generator = Callable[[int, random.Random], Dict[str, Any]]
+
+# (year, day) -> generator(scale, rng) returning
+# {'data', 'answer_a', 'answer_b'}, the shape of `read_input`
+GENERATORS: Dict[Tuple[int, int], Generator] = {}
+
+SEPARATOR: str = '-' * 80
+
+
+def generator(year: int, day: int) -> Callable[[Generator], Generator]:
+    """Registers a generator for a day."""
+    def register(func: Generator) -> Generator:
+        GENERATORS[(year, day)] = func
+        return func
+    return register
+
+
+@generator(2024, 1)
+def location_lists(scale: int, rng: random.Random) -> Dict[str, Any]:
+    """`scale` pairs of location ids."""
+    upper: int = max(10, scale * 10)
+    left: List[int] = [rng.randint(1, upper) for _ in range(scale)]
+    right: List[int] = [rng.randint(1, upper) for _ in range(scale)]
+    # Repeat some ids so that the similarity score is not zero
+    for i in range(0, scale, 3):
+        right[i] = left[rng.randrange(scale)]
+
+    counts: Counter = Counter(right)
+    return {
+        'data': '\n'.join(f'{a}   {b}' for a, b in zip(left, right)),
+        'answer_a': sum(
+            abs(a - b) for a, b in zip(sorted(left), sorted(right))
+        ),
+        'answer_b': sum(a * counts[a] for a in left),
+    }
+
+
+@generator(2024, 2)
+def reactor_reports(scale: int, rng: random.Random) -> Dict[str, Any]:
+    """`scale` reports: safe, safe once one level is removed, or unsafe.
+
+    The kind of each report is chosen up front, so the answers are counted
+    by construction.
+    """
+    lines: List[str] = []
+    safe: int = 0
+    dampened: int = 0
+    for _ in range(scale):
+        length: int = rng.randint(5, 8)
+        sign: int = rng.choice((1, -1))
+        levels: List[int] = [rng.randint(40, 60)]
+        for _ in range(length - 1):
+            levels.append(levels[-1] + sign * rng.randint(1, 3))
+
+        kind: int = rng.randrange(3)
+        if kind == 0:
+            safe += 1
+        elif kind == 1:
+            # A repeated level: unsafe, safe again without the copy
+            i: int = rng.randrange(length)
+            levels.insert(i, levels[i])
+            dampened += 1
+        else:
+            # Two separate jumps of 5+ that one removal cannot both fix
+            first: int = rng.randrange(1, length // 2)
+            second: int = rng.randrange(first + 2, length)
+            for i in range(first, length):
+                levels[i] += sign * 5
+            for i in range(second, length):
+                levels[i] += sign * 5
+        lines.append(' '.join(map(str, levels)))
+
+    return {
+        'data': '\n'.join(lines),
+        'answer_a': safe,
+        'answer_b': safe + dampened,
+    }
+
+
+def disk_checksums(disk_map: str, whole_files: bool) -> int:
+    """Reference checksum of a compacted disk, block by block.
+
+    Args:
+        disk_map (str): Alternating file and free space lengths.
+        whole_files (bool): Move whole files (part two) instead of blocks.
+
+    Returns:
+        int: The filesystem checksum.
+    """
+    spans: List[List[int]] = []  # [start, length, file id or -1]
+    position: int = 0
+    for i, digit in enumerate(map(int, disk_map)):
+        spans.append([position, digit, i // 2 if i % 2 == 0 else -1])
+        position += digit
+
+    blocks: List[int] = [-1] * position
+    for start, length, file_id in spans:
+        blocks[start:start + length] = [file_id] * length
+
+    if not whole_files:
+        left: int = 0
+        right: int = len(blocks) - 1
+        while True:
+            while left < right and blocks[left] != -1:
+                left += 1
+            while left < right and blocks[right] == -1:
+                right -= 1
+            if left >= right:
+                break
+            blocks[left], blocks[right] = blocks[right], -1
+    else:
+        gaps: List[List[int]] = [
+            span[:2] for span in spans if span[2] == -1 and span[1]
+        ]
+        for start, length, file_id in reversed(spans):
+            if file_id == -1:
+                continue
+            for gap in gaps:
+                if gap[0] >= start:
+                    break
+                if gap[1] >= length:
+                    blocks[start:start + length] = [-1] * length
+                    blocks[gap[0]:gap[0] + length] = [file_id] * length
+                    gap[0] += length
+                    gap[1] -= length
+                    break
+
+    return sum(i * block for i, block in enumerate(blocks) if block > 0)
+
+
+# The part two reference scans every gap for every file
+DISK_PART_TWO_LIMIT: int = 20000
+
+
+def patrol(rows: List[str], obstacle: Optional[Tuple[int, int]] = None
+           ) -> Optional[set]:
+    """Reference guard walk, one `(row, col)` step at a time.
+
+    Returns:
+        Optional[set]: The cells visited before leaving the map, or None if
+        the guard walks in a loop.
+    """
+    height: int = len(rows)
+    width: int = len(rows[0])
+    r, c = next(
+        (i, line.index('^')) for i, line in enumerate(rows) if '^' in line
+    )
+    dr, dc = -1, 0
+    seen: set = set()
+    while True:
+        if (r, c, dr, dc) in seen:
+            return None
+        seen.add((r, c, dr, dc))
+        nr, nc = r + dr, c + dc
+        if not (0 <= nr < height and 0 <= nc < width):
+            return {(row, col) for row, col, _, _ in seen}
+        if rows[nr][nc] == '#' or (nr, nc) == obstacle:
+            dr, dc = dc, -dr
+        else:
+            r, c = nr, nc
+
+
+# The part two reference walks the whole patrol once per path cell
+GUARD_PART_TWO_LIMIT: int = 80
+
+
+@generator(2024, 6)
+def guard_map(scale: int, rng: random.Random) -> Dict[str, Any]:
+    """A `scale` x `scale` map with scattered obstacles and a guard whose
+    patrol leaves the map (maps where it loops are drawn again)."""
+    side: int = max(4, scale)
+    while True:
+        grid: List[List[str]] = [
+            ['#' if rng.random() < 0.05 else '.' for _ in range(side)]
+            for _ in range(side)
+        ]
+        grid[rng.randrange(side)][rng.randrange(side)] = '^'
+        rows: List[str] = [''.join(row) for row in grid]
+        visited: Optional[set] = patrol(rows)
+        if visited is not None:
+            break
+
+    answer_b: Optional[int] = None
+    if side <= GUARD_PART_TWO_LIMIT:
+        start: Tuple[int, int] = next(
+            (i, line.index('^')) for i, line in enumerate(rows) if '^' in line
+        )
+        answer_b = sum(
+            patrol(rows, cell) is None for cell in visited if cell != start
+        )
+    return {
+        'data': '\n'.join(rows),
+        'answer_a': len(visited),
+        'answer_b': answer_b,
+    }
+
+
+def reachable_values(target: int, numbers: List[int],
+                     concatenation: bool) -> bool:
+    """Reference check of a day 7 equation: every value reachable left to
+    right, dropping those above the target (numbers are positive)."""
+    values: set = {numbers[0]}
+    for number in numbers[1:]:
+        following: set = set()
+        for value in values:
+            following.add(value + number)
+            following.add(value * number)
+            if concatenation:
+                following.add(int(f'{value}{number}'))
+        values = {value for value in following if value <= target}
+    return target in values
+
+
+@generator(2024, 7)
+def calibration_equations(scale: int, rng: random.Random) -> Dict[str, Any]:
+    """`scale` equations of 3 to 8 numbers.
+
+    Most targets are built from random operators (|| included), the others
+    are random; the answers come from `reachable_values`.
+    """
+    lines: List[str] = []
+    answer_a: int = 0
+    answer_b: int = 0
+    for _ in range(scale):
+        numbers: List[int] = [
+            rng.randint(1, 99) for _ in range(rng.randint(3, 8))
+        ]
+        if rng.random() < 0.7:
+            target: int = numbers[0]
+            for number in numbers[1:]:
+                operator: int = rng.randrange(3)
+                target = target + number if operator == 0 else \
+                    target * number if operator == 1 else \
+                    int(f'{target}{number}')
+        else:
+            target = rng.randint(1, 10 ** rng.randint(3, 12))
+        lines.append(f'{target}: {" ".join(map(str, numbers))}')
+        if reachable_values(target, numbers, False):
+            answer_a += target
+            answer_b += target
+        elif reachable_values(target, numbers, True):
+            answer_b += target
+    return {
+        'data': '\n'.join(lines),
+        'answer_a': answer_a,
+        'answer_b': answer_b,
+    }
+
+
+@generator(2024, 9)
+def disk_map(scale: int, rng: random.Random) -> Dict[str, Any]:
+    """A disk map of `scale` digits (file and free space lengths)."""
+    digits: List[str] = [
+        str(rng.randint(1, 9)) if i % 2 == 0 else str(rng.randint(0, 9))
+        for i in range(scale | 1)  # The map starts and ends with a file
+    ]
+    data: str = ''.join(digits)
+    return {
+        'data': data,
+        'answer_a': disk_checksums(data, whole_files=False),
+        'answer_b': (
+            disk_checksums(data, whole_files=True)
+            if scale <= DISK_PART_TWO_LIMIT else None
+        ),
+    }
+
+
+@generator(2024, 10)
+def topographic_map(scale: int, rng: random.Random) -> Dict[str, Any]:
+    """A `scale` x `scale` height map with hiking trails planted in it.
+
+    Trails are random walks climbing 0 to 9 one step at a time, over random
+    heights. The answers are counted independently: the 9s reachable from
+    every 0 and the number of trails, both propagated down from the 9s.
+    """
+    side: int = max(4, scale)
+    heights: List[List[int]] = [
+        [rng.randrange(10) for _ in range(side)] for _ in range(side)
+    ]
+    steps: Tuple[Tuple[int, int], ...] = ((-1, 0), (0, 1), (1, 0), (0, -1))
+    for _ in range(side * side // 20):
+        r, c = rng.randrange(side), rng.randrange(side)
+        heights[r][c] = 0
+        for height in range(1, 10):
+            dr, dc = rng.choice(steps)
+            if not (0 <= r + dr < side and 0 <= c + dc < side):
+                break
+            r, c = r + dr, c + dc
+            heights[r][c] = height
+
+    # Summits reachable and trail count per cell, from height 9 down
+    summits: Dict[Tuple[int, int], set] = {}
+    trails: Dict[Tuple[int, int], int] = {}
+    for height in range(9, -1, -1):
+        for r in range(side):
+            for c in range(side):
+                if heights[r][c] != height:
+                    continue
+                if height == 9:
+                    summits[(r, c)] = {(r, c)}
+                    trails[(r, c)] = 1
+                    continue
+                summits[(r, c)] = set()
+                trails[(r, c)] = 0
+                for dr, dc in steps:
+                    above: Tuple[int, int] = (r + dr, c + dc)
+                    if 0 <= above[0] < side and 0 <= above[1] < side and \
+                            heights[above[0]][above[1]] == height + 1:
+                        summits[(r, c)] |= summits[above]
+                        trails[(r, c)] += trails[above]
+    trailheads: List[Tuple[int, int]] = [
+        (r, c) for r in range(side) for c in range(side)
+        if heights[r][c] == 0
+    ]
+    return {
+        'data': '\n'.join(''.join(map(str, row)) for row in heights),
+        'answer_a': sum(len(summits[cell]) for cell in trailheads),
+        'answer_b': sum(trails[cell] for cell in trailheads),
+    }
+
+
+def stone_count(stones: List[int], blinks: int) -> int:
+    """Reference stone count: per stone recursion on digit strings."""
+    @functools.lru_cache(maxsize=None)
+    def count(stone: int, left: int) -> int:
+        if left == 0:
+            return 1
+        if stone == 0:
+            return count(1, left - 1)
+        digits: str = str(stone)
+        if len(digits) % 2 == 0:
+            half: int = len(digits) // 2
+            return count(int(digits[:half]), left - 1) + \
+                count(int(digits[half:]), left - 1)
+        return count(stone * 2024, left - 1)
+
+    return sum(count(stone, blinks) for stone in stones)
+
+
+@generator(2024, 11)
+def stones(scale: int, rng: random.Random) -> Dict[str, Any]:
+    """`scale` stones with random engravings of 1 to 12 digits."""
+    engravings: List[int] = [
+        rng.randrange(10 ** rng.randint(1, 12)) for _ in range(scale)
+    ]
+    return {
+        'data': ' '.join(map(str, engravings)),
+        'answer_a': stone_count(engravings, 25),
+        'answer_b': stone_count(engravings, 75),
+    }
+
+
+@generator(2024, 16)
+def reindeer_maze(scale: int, rng: random.Random) -> Dict[str, Any]:
+    """A `scale` x `scale` perfect maze, S bottom left and E top right.
+
+    A perfect maze has a single simple path between any two cells. The best
+    path is that one, so its score (steps plus 1000 per turn, facing East
+    at the start) and its tiles are the answers.
+    """
+    side: int = max(5, scale | 1)
+    grid: Grid = Grid.filled(side, side, '#')
+    cells = grid.cells
+
+    # Randomised depth-first carving between cells at odd rows and columns
+    wall: int = ord('#')
+    start: int = grid.index(side - 2, 1)
+    end: int = grid.index(1, side - 2)
+    steps: Tuple[Tuple[int, int], ...] = ((-2, 0), (0, 2), (2, 0), (0, -2))
+    cells[start] = ord('.')
+    stack: List[Tuple[int, int]] = [(side - 2, 1)]
+    while stack:
+        r, c = stack[-1]
+        choices: List[Tuple[int, int]] = [
+            (dr, dc) for dr, dc in steps
+            if 1 <= r + dr <= side - 2 and 1 <= c + dc <= side - 2
+            and cells[grid.index(r + dr, c + dc)] == wall
+        ]
+        if not choices:
+            stack.pop()
+            continue
+        dr, dc = rng.choice(choices)
+        cells[grid.index(r + dr // 2, c + dc // 2)] = ord('.')
+        cells[grid.index(r + dr, c + dc)] = ord('.')
+        stack.append((r + dr, c + dc))
+
+    cells[start] = ord('S')
+    cells[end] = ord('E')
+
+    offsets: Tuple[int, ...] = grid.offsets
+    path: List[int] = bfs(
+        len(cells), [start],
+        lambda i: [
+            i + offset for offset in offsets if cells[i + offset] != wall
+        ],
+        goal=lambda i: i == end,
+        parents=True
+    ).path()
+
+    score: int = len(path) - 1
+    direction: int = offsets.index(1)  # East
+    for a, b in zip(path, path[1:]):
+        turn: int = (offsets.index(b - a) - direction) % 4
+        score += 1000 * min(turn, 4 - turn)
+        direction = offsets.index(b - a)
+
+    return {
+        'data': str(grid),
+        'answer_a': score,
+        'answer_b': len(path),
+    }
+
+
+def format_test_file(year: int, day: int, puzzle: Dict[str, Any]) -> str:
+    """Lays a generated input out like the `.test` files of `get_data.sh`."""
+    def answer(value: Any) -> str:
+        return '-' if value is None else str(value)
+
+    return '\n'.join([
+        f' Day {day}: generated input '.center(80, '-'),
+        f'https://adventofcode.com/{year}/day/{day}'.center(80),
+        ' Example data 1/1 '.center(80, '-'),
+        puzzle['data'],
+        SEPARATOR,
+        f"answer_a: {answer(puzzle['answer_a'])}",
+        f"answer_b: {answer(puzzle['answer_b'])}",
+        SEPARATOR,
+        '',
+    ])
+
+
+def generate(year: int, day: int, scale: int, seed: int = 0) -> Dict[str, Any]:
+    """Builds a stress input for a day.
+
+    Args:
+        year (int): Puzzle year.
+        day (int): Puzzle day.
+        scale (int): Size of the input, in the unit of the day's generator
+            (lines, digits, maze side, ...).
+        seed (int): Random seed, the same seed gives the same input.
+
+    Returns:
+        Dict[str, Any]: `{'data', 'answer_a', 'answer_b'}`, an answer being
+        None when it cannot be computed independently.
+
+    Raises:
+        KeyError: If the day has no generator.
+    """
+    if (year, day) not in GENERATORS:
+        raise KeyError(f'no generator for {year} day {day}')
+    return GENERATORS[(year, day)](scale, random.Random(seed))
+
+
+def write_input(year: int, day: int, scale: int, seed: int = 0) -> str:
+    """Generates an input and writes it to `YYYY/out/stress/`.
+
+    Returns:
+        str: The absolute path of the written `NN_<scale>.test` file, usable
+        as `--input` of the runner and the benchmark.
+    """
+    directory: str = os.path.join(year_directory(year), 'out', 'stress')
+    os.makedirs(directory, exist_ok=True)
+    path: str = os.path.join(directory, f'{day:02d}_{scale}.test')
+    with open(path, 'w', encoding='utf-8') as file:
+        file.write(
+            format_test_file(year, day, generate(year, day, scale, seed))
+        )
+    return path
+
+
+def _run_day_task(args: Tuple[int, int, str]) -> Dict[str, Any]:
+    """Pool entry point for `run_day`."""
+    return run_day(*args)
+
+
+def growth_exponent(
+    sizes: Tuple[int, int],
+    times: Tuple[Optional[float], Optional[float]]
+) -> Optional[float]:
+    """`k` such that `time ~ size^k` between two measurements."""
+    if None in times or min(times) <= 0 or sizes[0] == sizes[1]:
+        return None
+    return math.log(times[1] / times[0]) / math.log(sizes[1] / sizes[0])
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Generate stress inputs and measure scaling'
+    )
+    parser.add_argument('year', type=int, help='Puzzle year')
+    parser.add_argument('day', type=int, help='Puzzle day')
+    parser.add_argument(
+        '--scales', type=int, nargs='+', default=[1000, 10000, 100000],
+        help='Input sizes to generate (default: 1000 10000 100000)'
+    )
+    parser.add_argument('--seed', type=int, default=0, help='Random seed')
+    parser.add_argument(
+        '--run', action='store_true',
+        help='Solve each input and report time against size'
+    )
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    if (args.year, args.day) not in GENERATORS:
+        days: str = ', '.join(
+            f'{year}/{day:02d}' for year, day in sorted(GENERATORS)
+        )
+        print(f'No generator for {args.year} day {args.day} (have: {days})')
+        return 1
+
+    paths: List[str] = []
+    for scale in args.scales:
+        paths.append(write_input(args.year, args.day, scale, args.seed))
+        print(f'{scale:>10d} -> {paths[-1]}')
+    if not args.run:
+        return 0
+
+    records: List[Dict[str, Any]] = []
+    for path in paths:
+        # A fresh process per input, so that module level caches of one
+        # run do not speed up the next one
+        with multiprocessing.Pool(1, maxtasksperchild=1) as pool:
+            records.append(
+                pool.apply(_run_day_task, ((args.year, args.day, path),))
+            )
+
+    failed: bool = False
+    print(
+        '     scale |  part one [ms]      k  check'
+        ' |  part two [ms]      k  check'
+    )
+    previous: Optional[Tuple[int, Dict[str, Any]]] = None
+    for scale, path, record in zip(args.scales, paths, records):
+        if record['error']:
+            print(f'{scale:>10d} | {record["error"]}')
+            failed = True
+            continue
+        with load_input(path) as puzzle:
+            expected: Dict[str, Optional[str]] = {
+                'answer_a': puzzle.answer_a,
+                'answer_b': puzzle.answer_b,
+            }
+        line: str = f'{scale:>10d}'
+        for field, key in (('part_one', 'answer_a'), ('part_two', 'answer_b')):
+            elapsed: Optional[float] = record[f'{field}_time']
+            exponent: Optional[float] = None
+            if previous is not None:
+                exponent = growth_exponent(
+                    (previous[0], scale),
+                    (previous[1][f'{field}_time'], elapsed)
+                )
+            status: str = check_answer(record[field], expected[key])
+            failed = failed or status == 'fail'
+            line += (
+                ' | ' + (f'{elapsed * 1000:14.1f}' if elapsed else ' ' * 14)
+                + (f' {exponent:6.2f}' if exponent is not None else ' ' * 7)
+                + f'  {status:5s}'
+            )
+        print(line)
+        previous = (scale, record)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,9 +1,9 @@
 """
 Read input from input file
 """
-import os
-import sys
-from typing import Dict, Any, Union
+from typing import Dict, Any
+
+from .loader import load_input
 
 __all__ = ['read_input']
 
@@ -12,43 +12,19 @@ def read_input(
     file_path: str
 ) -> Dict[str, Any]:
     """Reads input from a specified file and separates metadata for test files.
-    """
-    result: Dict[str, Any] = {
-        'data': None,
-        'answer_a': None,
-        'answer_b': None
-    }
-
-    # Resolve abs_file_path to an absolute path
-    abs_file_path: str = os.path.abspath(file_path)
-    with open(abs_file_path, 'r', encoding='utf-8') as file:
-        content: str = file.read()
-
-        # Handle .test files with metadata
-        if abs_file_path.endswith('.test'):
-            # Find the data section between Example data marker and answer
-            # section
-            data_start: int = content.find('Example data')
-            if data_start != -1:
-                data_start = content.find('\n', data_start) + 1
-                data_end: int = content.find('\n-----------------', data_start)
-                if data_end != -1:
-                    result['data'] = content[data_start:data_end].strip()
-
-            # Extract answers if present
-            answer_section: str = content[data_end:] if data_end != -1 else ''
-            for line in answer_section.splitlines():
-                if line.startswith('answer_a:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_a'] = ans if ans != '-' else None
-                elif line.startswith('answer_b:'):
-                    ans: str = line.split(':')[1].strip()
-                    result['answer_b'] = ans if ans != '-' else None
-
-        # Handle regular .in files
-        else:
-            result['data'] = content.strip()
-
-    return result
 
+    Args:
+        file_path (str): Path of the input file (.in or .test)
 
+    Returns:
+        Dict[str, Any]: Dictionary containing:
+            - 'data': Raw string of input data
+            - 'answer_a': Expected answer for part 1 (None for .in files)
+            - 'answer_b': Expected answer for part 2 (None for .in files)
+    """
+    with load_input(file_path) as puzzle_input:
+        return {
+            'data': puzzle_input.text(),
+            'answer_a': puzzle_input.answer_a,
+            'answer_b': puzzle_input.answer_b
+        }
@@ -0,0 +1,278 @@
+"""
+Compact character grid for the map puzzles.
+
+A `Grid` stores the whole map in one flat `bytearray`, one byte per cell,
+surrounded by a one cell border of `SENTINEL` bytes. Cells are addressed by
+flat index instead of `(row, col)` tuples, a step in direction `d` is
+`index + grid.offsets[d]`, and walking off the map lands on a sentinel cell
+rather than needing a `0 <= r < rows and 0 <= c < cols` check:
+
+    grid = Grid.from_text(raw_data)
+    cells, offsets = grid.cells, grid.offsets
+    i = grid.find('^')
+    while cells[i] != SENTINEL:
+        ...
+        i += offsets[d]
+
+Directions are numbered clockwise from up (`UP`, `RIGHT`, `DOWN`, `LEFT`), so
+turning right is `(d + 1) % 4` and reversing is `d ^ 2`.
+
+A frozen grid can be shared by both parts; a part that marks cells writes
+through `grid.overlay()`, which keeps its writes in a dict over the shared
+cells instead of copying them.
+"""
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+
+__all__ = ['DOWN', 'Grid', 'GridOverlay', 'LEFT', 'RIGHT', 'SENTINEL', 'UP']
+
+SENTINEL: int = 0
+
+UP: int = 0
+RIGHT: int = 1
+DOWN: int = 2
+LEFT: int = 3
+
+Cell = Union[int, str, bytes]
+
+
+def cell_byte(value: Cell) -> int:
+    """Byte value of a cell given as an int, a character or a byte."""
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str):
+        value = value.encode('latin-1')
+    if len(value) != 1:
+        raise ValueError(f'a cell is a single byte, got {value!r}')
+    return value[0]
+
+
+class Grid:
+    """A rectangular map of bytes padded with a sentinel border.
+
+    Attributes:
+        rows (int): Number of rows of the map (without the border).
+        cols (int): Number of columns of the map (without the border).
+        width (int): Row stride in `cells`, `cols + 2`.
+        cells (Union[bytearray, bytes]): The padded cells, row major;
+            `bytes` once the grid is frozen.
+        offsets (Tuple[int, int, int, int]): Flat index step for `UP`,
+            `RIGHT`, `DOWN` and `LEFT`.
+        diagonals (Tuple[int, int, int, int]): Flat index step for up-right,
+            down-right, down-left and up-left.
+    """
+
+    __slots__ = ('rows', 'cols', 'width', 'cells', 'offsets', 'diagonals')
+
+    def __init__(
+        self,
+        rows: int,
+        cols: int,
+        cells: Union[bytearray, bytes]
+    ) -> None:
+        if len(cells) != (rows + 2) * (cols + 2):
+            raise ValueError(
+                f'{len(cells)} cells do not fit a padded {rows}x{cols} grid'
+            )
+        self.rows: int = rows
+        self.cols: int = cols
+        self.width: int = cols + 2
+        self.cells: Union[bytearray, bytes] = cells
+        self.offsets: Tuple[int, int, int, int] = (
+            -self.width, 1, self.width, -1
+        )
+        self.diagonals: Tuple[int, int, int, int] = (
+            1 - self.width, self.width + 1, self.width - 1, -self.width - 1
+        )
+
+    @classmethod
+    def from_rows(cls, lines: Iterable[Union[str, bytes]]) -> 'Grid':
+        """Builds a grid from equally long rows of text or bytes."""
+        encoded: List[bytes] = [
+            line.encode('latin-1') if isinstance(line, str) else bytes(line)
+            for line in lines
+        ]
+        if not encoded:
+            raise ValueError('empty grid')
+        cols: int = len(encoded[0])
+        for number, line in enumerate(encoded):
+            if len(line) != cols:
+                raise ValueError(
+                    f'row {number} has {len(line)} cells, expected {cols}'
+                )
+            if SENTINEL in line:
+                raise ValueError(f'row {number} contains the sentinel byte')
+        border: bytes = bytes([SENTINEL])
+        padding: bytes = border * (cols + 2)
+        cells: bytearray = bytearray(padding)
+        for line in encoded:
+            cells += border + line + border
+        cells += padding
+        return cls(len(encoded), cols, cells)
+
+    @classmethod
+    def from_text(cls, text: Union[str, bytes]) -> 'Grid':
+        """Builds a grid from the puzzle text, one row per line."""
+        return cls.from_rows(
+            line for line in text.splitlines() if line.strip()
+        )
+
+    @classmethod
+    def filled(cls, rows: int, cols: int, value: Cell) -> 'Grid':
+        """Builds a `rows` x `cols` grid with every cell set to `value`."""
+        return cls.from_rows([bytes([cell_byte(value)]) * cols] * rows)
+
+    @property
+    def frozen(self) -> bool:
+        """Whether the cells are immutable."""
+        return isinstance(self.cells, bytes)
+
+    def index(self, row: int, col: int) -> int:
+        """Flat index of `(row, col)`; -1 and `rows`/`cols` hit the border."""
+        return (row + 1) * self.width + col + 1
+
+    def position(self, index: int) -> Tuple[int, int]:
+        """`(row, col)` of a flat index."""
+        row, col = divmod(index, self.width)
+        return row - 1, col - 1
+
+    def inside(self, index: int) -> bool:
+        """Whether a flat index is a cell of the map (not the border)."""
+        return self.cells[index] != SENTINEL
+
+    def indices(self) -> Iterator[int]:
+        """Flat indices of every map cell, row by row."""
+        width: int = self.width
+        for row in range(1, self.rows + 1):
+            start: int = row * width + 1
+            yield from range(start, start + self.cols)
+
+    def neighbours(self, index: int) -> List[int]:
+        """Indices of the (up to four) map cells next to `index`."""
+        cells: Union[bytearray, bytes] = self.cells
+        return [
+            index + offset for offset in self.offsets
+            if cells[index + offset] != SENTINEL
+        ]
+
+    def find(self, value: Cell) -> Optional[int]:
+        """Flat index of the first cell equal to `value`, None if absent."""
+        index: int = self.cells.find(cell_byte(value))
+        return index if index >= 0 else None
+
+    def find_all(self, value: Cell) -> List[int]:
+        """Flat indices of every cell equal to `value`."""
+        cells: Union[bytearray, bytes] = self.cells
+        byte: int = cell_byte(value)
+        found: List[int] = []
+        index: int = cells.find(byte)
+        while index >= 0:
+            found.append(index)
+            index = cells.find(byte, index + 1)
+        return found
+
+    def count(self, value: Cell) -> int:
+        """Number of cells equal to `value`."""
+        return self.cells.count(cell_byte(value))
+
+    def copy(self) -> 'Grid':
+        """Mutable copy of the grid (a single buffer copy)."""
+        return Grid(self.rows, self.cols, bytearray(self.cells))
+
+    def freeze(self) -> 'Grid':
+        """Immutable, hashable version of the grid."""
+        if self.frozen:
+            return self
+        return Grid(self.rows, self.cols, bytes(self.cells))
+
+    def overlay(self) -> 'GridOverlay':
+        """Copy-on-write view of the (frozen) grid."""
+        return GridOverlay(self.freeze())
+
+    def lines(self) -> List[str]:
+        """The map as text rows, without the border."""
+        width: int = self.width
+        return [
+            self.cells[row * width + 1:row * width + 1 + self.cols]
+            .decode('latin-1')
+            for row in range(1, self.rows + 1)
+        ]
+
+    def __getitem__(self, index: int) -> int:
+        return self.cells[index]
+
+    def __setitem__(self, index: int, value: Cell) -> None:
+        if self.frozen:
+            raise TypeError('frozen grid does not support item assignment')
+        self.cells[index] = cell_byte(value)  # type: ignore[index]
+
+    def __len__(self) -> int:
+        return self.rows * self.cols
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, Grid):
+            return NotImplemented
+        return self.cols == other.cols and self.cells == other.cells
+
+    def __hash__(self) -> int:
+        if not self.frozen:
+            raise TypeError('unhashable mutable grid, freeze() it first')
+        return hash(self.cells)
+
+    def __str__(self) -> str:
+        return '\n'.join(self.lines())
+
+    def __repr__(self) -> str:
+        state: str = ', frozen' if self.frozen else ''
+        return f'<Grid {self.rows}x{self.cols}{state}>'
+
+
+class GridOverlay:
+    """Writable view of a frozen grid that records writes in a dict.
+
+    Reads fall back to the shared base cells, so an overlay costs O(writes)
+    instead of the O(size) of `Grid.copy()`.
+
+    Attributes:
+        base (Grid): The frozen grid underneath.
+        writes (Dict[int, int]): Flat index to byte of every changed cell.
+    """
+
+    __slots__ = ('base', 'writes')
+
+    def __init__(self, base: Grid) -> None:
+        if not base.frozen:
+            raise ValueError('an overlay needs a frozen base grid')
+        self.base: Grid = base
+        self.writes: Dict[int, int] = {}
+
+    def count(self, value: Cell) -> int:
+        """Number of cells equal to `value`, writes included."""
+        byte: int = cell_byte(value)
+        cells: Union[bytearray, bytes] = self.base.cells
+        total: int = self.base.count(byte)
+        for index, written in self.writes.items():
+            total += (written == byte) - (cells[index] == byte)
+        return total
+
+    def materialize(self) -> Grid:
+        """Mutable grid with the writes applied."""
+        grid: Grid = self.base.copy()
+        for index, byte in self.writes.items():
+            grid.cells[index] = byte
+        return grid
+
+    def __getitem__(self, index: int) -> int:
+        byte: Optional[int] = self.writes.get(index)
+        return self.base.cells[index] if byte is None else byte
+
+    def __setitem__(self, index: int, value: Cell) -> None:
+        self.writes[index] = cell_byte(value)
+
+    def __str__(self) -> str:
+        return str(self.materialize())
+
+    def __repr__(self) -> str:
+        return (
+            f'<GridOverlay {self.base.rows}x{self.base.cols},'
+            f' {len(self.writes)} writes>'
+        )
@@ -0,0 +1,123 @@
+"""
+Per-day import-time report.
+
+Each solution is imported in a fresh interpreter started with
+`-X importtime`. Only the imports triggered by the solution itself are kept,
+and the report lists the total plus the heaviest top-level packages, in the
+same `self | cumulative | package` layout as `-X importtime`.
+
+Usage:
+    python -m utils.importtime 2024
+    python -m utils.importtime 2024 --days 13 14 15 --top 5
+"""
+import argparse
+import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Optional, Tuple
+
+from .runner import discover_days, root_directory
+
+__all__ = ['import_times']
+
+MARKER: str = '--- solution imports ---'
+
+
+def parse_importtime(stderr: str) -> List[Tuple[str, int, int, int]]:
+    """Parses `-X importtime` lines that follow `MARKER`.
+
+    Returns:
+        List[Tuple[str, int, int, int]]: `(package, self_us, cumulative_us,
+        depth)` per import, depth 0 being a direct import of the solution.
+    """
+    entries: List[Tuple[str, int, int, int]] = []
+    lines: List[str] = stderr.split(MARKER, 1)[-1].splitlines()
+    for line in lines:
+        if not line.startswith('import time:'):
+            continue
+        fields: List[str] = line[len('import time:'):].split('|')
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header line
+        name: str = fields[2].rstrip()
+        stripped: str = name.lstrip()
+        depth: int = (len(name) - len(stripped) - 1) // 2
+        entries.append(
+            (stripped, int(fields[0]), int(fields[1]), depth)
+        )
+    return entries
+
+
+def import_times(year: int, day: int) -> Dict[str, Any]:
+    """Measures the imports done when loading a day's solution module.
+
+    Args:
+        year (int): Puzzle year.
+        day (int): Puzzle day.
+
+    Returns:
+        Dict[str, Any]: `{'day', 'total_us', 'imports', 'error'}`, imports
+        being the depth 0 entries of `parse_importtime`.
+    """
+    code: str = (
+        'import sys\n'
+        'from utils.runner import load_solution\n'
+        f'sys.stderr.write({MARKER!r} + "\\n")\n'
+        f'load_solution({year}, {day})\n'
+    )
+    completed = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=root_directory,
+        capture_output=True,
+        text=True,
+        check=False
+    )
+    entries = parse_importtime(completed.stderr)
+    top_level: List[Tuple[str, int, int, int]] = [
+        entry for entry in entries if entry[3] == 0
+    ]
+    error: Optional[str] = None
+    if completed.returncode != 0:
+        error = completed.stderr.strip().splitlines()[-1]
+    return {
+        'day': day,
+        'total_us': sum(entry[2] for entry in top_level),
+        'imports': top_level,
+        'error': error,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Report the import time of each solution'
+    )
+    parser.add_argument('year', type=int, help='Puzzle year')
+    parser.add_argument(
+        '--days', type=int, nargs='+', help='Days to run (default: all)'
+    )
+    parser.add_argument(
+        '--top', type=int, default=3,
+        help='Heaviest imports listed per day (default: 3)'
+    )
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    days: List[int] = args.days or discover_days(args.year)
+    with ThreadPoolExecutor() as executor:
+        reports: List[Dict[str, Any]] = list(
+            executor.map(lambda day: import_times(args.year, day), days)
+        )
+
+    print('day |  total [us] |       self |  cumulative | package')
+    for report in reports:
+        print(f"{report['day']:3d} | {report['total_us']:11d} |")
+        heaviest = sorted(report['imports'], key=lambda e: -e[2])[:args.top]
+        for name, self_us, cumulative_us, _ in heaviest:
+            print(f'    |             | {self_us:10d} | {cumulative_us:11d} '
+                  f'| {name}')
+        if report['error']:
+            print(f"    | {report['error']}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
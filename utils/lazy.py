@@ -0,0 +1,55 @@
+"""
+Lazy imports for heavy optional dependencies.
+
+`lazy_import('numpy')` returns a placeholder module that performs the real
+import on first attribute access. Solutions can declare numpy, scipy, z3,
+sympy, networkx or cv2 at module level without paying their import time (or
+requiring them to be installed) when the part that uses them never runs.
+"""
+import importlib
+import sys
+from types import ModuleType
+from typing import Any, Optional
+
+__all__ = ['LazyModule', 'lazy_import']
+
+
+class LazyModule(ModuleType):
+    """Module placeholder importing its target on first attribute access."""
+
+    def __init__(self, name: str) -> None:
+        super().__init__(name)
+        self.__dict__['_lazy_module'] = None
+
+    def _load(self) -> ModuleType:
+        """Imports the target module once and returns it."""
+        module: Optional[ModuleType] = self.__dict__['_lazy_module']
+        if module is None:
+            module = importlib.import_module(self.__name__)
+            self.__dict__['_lazy_module'] = module
+        return module
+
+    def __getattr__(self, attr: str) -> Any:
+        return getattr(self._load(), attr)
+
+    def __dir__(self) -> Any:
+        return dir(self._load())
+
+    def __repr__(self) -> str:
+        state: str = 'loaded' if self.__dict__['_lazy_module'] else 'deferred'
+        return f"<lazy module '{self.__name__}' ({state})>"
+
+
+def lazy_import(name: str) -> ModuleType:
+    """Defers the import of a module until one of its attributes is used.
+
+    Args:
+        name (str): Dotted module name, e.g. 'scipy.fft'.
+
+    Returns:
+        ModuleType: The module itself when it is already imported, a
+        `LazyModule` placeholder otherwise.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
@@ -0,0 +1,153 @@
+"""
+Memory-mapped puzzle input loader.
+
+The input file is mapped instead of read, and the data section is exposed as
+a `memoryview` over the mapping. For `.test` files the data section and the
+`answer_a`/`answer_b` metadata are located by searching the mapping, so the
+payload is never copied until one of the accessors parses it.
+"""
+import mmap
+import os
+import re
+from typing import Any, List, Optional, Tuple
+
+__all__ = ['PuzzleInput', 'load_input']
+
+INT_PATTERN: re.Pattern = re.compile(rb'-?\d+')
+# `NN.test`, plus extra examples saved as `NN.test_b`, `NN.test_2`, ...
+TEST_FILE_PATTERN: re.Pattern = re.compile(r'\.test(_\w+)?$')
+WHITESPACE: bytes = b' \t\r\n\x0b\x0c'
+
+
+class PuzzleInput:
+    """Puzzle input backed by a read-only memory map.
+
+    Attributes:
+        path (str): Absolute path of the input file.
+        data (memoryview): Data section, stripped of surrounding whitespace.
+        answer_a (Optional[str]): Expected part one answer (`.test` only).
+        answer_b (Optional[str]): Expected part two answer (`.test` only).
+    """
+
+    def __init__(self, file_path: str) -> None:
+        self.path: str = os.path.abspath(file_path)
+        self.answer_a: Optional[str] = None
+        self.answer_b: Optional[str] = None
+        self._mmap: Optional[mmap.mmap] = None
+        self._view: memoryview = memoryview(b'')
+        self._start: int = 0
+        self._end: int = 0
+
+        with open(self.path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size == 0:
+                self.data: memoryview = self._view
+                return
+            self._mmap = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._view = memoryview(self._mmap)
+
+        start: int = 0
+        end: int = len(self._mmap)
+        if TEST_FILE_PATTERN.search(self.path):
+            start, end = self._parse_test_sections()
+        self._start, self._end = self._strip(start, end)
+        self.data = self._view[self._start:self._end]
+
+    def _parse_test_sections(self) -> Tuple[int, int]:
+        """Locates the example data and reads the answers of a `.test` file.
+
+        Returns:
+            Tuple[int, int]: Offsets of the data section in the mapping.
+        """
+        mapping: mmap.mmap = self._mmap
+        data_start: int = mapping.find(b'Example data')
+        if data_start == -1:
+            return 0, 0
+        data_start = mapping.find(b'\n', data_start) + 1
+        data_end: int = mapping.find(b'\n-----------------', data_start)
+        if data_end == -1:
+            return 0, 0
+
+        # The answer section is a few short lines, copying it is cheap
+        answer_section: bytes = mapping[data_end:]
+        for line in answer_section.decode('utf-8').splitlines():
+            if line.startswith('answer_a:'):
+                ans: str = line.split(':')[1].strip()
+                self.answer_a = ans if ans not in ('-', '') else None
+            elif line.startswith('answer_b:'):
+                ans = line.split(':')[1].strip()
+                self.answer_b = ans if ans not in ('-', '') else None
+        return data_start, data_end
+
+    def _strip(self, start: int, end: int) -> Tuple[int, int]:
+        """Moves the offsets inwards past surrounding whitespace."""
+        view: memoryview = self._view
+        while start < end and view[start] in WHITESPACE:
+            start += 1
+        while end > start and view[end - 1] in WHITESPACE:
+            end -= 1
+        return start, end
+
+    def text(self) -> str:
+        """Decodes the data section into a string (one copy)."""
+        return str(self.data, 'utf-8')
+
+    def lines(self) -> List[str]:
+        """Splits the data section into lines."""
+        return self.text().splitlines()
+
+    def ints(self) -> List[int]:
+        """Extracts every (signed) integer of the data section.
+
+        The regular expression runs directly over the mapped buffer, only the
+        matched digits are ever copied.
+        """
+        return [int(match) for match in INT_PATTERN.findall(self.data)]
+
+    def grid(self) -> List[bytes]:
+        """Splits the data section into rows of bytes.
+
+        Rows index to ints (`grid[r][c] == ord('#')`), which avoids one
+        `str` object per cell. Each row is copied once, straight out of the
+        mapping.
+        """
+        rows: List[bytes] = []
+        if self._mmap is None:
+            return rows
+        mapping: mmap.mmap = self._mmap
+        pos: int = self._start
+        while pos < self._end:
+            newline: int = mapping.find(b'\n', pos, self._end)
+            if newline == -1:
+                newline = self._end
+            row_end: int = newline
+            if row_end > pos and mapping[row_end - 1] == 13:  # '\r'
+                row_end -= 1
+            rows.append(mapping[pos:row_end])
+            pos = newline + 1
+        return rows
+
+    def close(self) -> None:
+        """Releases the views and unmaps the file."""
+        self.data.release()
+        self._view.release()
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self) -> 'PuzzleInput':
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+def load_input(file_path: str) -> PuzzleInput:
+    """Maps an input file (`.in` or `.test`).
+
+    Args:
+        file_path (str): Path of the input file.
+
+    Returns:
+        PuzzleInput: The mapped input, usable as a context manager.
+    """
+    return PuzzleInput(file_path)
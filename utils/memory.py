@@ -0,0 +1,75 @@
+"""
+Peak-memory instrumentation with tracemalloc.
+
+`traced_call` runs a stage with tracemalloc enabled and reports the peak of
+traced memory during the call, and the source lines whose allocations grew
+the most between the start and the end of the call.
+"""
+import cProfile
+import linecache
+import os
+import tracemalloc
+from typing import Any, Callable, List, Tuple
+
+__all__ = ['traced_call']
+
+TRACEBACK_FRAMES: int = 1
+
+
+def format_site(stat: tracemalloc.StatisticDiff) -> str:
+    """`file:line (+size KiB, n blocks): source` of an allocation site."""
+    frame: tracemalloc.Frame = stat.traceback[0]
+    source: str = linecache.getline(frame.filename, frame.lineno).strip()
+    return (
+        f'{os.path.basename(frame.filename)}:{frame.lineno}'
+        f' (+{stat.size_diff / 1024:.1f} KiB, {stat.count_diff} blocks)'
+        f': {source}'
+    )
+
+
+def traced_call(
+    func: Callable[[], Any],
+    top: int = 5
+) -> Tuple[Any, int, List[str]]:
+    """Calls `func()` with tracemalloc and measures its memory use.
+
+    Only allocations made by Python are traced; the peak is relative to the
+    memory already traced when the call starts.
+
+    Args:
+        func (Callable[[], Any]): The stage to run.
+        top (int): Number of allocation sites to report.
+
+    Returns:
+        Tuple[Any, int, List[str]]: The result, the peak traced memory in
+        bytes and the `top` sites that grew the most.
+    """
+    was_tracing: bool = tracemalloc.is_tracing()
+    if not was_tracing:
+        tracemalloc.start(TRACEBACK_FRAMES)
+    try:
+        before: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+        baseline: int = tracemalloc.get_traced_memory()[0]
+        tracemalloc.reset_peak()
+
+        result: Any = func()
+
+        peak: int = tracemalloc.get_traced_memory()[1] - baseline
+        after: tracemalloc.Snapshot = tracemalloc.take_snapshot()
+    finally:
+        if not was_tracing:
+            tracemalloc.stop()
+
+    filters: List[tracemalloc.Filter] = [
+        tracemalloc.Filter(False, tracemalloc.__file__),
+        tracemalloc.Filter(False, linecache.__file__),
+        tracemalloc.Filter(False, cProfile.__file__),
+        tracemalloc.Filter(False, os.path.join(os.path.dirname(__file__), '*')),
+    ]
+    growth: List[tracemalloc.StatisticDiff] = [
+        stat for stat in after.filter_traces(filters).compare_to(
+            before.filter_traces(filters), 'lineno'
+        )
+        if stat.size_diff > 0
+    ]
+    return result, peak, [format_site(stat) for stat in growth[:top]]
@@ -0,0 +1,183 @@
+"""
+Run the parts of a day side by side in forked processes.
+
+Both parts only depend on the parsed input, so once `process` has run they
+can go in parallel. `fork_parts` forks one child per part after parsing:
+each child sees the parsed input through copy-on-write pages, nothing is
+copied or pickled on the way in, and a part that mutates its input only
+touches its own pages. Only the results travel back, pickled through a
+pipe, so the wall time becomes that of the slowest part.
+
+Plain `os.fork` is used rather than `multiprocessing`, since the runner
+calls this from pool workers, which may not start child processes. Where
+`fork` is not available the parts run one after the other.
+
+A day's `__main__` reads its input file and `--parallel` with
+`parse_args`, and opts in with `run_parts`:
+
+    infile, parallel = utils.parse_args(day)
+    ...
+    results = utils.run_parts(input_data, [solve_part_one, solve_part_two],
+                              parallel)
+
+Days with options of their own add them to `argument_parser(day)`.
+"""
+import argparse
+import functools
+import os
+import pickle
+import sys
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+__all__ = [
+    'argument_parser', 'can_fork', 'fork_parts', 'parse_args', 'run_parts'
+]
+
+
+def can_fork() -> bool:
+    """Whether this platform can fork."""
+    return hasattr(os, 'fork')
+
+
+def _read_all(fd: int) -> bytes:
+    """Reads a pipe until the writer closes it."""
+    chunks: List[bytes] = []
+    while True:
+        chunk: bytes = os.read(fd, 1 << 16)
+        if not chunk:
+            return b''.join(chunks)
+        chunks.append(chunk)
+
+
+def _run_child(call: Callable[[], Any], fd: int) -> None:
+    """Runs `call` in a forked child and writes `(ok, value)` to `fd`."""
+    try:
+        outcome: Tuple[bool, Any] = (True, call())
+    except BaseException as error:  # pylint: disable=broad-except
+        outcome = (False, error)
+    try:
+        payload: bytes = pickle.dumps(outcome, pickle.HIGHEST_PROTOCOL)
+    except Exception as error:  # pylint: disable=broad-except
+        payload = pickle.dumps((False, RuntimeError(
+            f'part result cannot be pickled: {error}'
+        )))
+    view: memoryview = memoryview(payload)
+    while view:
+        view = view[os.write(fd, view):]
+
+
+def fork_parts(calls: Sequence[Callable[[], Any]]) -> List[Any]:
+    """Runs every call in its own forked child process.
+
+    Args:
+        calls (Sequence[Callable[[], Any]]): One zero-argument callable per
+            part, usually closing over the parsed input.
+
+    Returns:
+        List[Any]: The result of each call, in order.
+
+    Raises:
+        BaseException: The exception raised by the first failing call, or
+            ChildProcessError if a child died without reporting.
+    """
+    if not can_fork() or len(calls) < 2:
+        return [call() for call in calls]
+
+    # Buffered output would otherwise be written once per process
+    sys.stdout.flush()
+    sys.stderr.flush()
+
+    children: List[Tuple[int, int]] = []
+    for call in calls:
+        read_fd, write_fd = os.pipe()
+        pid: int = os.fork()
+        if pid == 0:
+            os.close(read_fd)
+            try:
+                _run_child(call, write_fd)
+                sys.stdout.flush()
+                sys.stderr.flush()
+            finally:
+                os._exit(0)  # pylint: disable=protected-access
+        os.close(write_fd)
+        children.append((pid, read_fd))
+
+    outcomes: List[Tuple[bool, Any]] = []
+    for pid, read_fd in children:
+        try:
+            payload: bytes = _read_all(read_fd)
+        finally:
+            os.close(read_fd)
+            _, status = os.waitpid(pid, 0)
+        if not payload:
+            raise ChildProcessError(
+                f'part process {pid} exited without a result'
+                f' (status {status})'
+            )
+        outcomes.append(pickle.loads(payload))
+
+    for ok, value in outcomes:
+        if not ok:
+            raise value
+    return [value for _, value in outcomes]
+
+
+def run_parts(
+    data: Any,
+    parts: Sequence[Callable[[Any], Any]],
+    parallel: bool = False
+) -> List[Any]:
+    """Calls every part on the parsed input.
+
+    Args:
+        data (Any): The parsed input, shared by all parts.
+        parts (Sequence[Callable[[Any], Any]]): The solve functions.
+        parallel (bool): Run them at once in forked children.
+
+    Returns:
+        List[Any]: The result of each part, in order.
+    """
+    calls: List[Callable[[], Any]] = [
+        functools.partial(part, data) for part in parts
+    ]
+    if parallel:
+        return fork_parts(calls)
+    return [call() for call in calls]
+
+
+def argument_parser(day: str) -> argparse.ArgumentParser:
+    """Command line of a day run directly: input file and `--parallel`.
+
+    Args:
+        day (str): The day, as in its file name, giving the default
+            input `<day>.in`.
+
+    Returns:
+        argparse.ArgumentParser: A parser days can add options to.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description=f'Solve Advent of Code day {day}'
+    )
+    parser.add_argument(
+        'input_file', nargs='?', default=f'{day}.in',
+        help='input file name, in the year\'s in/ directory'
+    )
+    parser.add_argument(
+        '--parallel', action='store_true',
+        help='run both parts at once in forked processes'
+    )
+    return parser
+
+
+def parse_args(
+    day: str,
+    argv: Optional[List[str]] = None
+) -> Tuple[str, bool]:
+    """Reads a day's command line.
+
+    Returns:
+        Tuple[str, bool]: The input file name and whether to run the
+        parts in parallel.
+    """
+    args: argparse.Namespace = argument_parser(day).parse_args(argv)
+    return args.input_file, args.parallel
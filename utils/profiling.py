@@ -0,0 +1,148 @@
+"""
+Profiling hooks for solve stages.
+
+`profile_call` runs one stage (`process`, `solve_part_one`, ...) under
+cProfile and writes two files next to each other:
+
+- `<stem>.pstats`, loadable with `pstats`/snakeviz,
+- `<stem>.collapsed`, one `frame;frame;frame count` line per stack, the
+  input format of flamegraph.pl and speedscope.
+
+With `sample=True` the collapsed stacks come from a SIGPROF sampling
+profiler running alongside cProfile, so they hold full call stacks.
+Otherwise they are derived from the cProfile caller graph (caller;callee
+pairs weighted by internal time in microseconds).
+"""
+import cProfile
+import os
+import pstats
+import signal
+import threading
+import time
+from collections import Counter
+from types import FrameType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+__all__ = ['StackSampler', 'profile_call']
+
+SAMPLE_INTERVAL: float = 0.001
+
+
+def frame_label(code_file: str, name: str, line: int) -> str:
+    """Flame graph label of a frame: `file:function:line`."""
+    return f'{os.path.basename(code_file)}:{name}:{line}'
+
+
+class StackSampler:
+    """Samples the main thread call stack on SIGPROF.
+
+    Stacks are cut at the frame running `root` (when given), so that the
+    frames of the caller (runner, process pool) are left out. Only usable
+    on Unix, from the main thread.
+    """
+
+    def __init__(
+        self,
+        root: Optional[Callable[..., Any]] = None,
+        interval: float = SAMPLE_INTERVAL
+    ) -> None:
+        self.root_code: Any = getattr(root, '__code__', None)
+        self.interval: float = interval
+        self.stacks: Counter = Counter()
+        self._previous_handler: Any = None
+
+    @staticmethod
+    def available() -> bool:
+        """Whether SIGPROF sampling can run in this thread."""
+        return (
+            hasattr(signal, 'SIGPROF')
+            and threading.current_thread() is threading.main_thread()
+        )
+
+    def _handler(self, _signum: int, frame: Optional[FrameType]) -> None:
+        labels: List[str] = []
+        while frame is not None:
+            code = frame.f_code
+            labels.append(
+                frame_label(code.co_filename, code.co_name,
+                            code.co_firstlineno)
+            )
+            if code is self.root_code:
+                break
+            frame = frame.f_back
+        if labels:
+            self.stacks[';'.join(reversed(labels))] += 1
+
+    def __enter__(self) -> 'StackSampler':
+        self._previous_handler = signal.signal(signal.SIGPROF, self._handler)
+        signal.setitimer(signal.ITIMER_PROF, self.interval, self.interval)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        signal.setitimer(signal.ITIMER_PROF, 0, 0)
+        signal.signal(signal.SIGPROF, self._previous_handler)
+
+
+def collapsed_from_stats(stats: pstats.Stats) -> Counter:
+    """Builds caller;callee pairs weighted by internal time (us)."""
+    stacks: Counter = Counter()
+    raw_stats: Dict[Tuple[str, int, str], Any] = stats.stats  # type: ignore
+    for (file_name, line, name), (_, _, tottime, _, callers) in \
+            raw_stats.items():
+        callee: str = frame_label(file_name, name, line)
+        if not callers:
+            stacks[callee] += round(tottime * 1e6)
+            continue
+        for (c_file, c_line, c_name), caller_stats in callers.items():
+            caller: str = frame_label(c_file, c_name, c_line)
+            stacks[f'{caller};{callee}'] += round(caller_stats[2] * 1e6)
+    return stacks
+
+
+def write_collapsed(stacks: Counter, path: str) -> None:
+    """Writes stacks in the collapsed (folded) format."""
+    with open(path, 'w', encoding='utf-8') as file:
+        for stack, count in sorted(stacks.items()):
+            if count > 0:
+                file.write(f'{stack} {count}\n')
+
+
+def profile_call(
+    func: Callable[..., Any],
+    args: Tuple[Any, ...],
+    stem: str,
+    sample: bool = False
+) -> Tuple[Any, float]:
+    """Calls `func(*args)` under cProfile and writes its profile files.
+
+    Args:
+        func (Callable[..., Any]): The stage to profile.
+        args (Tuple[Any, ...]): Its positional arguments.
+        stem (str): Output path without extension.
+        sample (bool): Also run the sampling profiler for full stacks.
+
+    Returns:
+        Tuple[Any, float]: The result and the elapsed seconds (including
+        the profiler overhead).
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(stem)), exist_ok=True)
+    sampler: Optional[StackSampler] = None
+    if sample and StackSampler.available():
+        sampler = StackSampler(root=func)
+
+    profiler: cProfile.Profile = cProfile.Profile()
+    start: float = time.perf_counter()
+    if sampler is not None:
+        with sampler:
+            result: Any = profiler.runcall(func, *args)
+    else:
+        result = profiler.runcall(func, *args)
+    elapsed: float = time.perf_counter() - start
+
+    profiler.dump_stats(f'{stem}.pstats')
+    stacks: Counter = (
+        sampler.stacks if sampler is not None
+        else collapsed_from_stats(pstats.Stats(profiler))
+    )
+    write_collapsed(stacks, f'{stem}.collapsed')
+    return result, elapsed
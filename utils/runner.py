@@ -0,0 +1,589 @@
+"""
+Run every solution of a year in a process pool and report timings.
+
+Each `YYYY/solutions/NN.py` is imported as a module and driven through its
+`process`, `solve_part_one`/`solve_part_two` (or `solve`) functions. The
+report (JSON or CSV) is written to `YYYY/out/` and holds parse time, time per
+part and peak RSS of every day.
+
+Usage:
+    python -m utils.runner 2024
+    python -m utils.runner 2024 --days 6 9 --format csv
+    python -m utils.runner 2024 --days 1 2 --stream --memory
+    python -m utils.runner 2023 --days 23 --parallel-parts
+    python -m utils.runner 2024 --days 6 7 --solve-workers 4
+"""
+import argparse
+import contextlib
+import csv
+import functools
+import importlib.util
+import inspect
+import io
+import json
+import multiprocessing
+import os
+import resource
+import sys
+import time
+import traceback
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from .cache import cached_process
+from .frozen import copy_for_part
+from .get_input import read_input
+from .memory import traced_call
+from .parallel import fork_parts
+from .profiling import profile_call
+from .stream import stream_records
+
+__all__ = [
+    'REPORT_FIELDS',
+    'discover_days',
+    'load_solution',
+    'run_day',
+    'run_year',
+    'write_report',
+]
+
+root_directory: str = os.path.dirname(
+    os.path.dirname(os.path.abspath(__file__))
+)
+
+REPORT_FIELDS: List[str] = [
+    'year',
+    'day',
+    'input',
+    'status',
+    'part_one',
+    'part_two',
+    'parse_time',
+    'parse_cached',
+    'streamed',
+    'part_one_time',
+    'part_two_time',
+    'total_time',
+    'peak_rss_kb',
+    'parse_peak_kb',
+    'part_one_peak_kb',
+    'part_two_peak_kb',
+    'top_allocations',
+    'error',
+]
+
+# Report field prefix of each stage
+STAGE_FIELDS: Dict[str, str] = {
+    'process': 'parse',
+    'solve': 'part_one',
+    'solve_part_one': 'part_one',
+    'solve_part_two': 'part_two',
+    'solve_stream': 'part_one',
+}
+
+
+def year_directory(year: int) -> str:
+    """Returns the absolute path of a year directory."""
+    return os.path.join(root_directory, str(year))
+
+
+def discover_days(year: int) -> List[int]:
+    """Finds every `NN.py` solution for a year.
+
+    Args:
+        year (int): Puzzle year.
+
+    Returns:
+        List[int]: Sorted day numbers with a solution file.
+    """
+    solutions_directory: str = os.path.join(year_directory(year), 'solutions')
+    days: List[int] = []
+    for file_name in os.listdir(solutions_directory):
+        stem, ext = os.path.splitext(file_name)
+        if ext == '.py' and len(stem) == 2 and stem.isdigit():
+            days.append(int(stem))
+    return sorted(days)
+
+
+def solution_path(year: int, day: int) -> str:
+    """Returns the path of the solution file of a day."""
+    return os.path.join(year_directory(year), 'solutions', f'{day:02d}.py')
+
+
+def input_path(year: int, day: int, infile: Optional[str] = None) -> str:
+    """Returns the path of an input file of a day (`NN.in` by default)."""
+    file_name: str = infile if infile is not None else f'{day:02d}.in'
+    return os.path.join(year_directory(year), 'in', file_name)
+
+
+def load_solution(year: int, day: int) -> ModuleType:
+    """Imports a solution file as a module without running its `__main__`.
+
+    Args:
+        year (int): Puzzle year.
+        day (int): Puzzle day.
+
+    Returns:
+        ModuleType: The imported solution module.
+    """
+    module_name: str = f'aoc{year}_{day:02d}'
+    if module_name in sys.modules:
+        return sys.modules[module_name]
+
+    spec = importlib.util.spec_from_file_location(
+        module_name, solution_path(year, day)
+    )
+    module: ModuleType = importlib.util.module_from_spec(spec)
+    sys.modules[module_name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[module_name]
+        raise
+    return module
+
+
+def solution_parts(
+    module: ModuleType
+) -> List[Tuple[str, Callable[[Any], Any]]]:
+    """Lists the solve stages exposed by a solution module.
+
+    A module with `solve_part_one`/`solve_part_two` yields one stage per part.
+    A module with a single `solve` yields one stage named 'solve', whose
+    result is either `(part_one, part_two)` or the part one answer.
+    """
+    parts: List[Tuple[str, Callable[[Any], Any]]] = []
+    for name in ('solve_part_one', 'solve_part_two'):
+        if callable(getattr(module, name, None)):
+            parts.append((name, getattr(module, name)))
+    if not parts and callable(getattr(module, 'solve', None)):
+        parts.append(('solve', module.solve))
+    return parts
+
+
+def answer_of(result: Any) -> Any:
+    """Extracts the answer from a part result.
+
+    Some parts return `(answer, extra)` to share state with the next part, the
+    answer is always the first element.
+    """
+    if isinstance(result, tuple) and result:
+        return result[0]
+    return result
+
+
+def peak_rss_kb() -> int:
+    """Peak resident set size of the current process, or of its largest
+    child (forked parts), in KiB."""
+    peak: int = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss
+    )
+    # ru_maxrss is reported in bytes on macOS and in KiB on Linux
+    return peak // 1024 if sys.platform == 'darwin' else peak
+
+
+def timed(func: Callable[..., Any], *args: Any) -> Tuple[Any, float]:
+    """Calls a function and returns its result with the elapsed seconds."""
+    start: float = time.perf_counter()
+    result: Any = func(*args)
+    return result, time.perf_counter() - start
+
+
+def parse(
+    module: ModuleType,
+    raw_data: str,
+    cache: bool = False
+) -> Tuple[Any, bool]:
+    """Runs the module's `process` on the raw input.
+
+    Decorators such as `utils.cached` are stripped so that `cache` alone
+    decides whether the parsed input comes from the on-disk cache.
+
+    Returns:
+        Tuple[Any, bool]: The parsed input and whether it was a cache hit.
+    """
+    process: Callable[[str], Any] = inspect.unwrap(module.process)
+    if cache:
+        return cached_process(process, raw_data)
+    return process(raw_data), False
+
+
+def run_day(
+    year: int,
+    day: int,
+    infile: Optional[str] = None,
+    cache: bool = False,
+    profile: bool = False,
+    sample: bool = False,
+    memory: bool = False,
+    stream: bool = False,
+    parallel_parts: bool = False,
+    solve_workers: Optional[int] = None
+) -> Dict[str, Any]:
+    """Runs both parts of a single day and records its timings.
+
+    Solutions print while they solve, their stdout is discarded. Every part
+    gets its own deep copy of the parsed input since some parts mutate it,
+    unless `process` returned frozen data (see `utils.frozen`).
+
+    When profiling, each stage writes `NN_<stage>.pstats` and
+    `NN_<stage>.collapsed` to `YYYY/out/profiles/`, and the recorded times
+    include the profiler overhead.
+
+    In memory mode every stage runs under tracemalloc: its peak traced
+    memory goes to `<stage>_peak_kb` and the allocation sites that grew the
+    most to `top_allocations`.
+
+    In stream mode a day exposing `parse_line` and `solve_stream` is solved
+    in a single pass over the input file, one record at a time, without
+    reading it whole; both parts are timed together as part one. Other days
+    run as usual.
+
+    With `parallel_parts` the process forks after parsing and each part
+    runs in its own child, reading the parsed input through copy-on-write
+    pages (no copy at all); `total_time` is then close to the slowest part.
+
+    Days that can split a part across processes themselves expose a
+    `WORKERS` count, 1 by default; `solve_workers` overrides it.
+
+    Args:
+        year (int): Puzzle year.
+        day (int): Puzzle day.
+        infile (Optional[str]): Input file name inside `YYYY/in`.
+        cache (bool): Load the parsed input from the on-disk cache.
+        profile (bool): Run every stage under cProfile.
+        sample (bool): Also sample full call stacks while profiling.
+        memory (bool): Record peak traced memory and allocation sites.
+        stream (bool): Solve line by line where the day supports it.
+        parallel_parts (bool): Run the two parts at once in forked children.
+        solve_workers (Optional[int]): Processes a part of a day exposing
+            `WORKERS` may fork.
+
+    Returns:
+        Dict[str, Any]: A report record with the keys of `REPORT_FIELDS`.
+    """
+    record: Dict[str, Any] = {field: None for field in REPORT_FIELDS}
+    record.update({
+        'year': year,
+        'day': day,
+        'input': infile if infile is not None else f'{day:02d}.in',
+    })
+    start: float = time.perf_counter()
+    profile_directory: str = os.path.join(
+        year_directory(year), 'out', 'profiles'
+    )
+
+    def measure(
+        stage: str,
+        func: Callable[..., Any],
+        *args: Any
+    ) -> Any:
+        def call() -> Tuple[Any, float]:
+            if profile:
+                stem: str = os.path.join(
+                    profile_directory, f'{day:02d}_{stage}'
+                )
+                return profile_call(func, args, stem, sample)
+            return timed(func, *args)
+
+        field: str = STAGE_FIELDS[stage]
+        if memory:
+            (result, elapsed), peak, sites = traced_call(call)
+            record[f'{field}_peak_kb'] = peak // 1024
+            record['top_allocations'] = (record['top_allocations'] or []) + [
+                f'{stage}: {site}' for site in sites
+            ]
+        else:
+            result, elapsed = call()
+        record[f'{field}_time'] = elapsed
+        return result
+
+    def measure_forked(
+        stage: str,
+        func: Callable[..., Any],
+        *args: Any
+    ) -> Tuple[Any, Dict[str, Any]]:
+        # Runs in a forked child: the record fields set by `measure` are
+        # sent back to the parent along with the result
+        field: str = STAGE_FIELDS[stage]
+        record['top_allocations'] = None
+        result: Any = measure(stage, func, *args)
+        return result, {
+            key: record[key] for key in
+            (f'{field}_time', f'{field}_peak_kb', 'top_allocations')
+        }
+
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            module: ModuleType = load_solution(year, day)
+            if solve_workers and hasattr(module, 'WORKERS'):
+                module.WORKERS = solve_workers
+            record['streamed'] = stream and all(
+                callable(getattr(module, name, None))
+                for name in ('parse_line', 'solve_stream')
+            )
+            if record['streamed']:
+                record['part_one'], record['part_two'] = measure(
+                    'solve_stream',
+                    lambda path: module.solve_stream(
+                        stream_records(path, module.parse_line)
+                    ),
+                    input_path(year, day, infile)
+                )
+            else:
+                raw_data: Optional[str] = read_input(
+                    input_path(year, day, infile)
+                )['data']
+
+                data: Any = raw_data
+                if callable(getattr(module, 'process', None)):
+                    data, record['parse_cached'] = measure(
+                        'process', parse, module, raw_data, cache
+                    )
+
+                parts = solution_parts(module)
+                if not parts:
+                    raise AttributeError('no solve functions found')
+
+                results: List[Any] = []
+                if parallel_parts and len(parts) > 1:
+                    for result, fields in fork_parts([
+                        functools.partial(measure_forked, name, func, data)
+                        for name, func in parts
+                    ]):
+                        sites: List[str] = fields.pop('top_allocations') or []
+                        record.update(fields)
+                        if sites:
+                            record['top_allocations'] = (
+                                record['top_allocations'] or []
+                            ) + sites
+                        results.append(result)
+                else:
+                    results = [
+                        measure(name, func, copy_for_part(data))
+                        for name, func in parts
+                    ]
+
+                for (name, _), result in zip(parts, results):
+                    if name == 'solve':
+                        if isinstance(result, tuple) and len(result) == 2:
+                            record['part_one'], record['part_two'] = result
+                        else:
+                            record['part_one'] = result
+                    else:
+                        record[STAGE_FIELDS[name]] = answer_of(result)
+        record['status'] = 'ok'
+    except Exception as error:  # pylint: disable=broad-except
+        record['status'] = 'error'
+        record['error'] = ''.join(
+            traceback.format_exception_only(type(error), error)
+        ).strip()
+
+    record['total_time'] = time.perf_counter() - start
+    record['peak_rss_kb'] = peak_rss_kb()
+    return record
+
+
+def _run_day_task(
+    args: Tuple[int, int, Optional[str], Dict[str, Any]]
+) -> Dict[str, Any]:
+    """Pool entry point for `run_day`."""
+    year, day, infile, options = args
+    return run_day(year, day, infile, **options)
+
+
+def previous_timings(report_path: str) -> Dict[int, float]:
+    """Reads per-day total times from an earlier JSON report, if any."""
+    if not os.path.isfile(report_path) or not report_path.endswith('.json'):
+        return {}
+    with open(report_path, 'r', encoding='utf-8') as file:
+        try:
+            records: List[Dict[str, Any]] = json.load(file)['days']
+        except (ValueError, KeyError):
+            return {}
+    return {
+        record['day']: record['total_time'] or 0.0 for record in records
+    }
+
+
+def run_year(
+    year: int,
+    days: Optional[List[int]] = None,
+    workers: Optional[int] = None,
+    infile: Optional[str] = None,
+    history: Optional[Dict[int, float]] = None,
+    **options: Any
+) -> List[Dict[str, Any]]:
+    """Runs a set of days across a process pool.
+
+    Each day gets a fresh worker process so that its peak RSS is its own.
+    Days known to be slow from `history` are started first, so the wall time
+    stays close to the slowest single day.
+
+    Args:
+        year (int): Puzzle year.
+        days (Optional[List[int]]): Days to run, all of them by default.
+        workers (Optional[int]): Pool size, the CPU count by default.
+        infile (Optional[str]): Input file name, `NN.in` by default.
+        history (Optional[Dict[int, float]]): Earlier total time per day.
+        **options: Extra keyword arguments of `run_day`.
+
+    Returns:
+        List[Dict[str, Any]]: One report record per day, sorted by day.
+    """
+    days = days if days else discover_days(year)
+    history = history or {}
+    ordered_days: List[int] = sorted(
+        days, key=lambda d: history.get(d, 0.0), reverse=True
+    )
+    tasks: List[Tuple[int, int, Optional[str], Dict[str, Any]]] = [
+        (year, day, infile, options) for day in ordered_days
+    ]
+
+    records: List[Dict[str, Any]] = []
+    with multiprocessing.Pool(workers, maxtasksperchild=1) as pool:
+        for record in pool.imap_unordered(_run_day_task, tasks, chunksize=1):
+            records.append(record)
+    return sorted(records, key=lambda record: record['day'])
+
+
+def write_report(
+    records: List[Dict[str, Any]],
+    report_path: str,
+    wall_time: Optional[float] = None
+) -> None:
+    """Writes report records as JSON or CSV depending on the file extension.
+    """
+    os.makedirs(os.path.dirname(os.path.abspath(report_path)), exist_ok=True)
+    if report_path.endswith('.csv'):
+        with open(report_path, 'w', encoding='utf-8', newline='') as file:
+            writer = csv.DictWriter(
+                file, fieldnames=REPORT_FIELDS, extrasaction='ignore'
+            )
+            writer.writeheader()
+            for record in records:
+                writer.writerow({
+                    key: ' | '.join(value) if isinstance(value, list)
+                    else value
+                    for key, value in record.items()
+                })
+    else:
+        with open(report_path, 'w', encoding='utf-8') as file:
+            json.dump(
+                {'wall_time': wall_time, 'days': records},
+                file,
+                indent=2,
+                default=str
+            )
+
+
+def print_summary(records: List[Dict[str, Any]], wall_time: float) -> None:
+    """Prints a one-line summary per day."""
+    def fmt(seconds: Optional[float]) -> str:
+        return f'{seconds * 1000:9.1f}ms' if seconds is not None else ' ' * 11
+
+    for record in records:
+        line: str = (
+            f"{record['day']:02d} {record['status']:5s}"
+            f" parse{fmt(record['parse_time'])}"
+            f" p1{fmt(record['part_one_time'])}"
+            f" p2{fmt(record['part_two_time'])}"
+            f" rss {record['peak_rss_kb']:>8d}KiB"
+        )
+        if record['part_one_peak_kb'] is not None:
+            line += ''.join(
+                f" {label} {record[f'{field}_peak_kb']}KiB"
+                for label, field in (
+                    ('parse', 'parse'), ('p1', 'part_one'), ('p2', 'part_two')
+                )
+                if record[f'{field}_peak_kb'] is not None
+            )
+        if record['error']:
+            line += f"  {record['error']}"
+        print(line)
+        for site in record['top_allocations'] or []:
+            print(f'    {site}')
+    total: float = sum(record['total_time'] for record in records)
+    print(f'wall {wall_time:.2f}s, sum of days {total:.2f}s')
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Run all solutions of a year in parallel'
+    )
+    parser.add_argument('year', type=int, help='Puzzle year')
+    parser.add_argument(
+        '--days', type=int, nargs='+', help='Days to run (default: all)'
+    )
+    parser.add_argument(
+        '--input', dest='infile', help='Input file name (default: NN.in)'
+    )
+    parser.add_argument(
+        '--workers', type=int, help='Number of worker processes'
+    )
+    parser.add_argument(
+        '--format', choices=['json', 'csv'], default='json',
+        help='Report format'
+    )
+    parser.add_argument('--output', help='Report path')
+    parser.add_argument(
+        '--cache', action='store_true',
+        help='Cache parsed inputs on disk (YYYY/out/cache)'
+    )
+    parser.add_argument(
+        '--profile', action='store_true',
+        help='Profile every stage with cProfile (YYYY/out/profiles)'
+    )
+    parser.add_argument(
+        '--sample', action='store_true',
+        help='With --profile, sample full call stacks for flame graphs'
+    )
+    parser.add_argument(
+        '--memory', action='store_true',
+        help='Record peak traced memory and top allocation sites'
+    )
+    parser.add_argument(
+        '--stream', action='store_true',
+        help='Solve line-oriented days in one streaming pass'
+    )
+    parser.add_argument(
+        '--parallel-parts', action='store_true',
+        help='Fork after parsing and run both parts at once'
+    )
+    parser.add_argument(
+        '--solve-workers', type=int,
+        help='Processes a part may fork, for days exposing WORKERS'
+    )
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    report_path: str = args.output or os.path.join(
+        year_directory(args.year), 'out', f'report.{args.format}'
+    )
+
+    start: float = time.perf_counter()
+    records: List[Dict[str, Any]] = run_year(
+        args.year,
+        days=args.days,
+        workers=args.workers,
+        infile=args.infile,
+        history=previous_timings(report_path),
+        cache=args.cache,
+        profile=args.profile,
+        sample=args.sample,
+        memory=args.memory,
+        stream=args.stream,
+        parallel_parts=args.parallel_parts,
+        solve_workers=args.solve_workers
+    )
+    wall_time: float = time.perf_counter() - start
+
+    write_report(records, report_path, wall_time)
+    print_summary(records, wall_time)
+    print(f'Report written to {report_path}')
+    return 0 if all(r['status'] == 'ok' for r in records) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,295 @@
+"""
+Shortest-path searches over integer-encoded states.
+
+Every search works on states numbered `0 .. size - 1`. Solutions encode
+their own state into that range, e.g. a `Grid` flat index and a direction as
+`index * 4 + direction`, so that distances and parents live in flat arrays
+instead of dicts of tuples. Edges come from a `neighbours(state)` callable:
+
+- `bfs`: unweighted, `neighbours(state)` yields states.
+- `dijkstra`: non-negative weights, `neighbours(state)` yields
+  `(state, weight)` pairs; with a `heuristic` it runs as A*.
+- `dial`: Dijkstra with a bucket queue, for small integer weights
+  (`0 <= weight <= max_weight`).
+
+All of them accept several sources (multi-source search) and an optional
+`goal(state)` predicate that stops the search once a goal state is settled.
+`reverse_neighbours` builds the incoming edges of a graph for backward
+searches. Parents are only recorded with `parents=True`; paths are then
+rebuilt on demand by `SearchResult.path`.
+"""
+from array import array
+from heapq import heappop, heappush
+from typing import (
+    Callable,
+    Iterable,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+)
+
+__all__ = [
+    'UNREACHED',
+    'SearchResult',
+    'bfs',
+    'dial',
+    'dijkstra',
+    'reverse_neighbours',
+]
+
+UNREACHED: int = -1
+
+Edge = TypeVar('Edge', int, Tuple[int, int])
+
+
+def state_array(size: int, fill: int = UNREACHED) -> array:
+    """Signed 64-bit array of `size` entries set to `fill`."""
+    return array('q', [fill]) * size
+
+
+class SearchResult:
+    """Distances (and optionally parents) computed by a search.
+
+    Attributes:
+        dist (array): Distance per state, `UNREACHED` if never reached. When
+            the search stopped at a goal, states that were not settled yet
+            may hold an upper bound rather than their distance.
+        parent (Optional[array]): Predecessor per state (`UNREACHED` for
+            sources and unreached states), None unless parents were tracked.
+        goal (Optional[int]): The goal state the search stopped at.
+    """
+
+    __slots__ = ('dist', 'parent', 'goal')
+
+    def __init__(
+        self,
+        dist: array,
+        parent: Optional[array],
+        goal: Optional[int] = None
+    ) -> None:
+        self.dist: array = dist
+        self.parent: Optional[array] = parent
+        self.goal: Optional[int] = goal
+
+    def distance(self, state: Optional[int] = None) -> Optional[int]:
+        """Distance of `state` (the goal by default), None if unreached."""
+        if state is None:
+            state = self.goal
+        if state is None or self.dist[state] == UNREACHED:
+            return None
+        return self.dist[state]
+
+    def path(self, state: Optional[int] = None) -> List[int]:
+        """States from a source to `state` (the goal by default).
+
+        Raises:
+            ValueError: If parents were not tracked or `state` was not
+                reached.
+        """
+        if self.parent is None:
+            raise ValueError('search was run without parents=True')
+        if state is None:
+            state = self.goal
+        if state is None or self.dist[state] == UNREACHED:
+            raise ValueError(f'state {state} was not reached')
+        parent: array = self.parent
+        path: List[int] = [state]
+        while parent[state] != UNREACHED:
+            state = parent[state]
+            path.append(state)
+        path.reverse()
+        return path
+
+
+def bfs(
+    size: int,
+    sources: Iterable[int],
+    neighbours: Callable[[int], Iterable[int]],
+    goal: Optional[Callable[[int], bool]] = None,
+    parents: bool = False
+) -> SearchResult:
+    """Breadth-first search, level by level.
+
+    Args:
+        size (int): Number of states.
+        sources (Iterable[int]): Start states, all at distance 0.
+        neighbours (Callable[[int], Iterable[int]]): Successors of a state.
+        goal (Optional[Callable[[int], bool]]): Stop at the first state
+            (in distance order) satisfying it.
+        parents (bool): Record the predecessor of every reached state.
+
+    Returns:
+        SearchResult: Distances, parents and the goal reached.
+    """
+    dist: array = state_array(size)
+    parent: Optional[array] = state_array(size) if parents else None
+    frontier: List[int] = []
+    for source in sources:
+        if dist[source] == UNREACHED:
+            dist[source] = 0
+            frontier.append(source)
+
+    level: int = 0
+    while frontier:
+        level += 1
+        next_frontier: List[int] = []
+        for state in frontier:
+            if goal is not None and goal(state):
+                return SearchResult(dist, parent, state)
+            for successor in neighbours(state):
+                if dist[successor] == UNREACHED:
+                    dist[successor] = level
+                    if parent is not None:
+                        parent[successor] = state
+                    next_frontier.append(successor)
+        frontier = next_frontier
+    return SearchResult(dist, parent)
+
+
+def dijkstra(
+    size: int,
+    sources: Iterable[int],
+    neighbours: Callable[[int], Iterable[Tuple[int, int]]],
+    goal: Optional[Callable[[int], bool]] = None,
+    parents: bool = False,
+    heuristic: Optional[Callable[[int], int]] = None
+) -> SearchResult:
+    """Dijkstra's algorithm on a binary heap, A* with a heuristic.
+
+    Heap entries are single ints, `priority * size + state`, which compare
+    faster than tuples.
+
+    Args:
+        size (int): Number of states.
+        sources (Iterable[int]): Start states, all at distance 0.
+        neighbours (Callable[[int], Iterable[Tuple[int, int]]]):
+            `(successor, weight)` pairs of a state, weights >= 0.
+        goal (Optional[Callable[[int], bool]]): Stop when a state
+            satisfying it is settled.
+        parents (bool): Record the predecessor of every reached state.
+        heuristic (Optional[Callable[[int], int]]): Consistent lower bound
+            of the remaining distance to the goal (A*).
+
+    Returns:
+        SearchResult: Distances, parents and the goal reached.
+    """
+    dist: array = state_array(size)
+    parent: Optional[array] = state_array(size) if parents else None
+    settled: bytearray = bytearray(size)
+    heap: List[int] = []
+    for source in sources:
+        if dist[source] == UNREACHED:
+            dist[source] = 0
+            heap.append(
+                (heuristic(source) if heuristic else 0) * size + source
+            )
+    heap.sort()
+
+    while heap:
+        state: int = heappop(heap) % size
+        if settled[state]:
+            continue
+        settled[state] = 1
+        if goal is not None and goal(state):
+            return SearchResult(dist, parent, state)
+        base: int = dist[state]
+        for successor, weight in neighbours(state):
+            candidate: int = base + weight
+            known: int = dist[successor]
+            if known == UNREACHED or candidate < known:
+                dist[successor] = candidate
+                if parent is not None:
+                    parent[successor] = state
+                if heuristic is not None:
+                    candidate += heuristic(successor)
+                heappush(heap, candidate * size + successor)
+    return SearchResult(dist, parent)
+
+
+def dial(
+    size: int,
+    sources: Iterable[int],
+    neighbours: Callable[[int], Iterable[Tuple[int, int]]],
+    max_weight: int,
+    goal: Optional[Callable[[int], bool]] = None,
+    parents: bool = False
+) -> SearchResult:
+    """Dijkstra's algorithm with a circular bucket queue (Dial).
+
+    Pushes and pops are O(1), which beats a heap when every weight is a
+    small integer, e.g. the 1..9 heat losses of a digit grid.
+
+    Args:
+        size (int): Number of states.
+        sources (Iterable[int]): Start states, all at distance 0.
+        neighbours (Callable[[int], Iterable[Tuple[int, int]]]):
+            `(successor, weight)` pairs of a state.
+        max_weight (int): Largest edge weight.
+        goal (Optional[Callable[[int], bool]]): Stop when a state
+            satisfying it is settled.
+        parents (bool): Record the predecessor of every reached state.
+
+    Returns:
+        SearchResult: Distances, parents and the goal reached.
+    """
+    dist: array = state_array(size)
+    parent: Optional[array] = state_array(size) if parents else None
+    settled: bytearray = bytearray(size)
+    buckets: List[List[int]] = [[] for _ in range(max_weight + 1)]
+    pending: int = 0
+    for source in sources:
+        if dist[source] == UNREACHED:
+            dist[source] = 0
+            buckets[0].append(source)
+            pending += 1
+
+    current: int = 0
+    while pending:
+        bucket: List[int] = buckets[current % len(buckets)]
+        while bucket:
+            state: int = bucket.pop()
+            pending -= 1
+            if settled[state]:
+                continue
+            settled[state] = 1
+            if goal is not None and goal(state):
+                return SearchResult(dist, parent, state)
+            for successor, weight in neighbours(state):
+                candidate: int = current + weight
+                known: int = dist[successor]
+                if known == UNREACHED or candidate < known:
+                    dist[successor] = candidate
+                    if parent is not None:
+                        parent[successor] = state
+                    buckets[candidate % len(buckets)].append(successor)
+                    pending += 1
+        current += 1
+    return SearchResult(dist, parent)
+
+
+def reverse_neighbours(
+    size: int,
+    neighbours: Callable[[int], Iterable[Edge]]
+) -> Callable[[int], List[Edge]]:
+    """Builds the incoming edges of every state, for backward searches.
+
+    Works with both unweighted (`bfs`) and weighted (`dijkstra`, `dial`)
+    neighbour functions; every state's successors are listed once.
+
+    Args:
+        size (int): Number of states.
+        neighbours (Callable[[int], Iterable[Edge]]): Forward edges.
+
+    Returns:
+        Callable[[int], List[Edge]]: Predecessors of a state, in the same
+        form as the forward edges.
+    """
+    incoming: List[List[Edge]] = [[] for _ in range(size)]
+    for state in range(size):
+        for edge in neighbours(state):
+            if isinstance(edge, tuple):
+                incoming[edge[0]].append((state, edge[1]))  # type: ignore
+            else:
+                incoming[edge].append(state)  # type: ignore
+    return incoming.__getitem__
@@ -0,0 +1,71 @@
+"""
+Streaming line records for inputs too large to hold in memory.
+
+`stream_records(path, parse_line)` reads an input file through a buffered
+reader and yields one parsed record per non-blank line, so only the current
+line and its record are alive at any time. For `.test` files only the lines
+of the example data section are yielded.
+
+Line-oriented solutions opt in by exposing, next to `process`:
+
+- `parse_line(line: str) -> record`, used by `process` too,
+- `solve_stream(records: Iterable[record]) -> (part_one, part_two)`, which
+  consumes the records in a single pass.
+
+The runner drives these with `--stream`.
+"""
+import io
+from typing import Callable, Iterator, TypeVar
+
+from .loader import TEST_FILE_PATTERN
+
+__all__ = ['data_lines', 'stream_records']
+
+BUFFER_SIZE: int = 1 << 16
+TEST_DATA_HEADER: str = 'Example data'
+TEST_DATA_END: str = '-----------------'
+
+Record = TypeVar('Record')
+
+
+def data_lines(path: str, buffer_size: int = BUFFER_SIZE) -> Iterator[str]:
+    """Yields the stripped, non-blank data lines of an input file.
+
+    Args:
+        path (str): Input file (`.in` or `.test`).
+        buffer_size (int): Read buffer size in bytes.
+
+    Yields:
+        str: One data line at a time.
+    """
+    is_test: bool = TEST_FILE_PATTERN.search(path) is not None
+    with io.open(path, 'r', encoding='utf-8', buffering=buffer_size) as file:
+        if is_test:
+            for line in file:
+                if TEST_DATA_HEADER in line:
+                    break
+        for line in file:
+            if is_test and line.startswith(TEST_DATA_END):
+                return
+            line = line.strip()
+            if line:
+                yield line
+
+
+def stream_records(
+    path: str,
+    parse_line: Callable[[str], Record],
+    buffer_size: int = BUFFER_SIZE
+) -> Iterator[Record]:
+    """Yields `parse_line(line)` for every data line of an input file.
+
+    Args:
+        path (str): Input file (`.in` or `.test`).
+        parse_line (Callable[[str], Record]): Parser of a single line.
+        buffer_size (int): Read buffer size in bytes.
+
+    Yields:
+        Record: One parsed record at a time.
+    """
+    for line in data_lines(path, buffer_size):
+        yield parse_line(line)
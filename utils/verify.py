@@ -0,0 +1,166 @@
+"""
+Check every solution of a year against the answers of its `.test` files.
+
+The example files fetched by `get_data.sh` (`NN.test`, and extra examples
+saved as `NN.test_b`, `NN.test_2`, ...) hold `answer_a`/`answer_b` lines.
+Each day is run on each of its example files in a fresh worker process and
+the answers are compared with the expected ones. A part without an expected
+answer is skipped.
+
+Usage:
+    python -m utils.verify 2024
+    python -m utils.verify 2024 --days 3 16 --workers 4
+"""
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from .loader import TEST_FILE_PATTERN, load_input
+from .runner import discover_days, input_path, run_day, year_directory
+
+__all__ = ['check_answer', 'test_files', 'verify_case', 'verify_year']
+
+PARTS: List[Tuple[str, str]] = [
+    ('part_one', 'answer_a'),
+    ('part_two', 'answer_b'),
+]
+
+
+def test_files(year: int, day: int) -> List[str]:
+    """Names of the example files of a day in `YYYY/in`."""
+    directory: str = os.path.join(year_directory(year), 'in')
+    if not os.path.isdir(directory):
+        return []
+    prefix: str = f'{day:02d}.test'
+    return sorted(
+        name for name in os.listdir(directory)
+        if name.startswith(prefix) and TEST_FILE_PATTERN.search(name)
+    )
+
+
+def check_answer(answer: Any, expected: Optional[str]) -> str:
+    """'pass', 'fail' or 'skip' (no expected answer) for one part."""
+    if expected is None:
+        return 'skip'
+    return 'pass' if str(answer) == expected else 'fail'
+
+
+def verify_case(year: int, day: int, infile: str) -> Dict[str, Any]:
+    """Runs one day on one example file and checks its answers.
+
+    Args:
+        year (int): Puzzle year.
+        day (int): Puzzle day.
+        infile (str): Example file name inside `YYYY/in`.
+
+    Returns:
+        Dict[str, Any]: The `run_day` record plus `expected_one`,
+        `expected_two`, `part_one_status` and `part_two_status`. A part
+        whose run failed has status 'error'.
+    """
+    with load_input(input_path(year, day, infile)) as puzzle:
+        expected: Dict[str, Optional[str]] = {
+            'answer_a': puzzle.answer_a,
+            'answer_b': puzzle.answer_b,
+        }
+    record: Dict[str, Any] = run_day(year, day, infile)
+    for field, answer_key in PARTS:
+        suffix: str = field.split('_')[1]
+        record[f'expected_{suffix}'] = expected[answer_key]
+        status: str = check_answer(record[field], expected[answer_key])
+        if record['status'] == 'error' and status != 'skip':
+            status = 'error'
+        record[f'{field}_status'] = status
+    return record
+
+
+def _verify_case_task(args: Tuple[int, int, str]) -> Dict[str, Any]:
+    """Pool entry point for `verify_case`."""
+    return verify_case(*args)
+
+
+def verify_year(
+    year: int,
+    days: Optional[List[int]] = None,
+    workers: Optional[int] = None
+) -> List[Dict[str, Any]]:
+    """Verifies every example file of a set of days across a process pool.
+
+    Args:
+        year (int): Puzzle year.
+        days (Optional[List[int]]): Days to check, all of them by default.
+        workers (Optional[int]): Pool size, the CPU count by default.
+
+    Returns:
+        List[Dict[str, Any]]: One `verify_case` record per example file,
+        sorted by day and file name.
+    """
+    days = days if days else discover_days(year)
+    tasks: List[Tuple[int, int, str]] = [
+        (year, day, infile) for day in days
+        for infile in test_files(year, day)
+    ]
+    if not tasks:
+        return []
+
+    records: List[Dict[str, Any]] = []
+    with multiprocessing.Pool(workers, maxtasksperchild=1) as pool:
+        for record in pool.imap_unordered(
+            _verify_case_task, tasks, chunksize=1
+        ):
+            records.append(record)
+    return sorted(records, key=lambda record: (record['day'], record['input']))
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        description='Check solutions against the answers of their examples'
+    )
+    parser.add_argument('year', type=int, help='Puzzle year')
+    parser.add_argument(
+        '--days', type=int, nargs='+', help='Days to check (default: all)'
+    )
+    parser.add_argument(
+        '--workers', type=int, help='Worker processes (default: CPU count)'
+    )
+    args: argparse.Namespace = parser.parse_args(argv)
+
+    start: float = time.perf_counter()
+    records: List[Dict[str, Any]] = verify_year(
+        args.year, args.days, args.workers
+    )
+    wall_time: float = time.perf_counter() - start
+
+    counts: Dict[str, int] = {'pass': 0, 'fail': 0, 'skip': 0, 'error': 0}
+    for record in records:
+        line: str = f"{record['day']:02d} {record['input']:12s}"
+        for field, label in (('part_one', 'p1'), ('part_two', 'p2')):
+            status: str = record[f'{field}_status']
+            counts[status] += 1
+            line += f' {label} {status:5s}'
+        line += f" {record['total_time'] * 1000:9.1f}ms"
+        for field in ('part_one', 'part_two'):
+            if record[f'{field}_status'] == 'fail':
+                suffix: str = field.split('_')[1]
+                line += (
+                    f"  {field}: got {record[field]!r},"
+                    f" expected {record[f'expected_{suffix}']!r}"
+                )
+        if record['error']:
+            line += f"  {record['error']}"
+        print(line)
+
+    print(
+        f"{len(records)} example files, {counts['pass']} passed,"
+        f" {counts['fail']} failed, {counts['error']} errors,"
+        f" {counts['skip']} skipped in {wall_time:.2f}s"
+    )
+    return 1 if counts['fail'] or counts['error'] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())